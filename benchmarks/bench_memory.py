@@ -0,0 +1,93 @@
+"""bench_memory.py
+
+Peak-memory benchmark for StatBasket.
+
+Measures, with tracemalloc, the peak memory allocated while building a
+StatBasket (not counting the input data), for the usual algorithms and
+for the low-memory algorithms chosen under a memory_budget, over a range
+of data sizes and shapes. Results are printed as bytes per input value
+and written to a JSON file.
+
+Usage:
+    python benchmarks/bench_memory.py --output memory.json
+    python benchmarks/bench_memory.py --sizes 1000 100000 --shapes floats
+"""
+# Standard Library Imports
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+# Local Imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from statbasket import StatBasket  # noqa: E402
+from bench_statbasket import SHAPES, create_dataset  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+
+
+def measure_peak(function) -> int:
+    """Return the peak bytes allocated by function()."""
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def get_benchmarks(data: tuple, data2: tuple) -> dict:
+    """Return {benchmark name: zero-argument function} for one dataset."""
+    # A budget just large enough for the low-memory algorithms
+    budget = StatBasket._estimate_memory(data, None, False, low_memory=True)
+    budget_dependent = StatBasket._estimate_memory(data, data2, True, low_memory=True)
+    return {
+        "StatBasket()": lambda: StatBasket(data),
+        "StatBasket(memory_budget)": lambda: StatBasket(data, memory_budget=budget),
+        "StatBasket(x, y, dependent)": lambda: StatBasket(data, data2, samples_dependent=True),
+        "StatBasket(x, y, dependent, memory_budget)":
+            lambda: StatBasket(data, data2, samples_dependent=True,
+                               memory_budget=budget_dependent),
+    }
+
+
+def run(sizes, shapes, verbose=True) -> dict:
+    """Run the benchmarks, return {key: {"peak", "per_value"}}."""
+    results = dict()
+    for shape in shapes:
+        for size in sizes:
+            data = create_dataset(shape, size, rand_seed=101)
+            data2 = create_dataset(shape, size, rand_seed=102)
+            for name, function in get_benchmarks(data, data2).items():
+                key = f"{name}|{shape}|{size}"
+                try:
+                    peak = measure_peak(function)
+                except (ValueError, ZeroDivisionError) as exc:
+                    if verbose:
+                        print(f"{key}: skipped ({type(exc).__name__}: {exc})")
+                    continue
+                results[key] = {"peak": peak, "per_value": peak / size}
+                if verbose:
+                    print(f"{key}: {peak:,} bytes ({peak / size:.1f} per value)")
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--shapes", nargs="+", default=SHAPES, choices=SHAPES)
+    parser.add_argument("--output", default="bench_memory.json",
+                        help="file the JSON results are written to")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    results = run(args.sizes, args.shapes, verbose=not args.quiet)
+    with open(args.output, "w") as file:
+        json.dump({"results": results}, file, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""bench_statbasket.py
+
+Benchmark suite for StatMe and StatBasket.
+
+Times every StatMe.get_* method, StatBasket construction, describe()
+and calculate_test_score() over a range of data sizes and data shapes,
+and writes the results to a JSON file. A stored result file can be
+used as a baseline, in which case any timing slower than the baseline
+by more than the tolerance is reported as a regression.
+
+Usage:
+    python benchmarks/bench_statbasket.py --output bench.json
+    python benchmarks/bench_statbasket.py --sizes 100 10000 --shapes floats
+    python benchmarks/bench_statbasket.py --compare bench.json --tolerance 0.2
+
+Sizes default to 1e2 to 1e6; pass --sizes ... 10000000 for 1e7, which
+takes several minutes per shape.
+"""
+# Standard Library Imports
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+# Local Imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from statbasket import StatBasket, StatMe as sm  # noqa: E402
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+SHAPES = ("small_ints", "floats", "duplicates", "sorted")
+
+# StatMe methods which take a second data set
+TWO_DATA_METHODS = ("get_data_diff", "get_var_pool")
+# StatMe methods which take arguments after the data set
+DATA_ARGS = {"get_percentiles": ((0.01, 0.25, 0.5, 0.75, 0.99),)}
+# StatMe methods of a score rather than a data set, and their arguments
+SCORE_ARGS = {"get_p_f": (3.0, 2, 30), "get_p_t": (2.0, 30), "get_p_z": (1.96,)}
+
+
+def create_dataset(shape: str, size: int, rand_seed: int = 101) -> tuple:
+    """Return a tuple of size values with the given shape."""
+    from random import Random
+    rng = Random(rand_seed)
+    if shape == "small_ints":
+        return tuple(rng.randint(1, 255) for _ in range(size))
+    elif shape == "floats":
+        return tuple(rng.gauss(100.0, 15.0) for _ in range(size))
+    elif shape == "duplicates":
+        # heavy duplicates, only ten distinct values
+        return tuple(float(rng.randint(0, 9)) for _ in range(size))
+    elif shape == "sorted":
+        return tuple(sorted(rng.gauss(100.0, 15.0) for _ in range(size)))
+    raise ValueError(f"Unknown data shape '{shape}', must be one of {SHAPES}.")
+
+
+def get_statme_methods() -> list:
+    """Return the names of all public StatMe.get_* methods."""
+    return sorted(name for name in dir(sm) if name.startswith("get_"))
+
+
+def takes_data_only(method) -> bool:
+    """Return whether method can be called with a data set alone."""
+    from inspect import Parameter, signature
+    required = [parameter for parameter in signature(method).parameters.values()
+                if parameter.default is Parameter.empty
+                and parameter.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)]
+    return len(required) <= 1
+
+
+def time_call(function, repeat: int) -> float:
+    """Return the best wall time (seconds) of repeat calls to function."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def get_benchmarks(data: tuple, data2: tuple) -> dict:
+    """Return {benchmark name: zero-argument function} for one dataset."""
+    benchmarks = dict()
+    for name in get_statme_methods():
+        method = getattr(sm, name)
+        if name in TWO_DATA_METHODS:
+            benchmarks[f"StatMe.{name}"] = lambda method=method: method(data, data2)
+        elif name in DATA_ARGS:
+            benchmarks[f"StatMe.{name}"] = \
+                lambda method=method, args=DATA_ARGS[name]: method(data, *args)
+        elif name in SCORE_ARGS:
+            benchmarks[f"StatMe.{name}"] = \
+                lambda method=method, args=SCORE_ARGS[name]: method(*args)
+        elif takes_data_only(method):
+            benchmarks[f"StatMe.{name}"] = lambda method=method: method(data)
+        else:
+            # needs arguments not listed above, reported as skipped
+            benchmarks[f"StatMe.{name}"] = None
+    basket = StatBasket(data)
+    benchmarks["StatBasket()"] = lambda: StatBasket(data)
+    benchmarks["StatBasket(x, y)"] = lambda: StatBasket(data, data2)
+    benchmarks["StatBasket(x, y, dependent)"] = \
+        lambda: StatBasket(data, data2, samples_dependent=True)
+    benchmarks["StatBasket.describe"] = lambda: basket.describe()
+    benchmarks["StatBasket.calculate_test_score"] = lambda: basket.calculate_test_score()
+    return benchmarks
+
+
+def run(sizes, shapes, repeat: int, verbose=True) -> dict:
+    """Run the benchmarks, return the results as a dict."""
+    results = dict()
+    for shape in shapes:
+        for size in sizes:
+            data = create_dataset(shape, size, rand_seed=101)
+            data2 = create_dataset(shape, size, rand_seed=102)
+            # fewer repeats for big data, the timings are already stable
+            size_repeat = max(1, repeat if size <= 100000 else 1)
+            for name, function in get_benchmarks(data, data2).items():
+                key = f"{name}|{shape}|{size}"
+                if function is None:
+                    results[key] = None
+                    if verbose:
+                        print(f"{key}: skipped (no arguments given for it)")
+                    continue
+                try:
+                    results[key] = time_call(function, size_repeat)
+                except (ValueError, ZeroDivisionError) as exc:
+                    results[key] = None
+                    if verbose:
+                        print(f"{key}: skipped ({type(exc).__name__}: {exc})")
+                    continue
+                if verbose:
+                    print(f"{key}: {results[key]:.6f}s")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Return (key, baseline time, current time) for every regression.
+
+    A benchmark regresses if it is slower than the baseline by more than
+    tolerance (a fraction, 0.2 = 20%). Timings below 1 ms are ignored as
+    too noisy to compare."""
+    regressions = list()
+    for key, current_time in current["results"].items():
+        baseline_time = baseline["results"].get(key)
+        if current_time is None or baseline_time is None:
+            continue
+        if max(current_time, baseline_time) < 0.001:
+            continue
+        if current_time > baseline_time * (1 + tolerance):
+            regressions.append((key, baseline_time, current_time))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--shapes", nargs="+", default=SHAPES, choices=SHAPES)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="repeats per benchmark, the best time is kept")
+    parser.add_argument("--output", default="bench_output.json",
+                        help="file the JSON results are written to")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline, default 0.25")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    current = run(args.sizes, args.shapes, args.repeat, verbose=not args.quiet)
+    with open(args.output, "w") as file:
+        json.dump(current, file, indent=2, sort_keys=True)
+    if args.compare is None:
+        return 0
+    with open(args.compare) as file:
+        baseline = json.load(file)
+    regressions = compare(current, baseline, args.tolerance)
+    for key, baseline_time, current_time in regressions:
+        print(f"REGRESSION {key}: {baseline_time:.6f}s -> {current_time:.6f}s "
+              f"({current_time / baseline_time - 1:+.0%})")
+    if len(regressions) == 0:
+        print(f"No regressions against {args.compare}.")
+    return 1 if len(regressions) != 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
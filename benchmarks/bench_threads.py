@@ -0,0 +1,108 @@
+"""bench_threads.py
+
+Thread scaling benchmark for the chunked StatMe methods.
+
+Times get_var, get_skew, get_mode, get_data_diff and StatBasket with
+threads=1, 2, 4, ... up to the number of cores, and reports the speedup
+of each over threads=1. Chunks only run in parallel on free-threaded
+builds of CPython with the GIL disabled (e.g. python3.13t); elsewhere
+every thread count runs serially, and the speedups stay near 1. Results
+are written to a JSON file.
+
+Usage:
+    python3.13t benchmarks/bench_threads.py --output threads.json
+    python3.13t benchmarks/bench_threads.py --sizes 1000000 --threads 1 2 4 8 16
+"""
+# Standard Library Imports
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+# Local Imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from statbasket import StatBasket, StatMe as sm  # noqa: E402
+from bench_statbasket import SHAPES, create_dataset, time_call  # noqa: E402
+
+DEFAULT_SIZES = (100000, 1000000)
+
+
+def get_default_threads() -> list:
+    """Return 1, 2, 4, ... up to the number of cores, and that number."""
+    cores = os.cpu_count() or 1
+    threads = [1]
+    while threads[-1] * 2 <= cores:
+        threads.append(threads[-1] * 2)
+    if threads[-1] != cores:
+        threads.append(cores)
+    return threads
+
+
+def get_benchmarks(data: tuple, data2: tuple, threads: int) -> dict:
+    """Return {benchmark name: zero-argument function} for one dataset."""
+    return {
+        "StatMe.get_var": lambda: sm.get_var(data, threads=threads),
+        "StatMe.get_skew": lambda: sm.get_skew(data, threads=threads),
+        "StatMe.get_mode": lambda: sm.get_mode(data, threads=threads),
+        "StatMe.get_data_diff": lambda: sm.get_data_diff(data, data2, threads=threads),
+        "StatBasket(x, y, dependent)":
+            lambda: StatBasket(data, data2, samples_dependent=True, threads=threads),
+    }
+
+
+def run(sizes, shapes, thread_counts, repeat: int, verbose=True) -> dict:
+    """Run the benchmarks, return {key: {"time", "speedup"}}, the
+    speedup being relative to the first thread count."""
+    results = dict()
+    for shape in shapes:
+        for size in sizes:
+            data = create_dataset(shape, size, rand_seed=101)
+            data2 = create_dataset(shape, size, rand_seed=102)
+            baselines = dict()
+            for threads in thread_counts:
+                for name, function in get_benchmarks(data, data2, threads).items():
+                    key = f"{name}|{shape}|{size}|{threads}"
+                    elapsed = time_call(function, repeat)
+                    baselines.setdefault(name, elapsed)
+                    speedup = baselines[name] / elapsed
+                    results[key] = {"time": elapsed, "speedup": speedup}
+                    if verbose:
+                        print(f"{key}: {elapsed:.6f}s ({speedup:.2f}x)")
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--shapes", nargs="+", default=("floats",), choices=SHAPES)
+    parser.add_argument("--threads", type=int, nargs="+", default=get_default_threads(),
+                        help="thread counts, the first is the baseline (default "
+                             "1, 2, 4, ... up to the number of cores)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="calls per benchmark, the best time is kept")
+    parser.add_argument("--output", default="bench_threads.json",
+                        help="file the JSON results are written to")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    gil_enabled = sm._gil_enabled()
+    if gil_enabled and not args.quiet:
+        print("The GIL is enabled: chunks run serially, expect no speedup.")
+    results = run(args.sizes, args.shapes, args.threads, args.repeat,
+                  verbose=not args.quiet)
+    meta = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "cores": os.cpu_count(),
+        "gil_enabled": gil_enabled,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(args.output, "w") as file:
+        json.dump({"meta": meta, "results": results}, file, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
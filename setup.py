@@ -22,6 +22,9 @@ setup(
       'lite',
       'pure-python'],   # Keywords that define your package best
     install_requires=['setuptools>=42'],
+    entry_points={
+        'console_scripts': ['statbasket=statbasket.statcli:main'],
+    },
 
     classifiers=[
     # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" as the current state of your package
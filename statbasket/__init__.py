@@ -1,10 +1,45 @@
 from .statbasket import StatBasket
+from .statbatch import StatBatch
+from .statcache import StatCache
+from .statcheckpoint import StatCheckpoint
+from .statcolumns import StatColumns
+from .statgroups import StatGroups
 from .statmethods import StatMe
+from .statmoments import StatCoMoments, StatMoments
+from .statmultitest import StatMultiTest
+from .statpaired import StatPaired
+from .statprofile import StatProfiler
+from .statresample import StatResample
+from .statserver import AsyncStatClient, StatClient, StatServer
+from .statsharded import StatSharded
+from .statstream import AsyncStatStream, StatStream
+from .statsummary import StatSummary
+from .statwindow import StatEWM, StatWindow
 
 __author__ = 'John Weldon'
 __license__ = "MIT"
 __all__ = [
+    "AsyncStatClient",
+    "AsyncStatStream",
     "StatBasket",
-    "StatMe"
+    "StatBatch",
+    "StatCache",
+    "StatCheckpoint",
+    "StatClient",
+    "StatCoMoments",
+    "StatColumns",
+    "StatEWM",
+    "StatGroups",
+    "StatMe",
+    "StatMoments",
+    "StatMultiTest",
+    "StatPaired",
+    "StatProfiler",
+    "StatResample",
+    "StatServer",
+    "StatSharded",
+    "StatStream",
+    "StatSummary",
+    "StatWindow"
 ]
 
@@ -0,0 +1,5 @@
+import sys
+
+from statbasket.statcli import main
+
+sys.exit(main())
@@ -11,9 +11,15 @@ Classes:
 """
 # Standard Library Imports
 import sys
+from struct import Struct
 
 # Local Imports
+from statbasket.statcache import StatCache
 from statbasket.statmethods import StatMe as sm
+from statbasket.statmoments import StatMoments
+from statbasket.statprofile import StatProfiler
+from statbasket.statresample import StatResample as sr
+from statbasket.statsummary import StatSummary
 
 
 class StatBasket:
@@ -59,6 +65,58 @@ class StatBasket:
         Name given to the data set, appears on the describe() method.
     second_data_name : str, optional
         Name given to the data set, appears when using describe() method.
+    ci_method : str, optional
+        Default "parametric", how the confidence interval of the mean is
+        calculated: "parametric" (mean \u00B1 critical score * sterr) or
+        "bootstrap" (percentile bootstrap, see StatResample). A bootstrap
+        interval need not be symmetric about the mean, so moe is nan.
+    seed : int, optional
+        Seed for the bootstrap resamples, for reproducible intervals.
+    profiler : StatProfiler, optional
+        Default None, profiler which records the time, number of data
+        passes and number of sorts spent on each statistic.
+    memory_budget : int, optional
+        Default None, limit in bytes on the memory the basket allocates
+        while calculating its statistics (not counting the data itself).
+        If the usual algorithms could exceed it, the basket sorts each
+        data set once and reads min, max, median, quartiles and mode
+        from that single sorted copy, and takes the moments in streaming
+        passes (low_memory=True). Raises ValueError if even that could
+        exceed the budget.
+    retain_data : bool, optional
+        Default True. If False, the data is released once the statistics
+        are calculated: data, data_x, data_y and data_diff are set to
+        None, and the statistics of each data set are kept in a compact
+        StatSummary (summary, summary_x, summary_y, summary_diff).
+        Attributes, describe() and calculate_test_score() still work,
+        but update() and remove() do not.
+    cache : StatCache, optional
+        Default None, on-disk cache of computed statistics. If the same
+        data and options were calculated before, the statistics are read
+        from the cache instead (the data is still validated). Baskets
+        with ci_method="bootstrap" and no seed are not cached.
+    threads : int, optional
+        Default None, number of threads computing the variance, skew,
+        mode and differences in chunks (see StatMe). Only used on
+        free-threaded builds of CPython running without the GIL; the
+        basket is calculated serially otherwise.
+    n_resamples : int, optional
+        Default 2000, number of bootstrap resamples, when
+        ci_method="bootstrap".
+    processes : int, optional
+        Default None, number of worker processes drawing the bootstrap
+        resamples (see StatResample); None draws them serially.
+
+    Baskets can be serialized from their statistics alone: to_bytes()
+    packs them into a fixed binary layout (180 bytes per data set plus
+    the names), and from_bytes() gives back a basket as with
+    retain_data=False. Pickling a basket built with retain_data=False
+    sends those bytes; any other basket, including one built with the
+    default retain_data=True, is pickled (and copied) with all of its
+    data, so it can still be updated. To send a large basket to or from
+    worker processes (e.g. a multiprocessing or concurrent.futures
+    pool) cheaply, build it with retain_data=False, or send
+    basket.to_bytes() and rebuild it with StatBasket.from_bytes().
 
     Attributes:
     __________
@@ -132,10 +190,21 @@ class StatBasket:
 
     Methods:
     _____________
+    update
+        Add values to the data, updating the statistics incrementally
+    remove
+        Retract values from the data, updating the statistics incrementally
     calculate_test_score
         Return the hypothesis test score for the dataset(s)
+    get_percentiles
+        Return the values at any set of quantiles of a data set
+    to_bytes, from_bytes
+        Pack the statistics of the basket into bytes, and back
     describe
-        Creates a printout of statistics describing the data
+        Creates a printout of statistics describing the data, or returns
+        them as a dict, JSON, or rows
+    describe_many
+        Describe many baskets at once
     """
 
     def __init__(self, first_data_set: tuple or list,
@@ -146,7 +215,16 @@ class StatBasket:
                  cl=0.95,
                  tail="two",
                  first_data_name: str = None,
-                 second_data_name: str = None):
+                 second_data_name: str = None,
+                 ci_method: str = "parametric",
+                 seed: int = None,
+                 profiler: StatProfiler = None,
+                 memory_budget: int = None,
+                 retain_data=True,
+                 cache: StatCache = None,
+                 threads: int = None,
+                 n_resamples: int = 2000,
+                 processes: int = None):
         """
         Parameters
         __________
@@ -175,6 +253,31 @@ class StatBasket:
         *second_data_name: str, optional*
             Default "data", name given to the second data set, appears
             when the describe() method is called.
+        *ci_method: str, optional*
+            Default "parametric", either "parametric" (t/z interval) or
+            "bootstrap" (percentile bootstrap interval of the mean).
+        *seed: int, optional*
+            Seed for the bootstrap resamples, when ci_method="bootstrap".
+        *profiler: StatProfiler, optional*
+            Default None, if given, records the time, data passes and
+            sorts spent on each calculated attribute.
+        *memory_budget: int, optional*
+            Default None, limit in bytes on the extra memory used while
+            calculating the statistics. See the class docstring.
+        *retain_data: bool, optional*
+            Default True, if False keeps only StatSummary objects of the
+            statistics, not the data. See the class docstring.
+        *cache: StatCache, optional*
+            Default None, cache to read the statistics from, or store
+            them in. See the class docstring.
+        *threads: int, optional*
+            Default None, threads computing the per-value loops, without
+            the GIL only. See the class docstring.
+        *n_resamples: int, optional*
+            Default 2000, bootstrap resamples, when ci_method="bootstrap".
+        *processes: int, optional*
+            Default None, worker processes drawing the bootstrap
+            resamples, when ci_method="bootstrap".
         """
 
         # Data Validation and Primary Attributes ######################
@@ -211,6 +314,29 @@ class StatBasket:
                 raise ValueError(f"Confidence level (cl={str(cl)}) is not 0.90, 0.95, or 0.99.")
             if tail not in ("two", "left", "right"):
                 raise ValueError(f"Tail attribute value (tail={str(tail)}) is not 'two', 'left', or 'right'.")
+            if profiler is not None and not isinstance(profiler, StatProfiler):
+                raise ValueError(f"profiler is of type '{type(profiler).__name__}', "
+                                 f"must be of type 'StatProfiler'.")
+            if memory_budget is not None and (
+                    not isinstance(memory_budget, int) or isinstance(memory_budget, bool)
+                    or memory_budget <= 0):
+                raise ValueError(f"memory_budget ({str(memory_budget)}) must be a positive int.")
+            if cache is not None and not isinstance(cache, StatCache):
+                raise ValueError(f"cache is of type '{type(cache).__name__}', "
+                                 f"must be of type 'StatCache'.")
+            if threads is not None and (
+                    not isinstance(threads, int) or isinstance(threads, bool) or threads < 1):
+                raise ValueError(f"threads ({str(threads)}) must be a positive int.")
+            if not isinstance(retain_data, bool):
+                raise ValueError(
+                    f"retain_data is of type '{type(retain_data).__name__}', must be of type 'bool'.")
+            if ci_method not in ("parametric", "bootstrap"):
+                raise ValueError(f"ci_method ({str(ci_method)}) is not 'parametric' or 'bootstrap'.")
+            if not isinstance(n_resamples, int) or isinstance(n_resamples, bool) or n_resamples < 1:
+                raise ValueError(f"n_resamples ({str(n_resamples)}) must be a positive int.")
+            if processes is not None and (
+                    not isinstance(processes, int) or isinstance(processes, bool) or processes < 1):
+                raise ValueError(f"processes ({str(processes)}) must be a positive int.")
             wrong_name = str()
             if type(first_data_name) not in (type(str()), type(None)):
                 wrong_name = first_data_name
@@ -265,6 +391,23 @@ class StatBasket:
                 else:
                     self.data_y_name = second_data_name
 
+        # Cached Attributes ###########################################
+
+        cache_key = None
+        if cache is not None and (ci_method == "parametric" or seed is not None):
+            cache_key = cache.get_key(
+                first_data_set, second_data_set, is_population=is_population,
+                samples_dependent=samples_dependent, cl=cl, tail=tail,
+                remove_outliers=remove_outliers, ci_method=ci_method, seed=seed,
+                n_resamples=n_resamples, first_data_name=first_data_name,
+                second_data_name=second_data_name)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self._load_cached(cached, first_data_set, second_data_set,
+                                  seed, profiler, memory_budget, retain_data, threads,
+                                  n_resamples, processes)
+                return
+
         # Primary Attributes ##########################################
 
         if remove_outliers:
@@ -273,7 +416,7 @@ class StatBasket:
         # Only one data set, standard names (no _x, _y, etc)
         if samples_dependent:
             # If dependent, _diff stats are of the difference of datasets
-            self.data_diff = sm.get_data_diff(first_data_set, second_data_set)
+            self.data_diff = sm.get_data_diff(first_data_set, second_data_set, threads=threads)
             self.samples_dependent = True
         if self.data_y_empty:
             self.data = first_data_set
@@ -284,44 +427,103 @@ class StatBasket:
         self.samples_dependent = samples_dependent
         self.cl = cl
         self.tail = tail
+        self.ci_method = ci_method
+        self.seed = seed
+        self.n_resamples = n_resamples
+        self.processes = processes
+        self.remove_outliers = remove_outliers
+        self.profiler = profiler
+        self.memory_budget = memory_budget
+        self.threads = threads
+        self.retain_data = retain_data
+        self.low_memory = False
+        if memory_budget is not None:
+            self.low_memory = self._choose_low_memory(
+                first_data_set, second_data_set, samples_dependent, memory_budget)
+        # Running moments per suffix, created by the first update/remove
+        self._moments = None
+        # Attributes invalidated by update/remove, recomputed when read
+        self._stale = set()
 
         # Calculated Attributes #######################################
 
         def get_calculated_attributes(self, suffix=str()) -> None:
-            """Execute calculated attributes declarations with suffix.
+            """Set the calculated attributes of the data with suffix.
 
             suffix : str, optional
                 Default '', determines the suffix of each attribute
 
             #>>> get_calculated_attributes(suffix='x')
 
-            Output: exec(self.n_x = sm.get_n(self.data_x))"""
+            Output: self.n_x = sm.get_n(self.data_x), etc."""
 
             if suffix is not str():
                 suffix = "_" + suffix
-            exec(f"""self.ci{suffix} = sm.get_ci(self.data{suffix},
-            cl=self.cl, is_population=self.is_population, tail=self.tail)""")
-            exec(f"""self.cv{suffix} = sm.get_cv(self.data{suffix}, is_population=self.is_population)""")
-            exec(f"""self.df{suffix} = sm.get_df(self.data{suffix})""")
-            exec(f"""self.max{suffix} = sm.get_max(self.data{suffix})""")
-            exec(f"""self.mean{suffix} = sm.get_mean(self.data{suffix})""")
-            exec(f"""self.median{suffix} = sm.get_median(self.data{suffix})""")
-            exec(f"""self.min{suffix} = sm.get_min(self.data{suffix})""")
-            exec(f"""self.mode{suffix} = sm.get_mode(self.data{suffix})""")
-            exec(f"""self.moe{suffix} = sm.get_moe(self.data{suffix},
-            cl=self.cl, is_population=self.is_population, tail=self.tail)""")
-            exec(f"""self.n{suffix} = sm.get_n(self.data{suffix})""")
-            exec(f"""self.range{suffix} = sm.get_range(self.data{suffix})""")
-            exec(f"""type, alpha, score = sm.get_score_critical(self.data{suffix},
-            cl=self.cl, is_population=self.is_population, tail=self.tail,verbose=True)""")
-            exec(f"""self.score_critical_type{suffix} = type""")
-            exec(f"""self.alpha{suffix} = alpha""")
-            exec(f"""self.score_critical{suffix} = score """)
-            exec(f"""self.skew{suffix} = sm.get_skew(self.data{suffix}, is_population=self.is_population)""")
-            exec(f"""self.stdev{suffix} = sm.get_stdev(self.data{suffix}, is_population=self.is_population)""")
-            exec(f"""self.sterr{suffix} = sm.get_sterr(self.data{suffix}, is_population=self.is_population)""")
-            exec(f"""self.var{suffix} = sm.get_var(self.data{suffix}, is_population=self.is_population)""")
-            exec(f"""self.quartiles{suffix} = sm.get_quartile_data(self.data{suffix})""")
+            data = getattr(self, "data" + suffix)
+            pop_options = {"is_population": self.is_population, "threads": self.threads}
+            ci_options = {"cl": self.cl, "is_population": self.is_population, "tail": self.tail}
+            threaded_ci_options = dict(ci_options, threads=self.threads)
+            ci_calculation = ("ci", stat_me.get_ci, threaded_ci_options)
+            moe_calculation = ("moe", stat_me.get_moe, threaded_ci_options)
+            if self.ci_method == "bootstrap":
+                ci_calculation = ("ci", sr.get_ci_bootstrap, self._get_bootstrap_options())
+                moe_calculation = ("moe", lambda data_: float("nan"), {})
+            if self.low_memory:
+                # One sorted copy serves every order statistic
+                sorted_data = sorted(data)
+                order_calculations = (
+                    ("max", lambda data_: sorted_data[-1], {}),
+                    ("median", lambda data_: sm._get_median_sorted(sorted_data), {}),
+                    ("min", lambda data_: sorted_data[0], {}),
+                    ("mode", lambda data_: sm._get_mode_sorted(sorted_data), {}),
+                    ("range", lambda data_: float(sorted_data[-1] - sorted_data[0]), {}),
+                    ("quartiles", lambda data_: sm._get_quartile_data_sorted(sorted_data), {}),
+                )
+            else:
+                order_calculations = (
+                    ("max", stat_me.get_max, {}),
+                    ("median", stat_me.get_median, {}),
+                    ("min", stat_me.get_min, {}),
+                    ("mode", stat_me.get_mode, {"threads": self.threads}),
+                    ("range", stat_me.get_range, {}),
+                    ("quartiles", stat_me.get_quartile_data, {}),
+                )
+            order_calculations = {name: (name, method, options)
+                                  for name, method, options in order_calculations}
+            # (attribute, StatMe method, keyword arguments)
+            calculations = (
+                ci_calculation,
+                ("cv", stat_me.get_cv, pop_options),
+                ("df", stat_me.get_df, {}),
+                order_calculations["max"],
+                ("mean", stat_me.get_mean, {}),
+                order_calculations["median"],
+                order_calculations["min"],
+                order_calculations["mode"],
+                moe_calculation,
+                ("n", stat_me.get_n, {}),
+                order_calculations["range"],
+                ("score_critical", stat_me.get_score_critical, dict(ci_options, verbose=True)),
+                ("skew", stat_me.get_skew, pop_options),
+                ("stdev", stat_me.get_stdev, pop_options),
+                ("sterr", stat_me.get_sterr, pop_options),
+                ("var", stat_me.get_var, pop_options),
+                order_calculations["quartiles"],
+            )
+            for name, method, options in calculations:
+                if profiler is None:
+                    value = method(data, **options)
+                else:
+                    with profiler.measure(name + suffix):
+                        value = method(data, **options)
+                if name == "score_critical":
+                    score_type, alpha, value = value
+                    setattr(self, "score_critical_type" + suffix, score_type)
+                    setattr(self, "alpha" + suffix, alpha)
+                setattr(self, name + suffix, value)
+
+        # Profiled StatMe methods, only when a profiler is supplied
+        stat_me = sm if profiler is None else profiler.stat_me
 
         # if samples dependent, data = difference (i.e. data_x - data_y)
         if samples_dependent:
@@ -331,10 +533,528 @@ class StatBasket:
         else:
             get_calculated_attributes(self, 'x')
             get_calculated_attributes(self, 'y')
-            self.var_pool = sm.get_var_pool(self.data_x, self.data_y)
+            if profiler is None:
+                self.var_pool = sm.get_var_pool(self.data_x, self.data_y)
+            else:
+                with profiler.measure("var_pool"):
+                    self.var_pool = stat_me.get_var_pool(self.data_x, self.data_y)
+        if cache_key is not None:
+            cache.put(cache_key, self)
+        if not retain_data:
+            self._release_data()
+
+    def _get_bootstrap_options(self) -> dict:
+        """Return the keyword arguments of StatResample.get_ci_bootstrap."""
+        return {"cl": self.cl, "tail": self.tail, "n_resamples": self.n_resamples,
+                "seed": self.seed, "processes": self.processes}
+
+    # Memory Budget ###################################################
+
+    # Approximate bytes allocated per value: the usual algorithms (a
+    # counts dictionary for the mode, plus sorted copies), the low-memory
+    # algorithms (one sorted list and sort workspace), and the
+    # difference tuple (pointer and float) of dependent samples, plus a
+    # fixed overhead. Measured with benchmarks/bench_memory.py.
+    _bytes_per_value = 168
+    _bytes_per_value_low_memory = 17
+    _bytes_per_value_diff = 32
+    _bytes_fixed = 16384
+
+    @classmethod
+    def _estimate_memory(cls, first_data_set, second_data_set,
+                         samples_dependent: bool, low_memory: bool) -> int:
+        """Return the approximate peak bytes allocated by the basket."""
+        sizes = [len(first_data_set)]
+        if second_data_set is not None:
+            sizes.append(len(second_data_set))
+        per_value = cls._bytes_per_value_low_memory if low_memory else cls._bytes_per_value
+        estimate = cls._bytes_fixed + max(sizes) * per_value
+        if samples_dependent:
+            estimate += len(first_data_set) * cls._bytes_per_value_diff
+        return estimate
+
+    def _choose_low_memory(self, first_data_set, second_data_set,
+                           samples_dependent: bool, memory_budget: int) -> bool:
+        """Return whether the low-memory algorithms are needed to stay
+        within memory_budget, raising ValueError if they are not enough."""
+        if self._estimate_memory(first_data_set, second_data_set,
+                                 samples_dependent, low_memory=False) <= memory_budget:
+            return False
+        needed = self._estimate_memory(first_data_set, second_data_set,
+                                       samples_dependent, low_memory=True)
+        if needed > memory_budget:
+            raise ValueError(f"memory_budget ({memory_budget} bytes) is too small, "
+                             f"these data sets need about {needed} bytes.")
+        return True
+
+    # Summaries #######################################################
+
+    def _release_data(self) -> None:
+        """Replace the data and per-suffix statistics by StatSummary
+        objects, so the basket no longer references the data."""
+        for suffix in self._get_suffixes():
+            summary = StatSummary.from_basket(self, suffix)
+            for name in StatSummary.fields:
+                del self.__dict__[name + suffix]
+            self.__dict__["summary" + suffix] = summary
+            self.__dict__["data" + suffix] = None
+
+    def _restore_summaries(self) -> None:
+        """Replace the StatSummary objects by per-suffix statistics,
+        the inverse of _release_data (the data is set separately)."""
+        for suffix in self._get_suffixes():
+            summary = self.__dict__.pop("summary" + suffix)
+            for name in StatSummary.fields:
+                self.__dict__[name + suffix] = getattr(summary, name)
+
+    def _load_cached(self, cached: "StatBasket", first_data_set, second_data_set,
+                     seed, profiler, memory_budget, retain_data: bool,
+                     threads: int or None, n_resamples: int, processes: int or None) -> None:
+        """Take the statistics of a basket read from a StatCache."""
+        self.__dict__.update(cached.__dict__)
+        self.seed = seed
+        self.n_resamples = n_resamples
+        self.processes = processes
+        self.profiler = profiler
+        self.memory_budget = memory_budget
+        self.threads = threads
+        if not retain_data:
+            return
+        self.retain_data = True
+        self._restore_summaries()
+        if self.remove_outliers:
+            first_data_set = sm.get_outlier_data(first_data_set, remove_outliers=True)
+            second_data_set = sm.get_outlier_data(second_data_set, remove_outliers=True)
+        if self.samples_dependent:
+            self.data_diff = sm.get_data_diff(first_data_set, second_data_set, threads=threads)
+        if self.data_y_empty:
+            self.data = first_data_set
+        else:
+            self.data_x = first_data_set
+            self.data_y = second_data_set
+
+    def _get_summary_moments(self, suffix: str) -> tuple:
+        """Return (n, mean, m2) of the summary with this suffix."""
+        summary = self.__dict__["summary" + suffix]
+        return summary.n, summary.mean, summary.get_m2()
+
+    # Serialization ###################################################
+
+    # Fixed binary header of to_bytes(), little-endian: kind (index in
+    # _kinds), is_population, cl, tail (index in _tails), ci_method
+    # (index in _ci_methods), remove_outliers, var_pool (nan if none).
+    # It is followed by the data names, each a 2 byte length and UTF-8
+    # text, then by the StatSummary bytes of each suffix.
+    _header = Struct("<B?dBB?d")
+    _name_length = Struct("<H")
+    _kinds = ("single", "independent", "dependent")
+    _tails = ("two", "left", "right")
+    _ci_methods = ("parametric", "bootstrap")
+
+    def _get_kind(self) -> str:
+        if self.data_y_empty:
+            return "single"
+        return "dependent" if self.samples_dependent else "independent"
+
+    def _get_names(self) -> tuple:
+        if self._get_kind() == "independent":
+            return self.data_x_name, self.data_y_name
+        return self.data_name,
+
+    def to_bytes(self) -> bytes:
+        """Return the statistics of the basket packed into bytes.
+
+        The data itself is not included, see from_bytes()."""
+        var_pool = self.__dict__.get("var_pool", float("nan"))
+        parts = [self._header.pack(
+            self._kinds.index(self._get_kind()), self.is_population, self.cl,
+            self._tails.index(self.tail), self._ci_methods.index(self.ci_method),
+            self.remove_outliers, var_pool)]
+        for name in self._get_names():
+            encoded = name.encode("utf-8")
+            parts.append(self._name_length.pack(len(encoded)))
+            parts.append(encoded)
+        for suffix in self._get_suffixes():
+            summary = self.__dict__.get("summary" + suffix)
+            if summary is None:
+                summary = StatSummary.from_basket(self, suffix)
+            parts.append(summary.to_bytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatBasket":
+        """Return the basket packed by to_bytes().
+
+        The basket holds no data, as if built with retain_data=False."""
+        data = memoryview(data)
+        kind, is_population, cl, tail, ci_method, remove_outliers, var_pool = (
+            cls._header.unpack_from(data))
+        kind = cls._kinds[kind]
+        offset = cls._header.size
+        names = list()
+        for _ in range(2 if kind == "independent" else 1):
+            length, = cls._name_length.unpack_from(data, offset)
+            offset += cls._name_length.size
+            names.append(str(data[offset:offset + length], "utf-8"))
+            offset += length
+        summaries = list()
+        summary_size = StatSummary._struct.size
+        for _ in range({"single": 1, "independent": 2, "dependent": 3}[kind]):
+            summaries.append(StatSummary.from_bytes(data[offset:offset + summary_size]))
+            offset += summary_size
+        if offset != len(data):
+            raise ValueError(f"Expected {offset} bytes for a StatBasket, got {len(data)}.")
+        return cls._from_summaries(kind, names, summaries, is_population, cl, cls._tails[tail],
+                                   cls._ci_methods[ci_method], remove_outliers, var_pool)
+
+    @classmethod
+    def _from_summaries(cls, kind: str, names: tuple or list, summaries: tuple or list,
+                        is_population: bool, cl: float, tail: str, ci_method: str,
+                        remove_outliers: bool, var_pool: float) -> "StatBasket":
+        """Return a basket holding no data, with one StatSummary per
+        data set (in the order of _get_suffixes) and the given options."""
+        basket = cls.__new__(cls)
+        basket.data_y_empty = kind == "single"
+        basket.samples_dependent = kind == "dependent"
+        if kind == "independent":
+            basket.data_x_name, basket.data_y_name = names
+            basket.var_pool = var_pool
+        else:
+            basket.data_name = names[0]
+        basket.is_population = is_population
+        basket.cl = cl
+        basket.tail = tail
+        basket.ci_method = ci_method
+        basket.seed = None
+        basket.n_resamples = 2000
+        basket.processes = None
+        basket.remove_outliers = remove_outliers
+        basket.profiler = None
+        basket.memory_budget = None
+        basket.threads = None
+        basket.retain_data = False
+        basket.low_memory = False
+        basket._moments = None
+        basket._stale = set()
+        for suffix, summary in zip(basket._get_suffixes(), summaries):
+            basket.__dict__["data" + suffix] = None
+            basket.__dict__["summary" + suffix] = summary
+        return basket
+
+    def __reduce_ex__(self, protocol):
+        """Pickle a basket built with retain_data=False by its to_bytes(),
+        any other basket with its data, as an ordinary object."""
+        if self.retain_data:
+            return super().__reduce_ex__(protocol)
+        return type(self).from_bytes, (self.to_bytes(),)
+
+    def __getstate__(self):
+        # the profiler records calls made in this process only
+        state = self.__dict__.copy()
+        state["profiler"] = None
+        return state
+
+    def __copy__(self):
+        """Return a copy sharing the data, which update() and remove()
+        never change in place, but not the running moments."""
+        basket = type(self).__new__(type(self))
+        basket.__dict__.update(self.__dict__)
+        if self._moments is not None:
+            basket._moments = {suffix: moments.copy() for suffix, moments in self._moments.items()}
+        basket._stale = set(self._stale)
+        if "_sorted_data" in self.__dict__:
+            basket._sorted_data = dict(self._sorted_data)
+        return basket
+
+    def __deepcopy__(self, memo: dict):
+        """Return a copy of the basket and its data, sharing the profiler."""
+        from copy import deepcopy
+        basket = type(self).__new__(type(self))
+        memo[id(self)] = basket
+        if self.profiler is not None:
+            memo[id(self.profiler)] = self.profiler
+        basket.__dict__.update(deepcopy(self.__dict__, memo))
+        return basket
+
+    # Incremental Updates #############################################
+
+    # Statistics which need the full data, recomputed on next read
+    _order_stats = ("median", "quartiles", "mode", "min", "max", "range")
+
+    def _get_suffixes(self) -> tuple:
+        """Return the attribute suffixes calculated for this basket."""
+        if self.data_y_empty:
+            return str(),
+        if self.samples_dependent:
+            return "_diff", "_x", "_y"
+        return "_x", "_y"
+
+    @staticmethod
+    def _validate_values(values) -> tuple:
+        """Return values as a tuple, raising ValueError if non-numeric."""
+        if not isinstance(values, (tuple, list)):
+            raise ValueError(
+                f"Data is of type '{type(values).__name__}'. "
+                f"Acceptable types: 'tuple', 'list'")
+        bad_values = [(i, x) for i, x in enumerate(values)
+                      if not isinstance(x, (int, float))]
+        if len(bad_values) != 0:
+            raise ValueError(f"One or more values in dataset are non-numeric \n"
+                             f"(value_index, value): {tuple(bad_values)}")
+        return tuple(values)
+
+    @staticmethod
+    def _without(data: tuple or list, values: tuple) -> tuple or list:
+        """Return data with the first occurrence of each of values removed."""
+        from collections import Counter
+        pending = Counter(values)
+        kept = list()
+        for each_item in data:
+            if pending[each_item] > 0:
+                pending[each_item] -= 1
+            else:
+                kept.append(each_item)
+        missing = tuple(value for value, count in pending.items() if count > 0)
+        if len(missing) != 0:
+            raise ValueError(f"Values not found in dataset: {missing}")
+        return kept if isinstance(data, list) else tuple(kept)
+
+    def _get_moments(self, suffix: str) -> StatMoments:
+        """Return the running moments of the data with this suffix.
+
+        On first use, the moments are recovered from the calculated n,
+        mean, var, skew, min and max, so no pass over the data is made."""
+        if self._moments is None:
+            self._moments = dict()
+        if suffix not in self._moments:
+            moments = StatMoments()
+            n = getattr(self, "n" + suffix)
+            var = getattr(self, "var" + suffix)
+            moments.n = n
+            moments.mean = getattr(self, "mean" + suffix)
+            moments.m2 = var * (n if self.is_population else n - 1)
+            moments.m3 = getattr(self, "skew" + suffix) * n * var ** 1.5
+            moments.min = self.__dict__.get("min" + suffix)
+            moments.max = self.__dict__.get("max" + suffix)
+            self._moments[suffix] = moments
+        return self._moments[suffix]
+
+    def _get_refreshed_attributes(self, suffix: str, moments: StatMoments) -> tuple:
+        """Return (attributes, stale) of one suffix recalculated from
+        moments: the attributes as {name: value}, and the names of the
+        order statistics made stale. The basket is not changed."""
+        is_pop = self.is_population
+        attributes = dict()
+        attributes["n" + suffix] = moments.n
+        attributes["df" + suffix] = moments.n - 1
+        attributes["mean" + suffix] = moments.get_mean()
+        attributes["var" + suffix] = moments.get_var(is_population=is_pop)
+        attributes["stdev" + suffix] = moments.get_stdev(is_population=is_pop)
+        attributes["sterr" + suffix] = moments.get_sterr(is_population=is_pop)
+        attributes["cv" + suffix] = moments.get_cv(is_population=is_pop)
+        attributes["skew" + suffix] = moments.get_skew(is_population=is_pop)
+        score_type, alpha, score = sm._get_score_critical_n(
+            moments.n, cl=self.cl, is_population=is_pop, tail=self.tail, verbose=True)
+        attributes["score_critical_type" + suffix] = score_type
+        attributes["alpha" + suffix] = alpha
+        attributes["score_critical" + suffix] = score
+        moe = score * attributes["sterr" + suffix]
+        attributes["moe" + suffix] = moe
+        stale = list(self._order_stats)
+        if self.ci_method == "bootstrap":
+            attributes["moe" + suffix] = float("nan")
+            stale.append("ci")
+        else:
+            mean = attributes["mean" + suffix]
+            attributes["ci" + suffix] = (mean - moe, mean + moe)
+        if moments.min is not None and moments.max is not None:
+            # bounds are still known after values are only added
+            attributes["min" + suffix] = moments.min
+            attributes["max" + suffix] = moments.max
+            attributes["range" + suffix] = float(moments.max - moments.min)
+            stale = [name for name in stale if name not in ("min", "max", "range")]
+        return attributes, [name + suffix for name in stale]
+
+    def _apply_changes(self, changes: dict, adding: bool) -> None:
+        """Add (or retract) values per suffix, then refresh attributes.
+
+        changes maps each suffix to (new data, values changed). Every
+        statistic is calculated on copies of the moments before the
+        basket is changed, so if any fails the basket is left as it was."""
+        if self.remove_outliers:
+            raise ValueError("Baskets built with remove_outliers=True cannot be "
+                             "updated, since the outliers depend on all of the data.")
+        if not self.retain_data:
+            raise ValueError("Baskets built with retain_data=False cannot be "
+                             "updated, since they no longer hold the data.")
+        for suffix, (data, values) in changes.items():
+            if len(data) < 2:
+                raise ValueError(f"Data set 'data{suffix}' would be left with {len(data)} "
+                                 f"value(s), at least 2 are needed.")
+        all_moments = {suffix: self._get_moments(suffix) for suffix in self._get_suffixes()}
+        for suffix, (data, values) in changes.items():
+            moments = all_moments[suffix] = all_moments[suffix].copy()
+            if adding:
+                moments.extend(values)
+            else:
+                for each_item in values:
+                    moments.remove(each_item)
+        refreshed = {suffix: self._get_refreshed_attributes(suffix, all_moments[suffix])
+                     for suffix in changes}
+        if not self.data_y_empty:
+            moments_x, moments_y = all_moments["_x"], all_moments["_y"]
+            var_pool = (moments_x.m2 + moments_y.m2) / (moments_x.n + moments_y.n - 2)
+        # sorted copies of the old data, see get_percentiles
+        self.__dict__.pop("_sorted_data", None)
+        self._moments.update(all_moments)
+        for suffix, (data, values) in changes.items():
+            setattr(self, "data" + suffix, data)
+            attributes, stale = refreshed[suffix]
+            self.__dict__.update(attributes)
+            for name in stale:
+                self.__dict__.pop(name, None)
+                self._stale.add(name)
+        if not self.data_y_empty:
+            self.var_pool = var_pool
+
+    def _get_changes(self, values, second_values, adding: bool) -> dict:
+        """Validate update/remove arguments, return {suffix: (data, values)}."""
+        if not self.retain_data:
+            raise ValueError("Baskets built with retain_data=False cannot be "
+                             "updated, since they no longer hold the data.")
+        values = self._validate_values(values)
+        if self.data_y_empty:
+            if second_values is not None:
+                raise ValueError("second_values given, but the basket has one data set.")
+            old = self.data
+            new = old + type(old)(values) if adding else self._without(old, values)
+            return {str(): (new, values)}
+        second_values = self._validate_values(
+            tuple() if second_values is None else second_values)
+        changes = dict()
+        if self.samples_dependent:
+            if len(values) != len(second_values):
+                raise ValueError(f"'Samples dependent' is True, but samples are not the same length.\n"
+                                 f"First data set length = {len(values)}\n"
+                                 f"Second data set length = {len(second_values)}")
+            pairs = tuple(zip(values, second_values))
+            diffs = sm.get_data_diff(values, second_values)
+            if adding:
+                data_x = self.data_x + type(self.data_x)(values)
+                data_y = self.data_y + type(self.data_y)(second_values)
+                data_diff = self.data_diff + diffs
+            else:
+                kept_pairs = self._without(tuple(zip(self.data_x, self.data_y)), pairs)
+                data_x = type(self.data_x)(x for x, _ in kept_pairs)
+                data_y = type(self.data_y)(y for _, y in kept_pairs)
+                data_diff = tuple(x - y for x, y in kept_pairs)
+            changes["_diff"] = (data_diff, diffs)
+            changes["_x"] = (data_x, values)
+            changes["_y"] = (data_y, second_values)
+            return changes
+        for suffix, new_values in (("_x", values), ("_y", second_values)):
+            if len(new_values) == 0:
+                continue
+            old = getattr(self, "data" + suffix)
+            new = old + type(old)(new_values) if adding else self._without(old, new_values)
+            changes[suffix] = (new, new_values)
+        return changes
+
+    def update(self, values: tuple or list, second_values: tuple or list = None) -> None:
+        """
+        Add values to the basket, updating its statistics in place.
+
+        n, mean, var, stdev, sterr, cv, skew, the critical score, moe and
+        ci (and var_pool) are adjusted from running moments, in time
+        proportional to the number of values added. Order statistics
+        (median, quartiles, mode, and min/max after a removal) are only
+        recalculated when next read. The statistics match those of a new
+        StatBasket built on the combined data, up to rounding.
+
+        values : tuple or list
+            Values to add to the (first) data set.
+        second_values : tuple or list, optional
+            Values to add to the second data set. For dependent samples,
+            values and second_values are pairs and must be the same length.
+        """
+        self._apply_changes(self._get_changes(values, second_values, adding=True), adding=True)
+
+    def remove(self, values: tuple or list, second_values: tuple or list = None) -> None:
+        """
+        Retract values from the basket, updating its statistics in place.
+
+        The first occurrence of each value is removed (for dependent
+        samples, of each (value, second_value) pair). Raises ValueError
+        if a value is not in the data. See update() for which statistics
+        are adjusted immediately.
+        """
+        self._apply_changes(self._get_changes(values, second_values, adding=False), adding=False)
+
+    def __getattr__(self, name: str):
+        """Read a statistic from its StatSummary (see retain_data), or
+        recalculate a stale order statistic (see update) when read."""
+        if self.__dict__.get("retain_data") is False:
+            for suffix in ("_diff", "_x", "_y", str()):
+                stat = name[:len(name) - len(suffix)]
+                summary = self.__dict__.get("summary" + suffix)
+                if name.endswith(suffix) and summary is not None and stat in StatSummary.fields:
+                    return getattr(summary, stat)
+        stale = self.__dict__.get("_stale", ())
+        if name not in stale:
+            raise AttributeError(f"'StatBasket' object has no attribute '{name}'")
+        stat, _, suffix = name.partition("_")
+        suffix = "_" + suffix if suffix else str()
+        data = getattr(self, "data" + suffix)
+        if stat in ("median", "quartiles"):
+            # one sort for both statistics
+            quartiles = sm._get_quartile_data_sorted(sorted(data))
+            self.__dict__["quartiles" + suffix] = quartiles
+            self.__dict__["median" + suffix] = quartiles[1]
+            stale.discard("median" + suffix)
+            stale.discard("quartiles" + suffix)
+        elif stat == "ci":
+            self.__dict__[name] = sr.get_ci_bootstrap(data, **self._get_bootstrap_options())
+        elif stat == "range":
+            self.__dict__[name] = sm.get_range(data)
+        else:
+            self.__dict__[name] = getattr(sm, "get_" + stat)(data)
+        stale.discard(name)
+        return self.__dict__[name]
+
+    def get_percentiles(self, qs: tuple or list, method: str = "linear", suffix: str = str()) -> tuple:
+        """Return the values at each quantile of qs (fractions from 0 to
+        1) of the data set with suffix ('', '_x', '_y' or '_diff'), as
+        StatMe.get_percentiles.
+
+        The data is sorted on the first call, and the sorted copy is
+        kept for later calls until update() or remove() changes the data.
+        Raises ValueError for baskets built with retain_data=False."""
+        if suffix not in self._get_suffixes():
+            raise ValueError(f"suffix ({str(suffix)}) is not one of {self._get_suffixes()}.")
+        if not self.retain_data:
+            raise ValueError("Baskets built with retain_data=False have no percentiles, "
+                             "since they no longer hold the data.")
+        sorted_data = self.__dict__.setdefault("_sorted_data", dict())
+        if suffix not in sorted_data:
+            sorted_data[suffix] = sorted(getattr(self, "data" + suffix))
+        return sm.get_percentiles(sorted_data[suffix], qs, method=method, is_sorted=True)
 
     def calculate_test_score(self, h0: float = 0.0, verbose=False):
         """Return the hypothesis test score for the dataset(s)"""
+        if not self.retain_data:
+            # Same tests as below, from the summaries' moments
+            if self.samples_dependent:
+                moments1, moments2 = self._get_summary_moments("_diff"), (0, 0.0, 0.0)
+            elif self.data_y_empty:
+                moments1, moments2 = self._get_summary_moments(str()), (0, 0.0, 0.0)
+            else:
+                moments1 = self._get_summary_moments("_x")
+                moments2 = self._get_summary_moments("_y")
+            return sm._get_score_hyp_moments(
+                moments1, moments2, h0=h0,
+                samples_dependent=self.samples_dependent,
+                is_population=self.is_population,
+                verbose=verbose)
         test_data = tuple()
         test_data2 = None
         if self.samples_dependent:
@@ -350,17 +1070,27 @@ class StatBasket:
             is_population=self.is_population,
             verbose=verbose)
 
-    def describe(self, round_places=3, h0=None):
-        """
-        Return a string table containing statistics about the supplied data
+    # Description #####################################################
 
-        Data is rounded to round_places number of decimal places
+    _describe_formats = ("table", "dict", "json", "rows")
 
-        If h0 is supplied, returns hypothesis test data as well
+    def _get_describe_suffixes(self) -> tuple:
+        """Return the suffixes shown by describe(), one per column."""
+        if self.samples_dependent:
+            return "_diff",
+        if self.data_y_empty:
+            return str(),
+        return "_x", "_y"
+
+    def _get_description(self, h0: float = None) -> tuple:
         """
+        Return (title, sections) of the description, unformatted
 
+        sections is a list of (section, rows), each row being (label,
+        statistic, values) with one raw value per data set shown, or a
+        single value for the hypothesis test rows.
+        """
         # Initializes the title of the return table
-        title = str()
         if self.samples_dependent:
             title = "DATA DIFFERENCE"
         elif self.data_y_empty:
@@ -370,142 +1100,151 @@ class StatBasket:
         title = f"DESCRIPTION OF {title}"
 
         # Set whether data is pop or sample data, names used for labels
-        n_type = str()
-        n_letter = str()
         if self.is_population:
-            n_type = "Population"
-            n_letter = "N"
+            n_type, n_letter = "Population", "N"
         else:
-            n_type = "Sample"
-            n_letter = "n"
-
-        print_sections = [
-            f"General {n_type} Statistics",
-            f"Measures of Central Tendency",
-            f"Measures of Variation",
-            f"Confidence Interval Statistics"
+            n_type, n_letter = "Sample", "n"
+        if self.ci_method == "bootstrap":
+            ci_label = 'CI (bootstrap)'
+        else:
+            ci_label = 'CI (mean - moe, mean + moe)'
+
+        suffixes = self._get_describe_suffixes()
+
+        def row(label: str, stat: str) -> tuple:
+            return label, stat, tuple(getattr(self, stat + suffix) for suffix in suffixes)
+
+        score_type_label = getattr(self, "score_critical_type" + suffixes[0])
+        sections = [
+            (f"General {n_type} Statistics", (
+                row(f"Size of {n_type} ({n_letter})", "n"),
+                row("Minimum Value (min)", "min"),
+                row("Maximum Value (max)", "max"))),
+            ("Measures of Central Tendency", (
+                row("Mean (mean)", "mean"),
+                row("Median (median)", "median"),
+                row("Mode (mode)", "mode"),
+                row("Range (range)", "range"),
+                row("Skewness (skew)", "skew"))),
+            ("Measures of Variation", (
+                row("Variance (var)", "var"),
+                row("Standard Deviation (stdev)", "stdev"),
+                row("Standard Error (sterr)", "sterr"),
+                row("Coeff. of Variation (cov)", "cv"))),
+            ("Confidence Interval Statistics", (
+                ("Confidence Level (cl)", "cl", (self.cl,) * len(suffixes)),
+                row(f"alpha, {self.tail}-tailed", "alpha"),
+                row(f"{score_type_label}-score (score_critical)", "score_critical"),
+                row("Margin of Error (moe)", "moe"),
+                row(ci_label, "ci"))),
         ]
+
         if h0 is not None:
-            print_sections.append(f"Hypothesis Test Results")
-
-        def create_data_dict(print_sections: list,
-                             round_places: int,
-                             n_type: str,
-                             n_letter: str,
-                             h0: float = None,
-                             data_suffix: str = str()) -> dict:
-            """
-            Return a dictionary containing section data
-
-            If two independent datasets, returns two values for
-            every subkey (data_x and data_y)
-            """
-            def create_single_dict(print_sections: list,
-                             round_places: int,
-                             n_type: str,
-                             n_letter: str,
-                             h0: float = None,
-                             data_suffix: str = str()) -> dict:
-                # Key = section: (Subkey = stat name, Value: stat value)
-                return_data_dict = dict()
-
-                # Sets the values to their appropriate attributes based on type of data:
-                # data, data_x, data_y, or data_diff
-                if data_suffix is not str():
-                    data_suffix = "_" + data_suffix
-
-                exec(f"""return_data_dict['General {n_type} Statistics'] = (
-                    ('Size of {n_type} ({n_letter})', "{{:,}}".format(round(self.n{data_suffix}, round_places))),
-                    ('Minimum Value (min)', "{{:,}}".format(round(self.min{data_suffix}, round_places))),
-                    ('Maximum Value (max)', "{{:,}}".format(round(self.max{data_suffix}, round_places))))""")
-
-                exec(f"""return_data_dict['Measures of Central Tendency'] = (
-                    ('Mean (mean)', "{{:,}}".format(round(self.mean{data_suffix}, round_places))),
-                    ('Median (median)', "{{:,}}".format(round(self.median{data_suffix}, round_places))),
-                    ('Mode (mode)', self.mode{data_suffix} if isinstance(self.mode{data_suffix}, str) else "{{:,}}".format(round(self.mode{data_suffix}, round_places))),
-                    ('Range (range)', "{{:,}}".format(round(self.range{data_suffix}, round_places))),
-                    ('Skewness (skew)', "{{:,}}".format(round(self.skew{data_suffix}, round_places))))""")
-
-                exec(f"""return_data_dict['Measures of Variation'] = (
-                    ('Variance (var)', "{{:,}}".format(round(self.var{data_suffix}, round_places))),
-                    ('Standard Deviation (stdev)', "{{:,}}".format(round(self.stdev{data_suffix}, round_places))),
-                    ('Standard Error (sterr)', "{{:,}}".format(round(self.sterr{data_suffix}, round_places))),
-                    ('Coeff. of Variation (cov)', "{{:,}}".format(round(self.cv{data_suffix}, round_places))))""")
-
-                exec(f"""return_data_dict['Confidence Interval Statistics'] = (
-                    ('Confidence Level (cl)', '{{:,}}'.format(round(self.cl, round_places))),
-                    (f'alpha, {self.tail}-tailed', '{{:,}}'.format(round(self.alpha{data_suffix}, round_places))),
-                    (f'{{self.score_critical_type{data_suffix}}}-score (score_critical)', '{{:,}}'.format(round(self.score_critical{data_suffix}, round_places))),
-                    (f'Margin of Error (moe)', '{{:,}}'.format(round(self.moe{data_suffix}, round_places))),
-                    (f'CI (mean - moe, mean + moe)',
-                     '[{{:,}}'.format(round(self.ci{data_suffix}[0], round_places)) + ', ' + '{{:,}}]'.format(round(self.ci{data_suffix}[1], round_places))))""")
-
-                if h0 is not None:
-                    # Get appropriate operators, based on h0 and tail of test
-                    h0_op = '='
-                    h1_op = '\u2260'
-                    if self.tail == 'left':
-                        h0_op = '\u2265'
-                        h1_op = '<'
-                    elif self.tail == 'right':
-                        h0_op = '\u2265'
-                        h1_op = '>'
-
-                    mu_type = (f"\N{GREEK SMALL LETTER MU}x "
-                               f"- \N{GREEK SMALL LETTER MU}y")
-                    if self.data_y_empty:
-                        mu_type = f"\N{GREEK SMALL LETTER MU}"
-
-                    exec(f"""score, score_type, test_type = """
-                         + f"""self.calculate_test_score(h0=h0, verbose=True)""")
-                    exec(f"""return_data_dict['Hypothesis Test Results'] = (
-                        ('Test Type', test_type),
-                        ('Null Hypothesis', 'h0: {mu_type} {h0_op} {h0}'),
-                        ('Alternative Hypothesis', 'h1: {mu_type} {h1_op} {h0}'),
-                        (f'Score Type', score_type),
-                        (f'Score', '{{:.3f}}'.format(score)))""")
-                return return_data_dict
-
-            # Return different dict depending on type of data provided
-            data_dict = dict()
-            data_dict_x = dict()
-            data_dict_y = dict()
+            # Get appropriate operators, based on h0 and tail of test
+            h0_op = '='
+            h1_op = '\u2260'
+            if self.tail == 'left':
+                h0_op = '\u2265'
+                h1_op = '<'
+            elif self.tail == 'right':
+                h0_op = '\u2265'
+                h1_op = '>'
+
+            mu_type = (f"\N{GREEK SMALL LETTER MU}x "
+                       f"- \N{GREEK SMALL LETTER MU}y")
             if self.data_y_empty:
-                data_dict = create_single_dict(
-                    print_sections, round_places, n_type, n_letter, h0
-                )
-            elif self.samples_dependent:
-                data_dict = create_single_dict(
-                    print_sections, round_places, n_type, n_letter, h0, data_suffix="diff"
-                )
-            else:
-                data_dict_x = create_single_dict(
-                    print_sections, round_places, n_type, n_letter, h0, data_suffix="x"
-                )
-                data_dict_y = create_single_dict(
-                    print_sections, round_places, n_type, n_letter, h0, data_suffix="y"
-                )
+                mu_type = f"\N{GREEK SMALL LETTER MU}"
+
+            score, score_type, test_type = self.calculate_test_score(h0=h0, verbose=True)
+            sections.append(("Hypothesis Test Results", (
+                ("Test Type", "test_type", (test_type,)),
+                ("Null Hypothesis", "null_hypothesis", (f"h0: {mu_type} {h0_op} {h0}",)),
+                ("Alternative Hypothesis", "alternative_hypothesis", (f"h1: {mu_type} {h1_op} {h0}",)),
+                ("Score Type", "score_type", (score_type,)),
+                ("Score", "score", (score,)))))
+        return title, sections
+
+    def _get_describe_names(self) -> tuple:
+        """Return the data set names, one per describe() column."""
+        if self.data_y_empty or self.samples_dependent:
+            return self.data_name,
+        return self.data_x_name, self.data_y_name
+
+    def describe(self, round_places=3, h0=None, format="table"):
+        """
+        Return a string table containing statistics about the supplied data
+
+        Data is rounded to round_places number of decimal places
 
-                # Combine the two dictionaries into one
-                for section in print_sections:
-                    temp_list = list()
-                    # Iterate over each stat per section
-                    for i in range(len(data_dict_x[section])):
-                        stat_name = data_dict_x[section][i][0]
-                        x_value = data_dict_x[section][i][1]
-                        y_value = data_dict_y[section][i][1]
-                        temp_list.append((stat_name, x_value, y_value))
-                    data_dict[section] = tuple(temp_list)
-            return data_dict
-
-        data_dict = create_data_dict(print_sections, round_places, n_type, n_letter, h0)
+        If h0 is supplied, returns hypothesis test data as well
+
+        format selects the output. "table" (default) is the string
+        table. The others hold the raw, unrounded values: "dict" is
+        {data name: {statistic: value}}, with a "hypothesis_test" entry
+        if h0 is supplied; "json" is that dict as a JSON string, with
+        nan (e.g. moe with ci_method="bootstrap") as null; "rows"
+        is a list of (section, label, value) tuples in the order of the
+        table, with a value per data set for two independent data sets.
+        """
+        if format not in self._describe_formats:
+            raise ValueError(f"format ({str(format)}) is not one of {self._describe_formats}.")
+        title, sections = self._get_description(h0)
+
+        if format == "rows":
+            return [(section, label) + values
+                    for section, rows in sections for label, _, values in rows]
+        if format in ("dict", "json"):
+            names = self._get_describe_names()
+            description = {name: dict() for name in names}
+            for section, rows in sections:
+                for _, stat, values in rows:
+                    if section == "Hypothesis Test Results":
+                        description.setdefault("hypothesis_test", dict())[stat] = values[0]
+                    else:
+                        for name, value in zip(names, values):
+                            description[name][stat] = value
+            # only part of a label in the table
+            for name, suffix in zip(names, self._get_describe_suffixes()):
+                description[name]["score_critical_type"] = getattr(self, "score_critical_type" + suffix)
+            if format == "json":
+                return self._dumps_json(description)
+            return description
+
+        def format_value(stat: str, value) -> str:
+            if isinstance(value, str):
+                return value
+            if value is None:
+                # e.g. the order statistics of a basket built from moments
+                return "n/a"
+            if stat == "score":
+                return '{:.3f}'.format(value)
+            if stat == "ci":
+                return ('[{:,}'.format(round(value[0], round_places)) + ', '
+                        + '{:,}]'.format(round(value[1], round_places)))
+            return "{:,}".format(round(value, round_places))
+
+        # Key = section: (Subkey = stat name, Value: stat value(s))
+        is_two_ind = len(self._get_describe_suffixes()) == 2
+        data_dict = dict()
+        for section, rows in sections:
+            formatted_rows = list()
+            for label, stat, values in rows:
+                formatted = tuple(format_value(stat, value) for value in values)
+                if is_two_ind and len(formatted) == 1:
+                    # hypothesis test, a single value spanning both columns
+                    formatted *= 2
+                formatted_rows.append((label,) + formatted)
+            data_dict[section] = tuple(formatted_rows)
+        return self._render_table(title, [section for section, _ in sections],
+                                  data_dict, is_two_ind)
+
+    @staticmethod
+    def _render_table(title: str, print_sections: list, data_dict: dict,
+                      is_two_ind: bool) -> str:
+        """Return the string table of formatted section rows."""
         # Check, if two independent samples, pop var unknown
         stat_divider = "  "
-        sample_divider = "  "
-        is_two_ind = True
-        if self.samples_dependent or self.data_y_empty:
-            is_two_ind = False
-            sample_divider = ''
+        sample_divider = "  " if is_two_ind else ''
 
         def get_column_widths():
             """Return tuple of l_width, r_width, r_width_mult, and total_width"""
@@ -566,6 +1305,40 @@ class StatBasket:
                 + bottom
         )
 
+    @classmethod
+    def _dumps_json(cls, value) -> str:
+        """Return value as strict JSON: nan and infinite floats (e.g. the
+        moe of a bootstrap basket) become null, as JSON has no NaN."""
+        import json
+        from math import isfinite
+
+        def finite(value_):
+            if isinstance(value_, float):
+                return value_ if isfinite(value_) else None
+            if isinstance(value_, dict):
+                return {key: finite(each_value) for key, each_value in value_.items()}
+            if isinstance(value_, (tuple, list)):
+                return [finite(each_item) for each_item in value_]
+            return value_
+
+        return json.dumps(finite(value), allow_nan=False)
+
+    @classmethod
+    def describe_many(cls, baskets, round_places=3, h0=None, format="table"):
+        """
+        Return the description of each basket, as describe()
+
+        For format="json", returns one JSON array of the descriptions,
+        serialized in a single call, rather than a list of strings.
+        """
+        if format not in cls._describe_formats:
+            raise ValueError(f"format ({str(format)}) is not one of {cls._describe_formats}.")
+        if format == "json":
+            return cls._dumps_json([basket.describe(round_places=round_places, h0=h0, format="dict")
+                                    for basket in baskets])
+        return [basket.describe(round_places=round_places, h0=h0, format=format)
+                for basket in baskets]
+
     def __repr__(self):
         return f"a StatBasket object, whose description is below.\n{self.describe()}"
 
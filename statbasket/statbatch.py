@@ -0,0 +1,152 @@
+"""statbatch.py
+
+Contains the class StatBatch, a collection of methods which build the
+StatBasket (or its description) of many data sets, optionally across a
+pool of worker processes.
+
+Data sets are sent to the workers in chunks, with a bounded number of
+chunks in flight, and results are yielded in input order as they
+complete, so memory stays bounded however many data sets are given."""
+
+# Standard System Imports
+from collections import deque
+from itertools import islice
+
+# Local Imports
+from statbasket.statbasket import StatBasket
+
+
+def _basket_chunk(task: tuple) -> list:
+    """Return the basket, or its description, of each data set in a chunk.
+
+    task = (items, basket_options, describe_options, packed), where items
+    is a list of (name, data), describe_options is None for baskets, and
+    packed is whether baskets are returned as their to_bytes()."""
+    items, basket_options, describe_options, packed = task
+    results = list()
+    for name, data in items:
+        basket = StatBasket(data, first_data_name=name, **basket_options)
+        if describe_options is None:
+            results.append(basket.to_bytes() if packed else basket)
+        else:
+            results.append(basket.describe(**describe_options))
+    return results
+
+
+class StatBatch:
+    """
+    A class of class methods used to build many baskets at once.
+
+    Example Usage:
+        >>> from statbasket import StatBatch
+        >>> datasets = [("a", (1, 2, 3)), ("b", (4, 5, 6, 7))]
+        >>> for table in StatBatch.describe(datasets, processes=4):
+        ...     print(table)
+    Methods::
+        get_baskets:
+            Yield the StatBasket of each data set, in order
+
+        describe:
+            Yield the describe() output of each data set, in order
+    """
+
+    @staticmethod
+    def _iter_chunks(datasets, chunk_size: int):
+        """Yield lists of up to chunk_size (name, data) pairs.
+
+        Each item of datasets is either a data set, named None (i.e. the
+        default name), or a (name, data) pair with a str name."""
+        items = iter(datasets)
+        while True:
+            chunk = list()
+            for item in islice(items, chunk_size):
+                if (isinstance(item, tuple) and len(item) == 2
+                        and isinstance(item[0], str)):
+                    chunk.append(item)
+                else:
+                    chunk.append((None, item))
+            if len(chunk) == 0:
+                return
+            yield chunk
+
+    @staticmethod
+    def _validate_batch(chunk_size: int, max_pending: int or None) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size ({chunk_size}) must be positive.")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError(f"max_pending ({max_pending}) must be positive.")
+
+    @classmethod
+    def _iter_results(cls, datasets, basket_options: dict, describe_options,
+                      processes: int or None, chunk_size: int, max_pending: int or None):
+        """Yield _basket_chunk results, in order, serially or from a pool
+        of worker processes with at most max_pending chunks in flight.
+
+        Closing the generator early terminates the pool."""
+        chunks = cls._iter_chunks(datasets, chunk_size)
+        if processes is None or processes <= 1:
+            for chunk in chunks:
+                yield from _basket_chunk((chunk, basket_options, describe_options, False))
+            return
+        if max_pending is None:
+            max_pending = 2 * processes
+        from multiprocessing import Pool
+        # baskets are sent back by their statistics only
+        packed = describe_options is None
+        with Pool(processes) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(
+                    _basket_chunk, ((chunk, basket_options, describe_options, packed),)))
+                if len(pending) >= max_pending:
+                    yield from cls._unpack(pending.popleft().get(), packed)
+            while len(pending) != 0:
+                yield from cls._unpack(pending.popleft().get(), packed)
+
+    @staticmethod
+    def _unpack(results: list, packed: bool) -> list:
+        if not packed:
+            return results
+        return [StatBasket.from_bytes(result) for result in results]
+
+    @classmethod
+    def get_baskets(cls, datasets, processes: int = None, chunk_size: int = 64,
+                    max_pending: int = None, **basket_options):
+        """Yield a StatBasket of each data set, in input order.
+
+        Baskets built in worker processes are sent back by their
+        statistics only, so hold no data (as with retain_data=False).
+
+        Parameters:
+            datasets: iterable of data sets, or of (name, data) pairs
+            processes: optional, int, number of worker processes; None or 1
+                builds the baskets serially in the current process
+            chunk_size: optional, int, default 64, data sets per task
+            max_pending: optional, int, default 2 * processes, tasks in
+                flight at once, which bounds the memory used
+            basket_options: keyword arguments given to every StatBasket,
+                e.g. is_population, cl, tail, remove_outliers
+        """
+        cls._validate_batch(chunk_size, max_pending)
+        return cls._iter_results(datasets, basket_options, None,
+                                 processes, chunk_size, max_pending)
+
+    @classmethod
+    def describe(cls, datasets, processes: int = None, chunk_size: int = 64,
+                 max_pending: int = None, round_places=3, h0=None,
+                 format="table", **basket_options):
+        """Yield the describe() output of each data set, in input order.
+
+        round_places, h0 and format are given to StatBasket.describe();
+        see get_baskets for the remaining parameters."""
+        if format not in StatBasket._describe_formats:
+            raise ValueError(f"format ({str(format)}) is not one of "
+                             f"{StatBasket._describe_formats}.")
+        cls._validate_batch(chunk_size, max_pending)
+        describe_options = {"round_places": round_places, "h0": h0, "format": format}
+        return cls._iter_results(datasets, basket_options, describe_options,
+                                 processes, chunk_size, max_pending)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,195 @@
+"""statcache.py
+
+Contains the class StatCache, an opt-in on-disk cache of computed
+StatBasket statistics, keyed by a hash of the input data and of the
+options which change the statistics, and bounded in size by evicting
+the least recently used entries.
+
+Classes:
+    StatCache
+"""
+# Standard Library Imports
+import os
+from array import array
+from hashlib import blake2b
+from itertools import repeat
+from struct import error as StructError
+from tempfile import mkstemp
+
+
+class StatCache:
+    """
+    Persistent, size-bounded cache of StatBasket statistics.
+
+    Summary:
+    __________
+    Passing a cache to StatBasket makes a repeat construction on the
+    same data and options a file read: the key is a BLAKE2 hash of the
+    data (packed into an array, so hashing is one pass at C speed) and
+    of the options, and each entry is the basket's to_bytes(), a few
+    hundred bytes. Reading an entry marks it as recently used, and once
+    the files exceed max_bytes the least recently used are deleted.
+
+    >>> from statbasket import StatBasket, StatCache
+    >>> cache = StatCache("~/.cache/statbasket")
+    >>> basket = StatBasket((1, 2, 3, 4, 5), cache=cache)  # calculated
+    >>> basket = StatBasket((1, 2, 3, 4, 5), cache=cache)  # read from disk
+
+    Parameters:
+    ___________
+    directory : str
+        Directory holding the cache files, created if needed.
+    max_bytes : int, optional
+        Default 256 MiB, the size above which entries are evicted.
+
+    Methods:
+    _____________
+    get_key
+        Return the key of a data set (or pair) and its options
+    get
+        Return the cached basket of a key, or None
+    put
+        Store a basket under a key
+    clear
+        Delete every entry
+    """
+
+    _suffix = ".stat"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 2 ** 20):
+        if not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes <= 0:
+            raise ValueError(f"max_bytes ({str(max_bytes)}) must be a positive int.")
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        # Running total, re-measured from disk whenever max_bytes is exceeded
+        self._total_bytes = sum(size for _, _, size in self._scan())
+
+    # Keys ############################################################
+
+    @staticmethod
+    def _pack(data: tuple or list) -> bytes:
+        """Return data packed as ints if possible, else as floats, so
+        int and float data (which describe() prints differently) get
+        different keys. Each is prefixed by its type and length.
+
+        Data packed as floats is followed by a byte per value, 1 if it
+        is a float, so (1, 2.5) and (1.0, 2.5), whose min, max and mode
+        differ in type, get different keys too."""
+        try:
+            packed = array("q", data)
+        except (TypeError, OverflowError):
+            pass
+        else:
+            return f"q{len(packed)}:".encode("ascii") + packed.tobytes()
+        try:
+            packed = array("d", data)
+        except (TypeError, OverflowError):
+            return f"r{len(data)}:{data!r}".encode("utf-8")
+        is_float = bytes(map(isinstance, data, repeat(float)))
+        return f"d{len(packed)}:".encode("ascii") + packed.tobytes() + is_float
+
+    @classmethod
+    def get_key(cls, first_data_set: tuple or list,
+                second_data_set: tuple or list = None, **options) -> str:
+        """Return the hex key of the data set(s) and keyword options."""
+        digest = blake2b(digest_size=20)
+        for data in (first_data_set, second_data_set):
+            if data is None:
+                digest.update(b"-")
+                continue
+            digest.update(cls._pack(data))
+        digest.update(repr(sorted(options.items())).encode("utf-8"))
+        return digest.hexdigest()
+
+    # Entries #########################################################
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self._suffix)
+
+    def _scan(self) -> list:
+        """Return (last use time, path, size) of every entry."""
+        entries = list()
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(self._suffix):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def get(self, key: str):
+        """Return the StatBasket stored under key, or None if not cached."""
+        from statbasket.statbasket import StatBasket
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as file:
+                packed = file.read()
+            # mark as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        try:
+            return StatBasket.from_bytes(packed)
+        except (ValueError, StructError, IndexError):
+            # corrupt or partial entry, e.g. from an older layout
+            self._remove(path)
+            return None
+
+    def put(self, key: str, basket) -> None:
+        """Store the statistics of basket under key."""
+        packed = basket.to_bytes()
+        path = self._get_path(key)
+        # unique per call, so threads storing the same key never share it
+        descriptor, temporary_path = mkstemp(dir=self.directory, prefix=key, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(packed)
+            # atomic, so readers never see a partial entry
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        self._total_bytes += len(packed)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _remove(self, path: str) -> int:
+        """Delete an entry, returning the bytes freed."""
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return 0
+        return size
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries, down to 90% of
+        max_bytes so that eviction is not repeated on every put."""
+        entries = sorted(self._scan())
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * 0.9
+        for _, path, _ in entries:
+            if total <= target:
+                break
+            total -= self._remove(path)
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for _, path, _ in self._scan():
+            self._remove(path)
+        self._total_bytes = 0
+
+    def __len__(self):
+        return len(self._scan())
+
+    def __repr__(self):
+        return f"StatCache(directory={self.directory!r}, max_bytes={self.max_bytes})"
+
+
+if __name__ == "__main__":
+    pass
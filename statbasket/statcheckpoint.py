@@ -0,0 +1,133 @@
+"""statcheckpoint.py
+
+Contains the class StatCheckpoint, which saves the state of a streaming
+accumulator (StatMoments, StatStream, StatWindow or StatEWM) to a local
+file, atomically and at most once per interval, and restores it.
+
+Classes:
+    StatCheckpoint
+"""
+# Standard Library Imports
+import os
+import time
+from struct import Struct
+from tempfile import mkstemp
+from zlib import crc32
+
+# Local Imports
+from statbasket.statmoments import StatMoments
+from statbasket.statstream import StatStream
+from statbasket.statwindow import StatEWM, StatWindow
+
+
+class StatCheckpoint:
+    """
+    Checkpoint file of a streaming accumulator.
+
+    Summary:
+    __________
+    save() writes the accumulator's to_bytes() to a temporary file in
+    the same directory, syncs it to disk, and renames it over the
+    checkpoint, so a crash at any point leaves either the previous or
+    the new checkpoint, never a partial one. load() restores the
+    accumulator in time proportional to its state (its moments, and
+    the values of a StatStream or StatWindow), not to the number of
+    values it has consumed.
+
+    >>> checkpoint = StatCheckpoint("latency.ckpt", interval=60)
+    >>> window = checkpoint.load() or StatWindow(1000)
+    >>> for value in source:
+    ...     window.push(value)
+    ...     checkpoint.maybe_save(window)
+
+    Parameters:
+    ___________
+    path : str
+        Checkpoint file.
+    interval : float, optional
+        Default 60, minimum seconds between saves by maybe_save().
+
+    Methods:
+    _____________
+    save
+        Write a checkpoint now
+    maybe_save
+        Write a checkpoint if interval seconds passed since the last
+    load
+        Return the accumulator of the checkpoint, or None if there is none
+    """
+
+    # Header of the file: magic, format version, accumulator type,
+    # CRC-32 and length of the accumulator's to_bytes()
+    _header = Struct("<4sBBIq")
+    _magic = b"SBCK"
+    _version = 1
+    _types = (StatMoments, StatStream, StatWindow, StatEWM)
+
+    def __init__(self, path: str, interval: float = 60.0):
+        if (not isinstance(interval, (int, float)) or isinstance(interval, bool)
+                or interval < 0):
+            raise ValueError(f"interval ({str(interval)}) must be a non-negative number.")
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.interval = interval
+        self._last_save = None
+
+    def save(self, accumulator) -> None:
+        """Write the state of accumulator to the checkpoint file."""
+        if type(accumulator) not in self._types:
+            raise ValueError(f"Cannot checkpoint '{type(accumulator).__name__}', must be one "
+                             f"of {tuple(each_type.__name__ for each_type in self._types)}.")
+        state = accumulator.to_bytes()
+        header = self._header.pack(self._magic, self._version,
+                                   self._types.index(type(accumulator)),
+                                   crc32(state), len(state))
+        # unique per call, so threads saving at once never share it
+        descriptor, temporary_path = mkstemp(dir=os.path.dirname(self.path),
+                                             prefix=os.path.basename(self.path), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(header)
+                file.write(state)
+                file.flush()
+                os.fsync(file.fileno())
+            # atomic, the checkpoint is either the old or the new one
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        self._last_save = time.monotonic()
+
+    def maybe_save(self, accumulator) -> bool:
+        """Save if at least interval seconds passed since the last save
+        (or none was made yet), returning whether it saved."""
+        if (self._last_save is not None
+                and time.monotonic() - self._last_save < self.interval):
+            return False
+        self.save(accumulator)
+        return True
+
+    def load(self):
+        """Return the accumulator saved in the checkpoint, or None if
+        the file does not exist. Raises ValueError if it is corrupt."""
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < self._header.size:
+            raise ValueError(f"Checkpoint {self.path} is truncated.")
+        magic, version, type_index, checksum, length = self._header.unpack_from(data)
+        if magic != self._magic or version != self._version:
+            raise ValueError(f"{self.path} is not a version {self._version} checkpoint.")
+        state = data[self._header.size:]
+        if len(state) != length or crc32(state) != checksum or type_index >= len(self._types):
+            raise ValueError(f"Checkpoint {self.path} is corrupt.")
+        return self._types[type_index].from_bytes(state)
+
+    def __repr__(self):
+        return f"StatCheckpoint(path={self.path!r}, interval={self.interval})"
+
+
+if __name__ == "__main__":
+    pass
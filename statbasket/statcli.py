@@ -0,0 +1,257 @@
+"""statcli.py
+
+Command-line interface of statbasket, run as `python -m statbasket` or
+with the `statbasket` console script.
+
+Reads numeric columns from CSV files, raw float64 binary files, or
+stdin, and prints the describe() table (or JSON) of each column. Values
+are streamed from the input: by default they are buffered in a list,
+which becomes the basket's data (about 32 bytes per value, a float and
+its reference in the list), so memory grows with the input; with
+--moments-only only running moments are kept, so memory does not grow
+with the input at all, and the same describe() table is printed with
+the order statistics (median, quartiles, mode) as n/a. A column whose
+statistics cannot be calculated (e.g. with no variation) is reported as
+an error, and the other columns are still described.
+
+The JSON object is keyed by file ("stdin" for stdin), then by column
+(the CSV header name or index, "0" for binary input). A file given more
+than once, or a column requested more than once, is described once.
+
+Usage:
+    python -m statbasket data.csv --column price --column quantity
+    cat values.csv | python -m statbasket --json
+    python -m statbasket --input-format binary --jobs 4 *.f64
+    python -m statbasket --moments-only huge.csv
+"""
+# Standard Library Imports
+import argparse
+import sys
+from array import array
+
+# Local Imports
+from statbasket.statbasket import StatBasket
+from statbasket.statmoments import StatMoments
+from statbasket.statsummary import StatSummary
+
+# Bytes read at a time from binary input
+_read_size = 1 << 16
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="statbasket",
+        description="Describe numeric columns of CSV or binary files, or stdin.")
+    parser.add_argument("files", nargs="*", default=["-"],
+                        help="input files, '-' (the default) reads stdin")
+    parser.add_argument("--input-format", choices=("csv", "binary"), default="csv",
+                        help="csv (default) or binary (raw native float64 values)")
+    parser.add_argument("-c", "--column", action="append", dest="columns",
+                        help="CSV column to describe, by header name or 0-based "
+                             "index; may be repeated (default: the first column)")
+    parser.add_argument("--delimiter", default=",", help="CSV delimiter (default ',')")
+    parser.add_argument("--json", action="store_true",
+                        help="print one JSON object instead of tables")
+    parser.add_argument("--moments-only", action="store_true",
+                        help="keep only running moments (n, mean, var, ...), in "
+                             "constant memory, instead of every value (about 32 "
+                             "bytes each); median, quartiles and mode are n/a")
+    parser.add_argument("--population", action="store_true",
+                        help="treat the data as a population")
+    parser.add_argument("--cl", type=float, choices=(0.90, 0.95, 0.99), default=0.95,
+                        help="confidence level (default 0.95)")
+    parser.add_argument("--tail", choices=("two", "left", "right"), default="two",
+                        help="tail of the confidence interval (default two)")
+    parser.add_argument("--round-places", type=int, default=3,
+                        help="decimal places in tables (default 3)")
+    parser.add_argument("--memory-budget", type=int, default=None,
+                        help="memory_budget in bytes given to each StatBasket")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of files processed in parallel (default 1), "
+                             "unless stdin is read")
+    return parser
+
+
+# Reading #############################################################
+
+def _open(path: str, binary: bool):
+    if path == "-":
+        return sys.stdin.buffer if binary else sys.stdin
+    return open(path, "rb") if binary else open(path, newline="")
+
+
+def _read_csv(file, source: str, columns: list, delimiter: str, create_sink) -> list:
+    """Stream the columns of a CSV file into sinks, returning
+    [(column, sink)], create_sink() returning a list or StatMoments.
+
+    The first row is a header if any of its cells is not a number.
+    Empty cells are skipped."""
+    from csv import reader
+    rows = reader(file, delimiter=delimiter)
+    first_row = next(rows, None)
+    if first_row is None:
+        raise ValueError(f"{source} is empty.")
+    header = None
+    for cell in first_row:
+        try:
+            float(cell)
+        except ValueError:
+            header = [cell.strip() for cell in first_row]
+            break
+    indexes = list()
+    for column in columns or ["0"]:
+        if header is not None and column in header:
+            index = header.index(column)
+        elif column.isdigit() and int(column) < len(first_row):
+            index = int(column)
+        else:
+            raise ValueError(f"{source} has no column '{column}'.")
+        if index not in indexes:
+            indexes.append(index)
+    names = [header[index] if header is not None else str(index) for index in indexes]
+    sinks = [create_sink() for _ in indexes]
+    appends = [sink.push if isinstance(sink, StatMoments) else sink.append
+               for sink in sinks]
+    pending_rows = rows if header is not None else _prepend(first_row, rows)
+    for line_number, row in enumerate(pending_rows, start=2 if header is not None else 1):
+        for append, index in zip(appends, indexes):
+            cell = row[index].strip() if index < len(row) else str()
+            if cell == str():
+                continue
+            try:
+                append(float(cell))
+            except ValueError:
+                raise ValueError(f"{source}, line {line_number}: '{cell}' is not a number.") from None
+    return list(zip(names, sinks))
+
+
+def _prepend(first, rest):
+    yield first
+    yield from rest
+
+
+def _read_binary(file, source: str, create_sink) -> list:
+    """Stream native float64 values into a sink, returning [("0", sink)]."""
+    sink = create_sink()
+    item_size = array("d").itemsize
+    remainder = b""
+    while True:
+        block = file.read(_read_size)
+        if not block:
+            break
+        block = remainder + block
+        usable = len(block) - len(block) % item_size
+        sink.extend(array("d", block[:usable]))
+        remainder = block[usable:]
+    if len(remainder) != 0:
+        raise ValueError(f"{source} is not a whole number of float64 values.")
+    return [("0", sink)]
+
+
+# Describing ##########################################################
+
+def _describe_file(task: tuple) -> tuple:
+    """Return (source, [(column, output, error)]) of the columns of one
+    input.
+
+    task = (path, options), options being the parsed arguments as a
+    dict; output is a describe() table, or the {statistic: value} dict
+    of the column with --json, or None if the column could not be
+    described, error then being the message why."""
+    path, options = task
+    source = "stdin" if path == "-" else path
+    binary = options["input_format"] == "binary"
+    create_sink = StatMoments if options["moments_only"] else list
+    file = _open(path, binary)
+    try:
+        if binary:
+            columns = _read_binary(file, source, create_sink)
+        else:
+            columns = _read_csv(file, source, options["columns"],
+                                options["delimiter"], create_sink)
+    finally:
+        if path != "-":
+            file.close()
+    described = list()
+    while len(columns) != 0:
+        # each column's values are released once it is described
+        column, values = columns.pop(0)
+        name = source if binary else f"{source}:{column}"
+        try:
+            described.append((column, _describe_values(name, values, options), None))
+        except ValueError as error:
+            described.append((column, None, str(error)))
+        except ZeroDivisionError as error:
+            described.append((column, None, f"{name}: statistics are undefined ({error}), "
+                                            f"e.g. the values do not vary or their mean is 0."))
+    return source, described
+
+
+def _describe_values(name: str, values, options: dict):
+    """Return the describe() table, or the {statistic: value} dict, of
+    one column's values (a list, or StatMoments with --moments-only)."""
+    n = values.n if options["moments_only"] else len(values)
+    if n < 2:
+        raise ValueError(f"{name} has fewer than 2 values.")
+    is_population = options["population"]
+    if options["moments_only"]:
+        summary = StatSummary.from_moments(values, is_population=is_population,
+                                           cl=options["cl"], tail=options["tail"])
+        basket = StatBasket._from_summaries("single", (name,), (summary,), is_population,
+                                            options["cl"], options["tail"], "parametric",
+                                            False, float("nan"))
+    else:
+        # the basket takes the list itself as its data, and releases it
+        basket = StatBasket(values, is_population=is_population, cl=options["cl"],
+                            tail=options["tail"], first_data_name=name,
+                            memory_budget=options["memory_budget"], retain_data=False)
+    if options["json"]:
+        return basket.describe(format="dict")[name]
+    return basket.describe(round_places=options["round_places"])
+
+
+def main(argv: list = None) -> int:
+    """Run the command line interface, returning the exit status."""
+    parser = _get_parser()
+    arguments = parser.parse_args(argv)
+    if arguments.jobs < 1:
+        parser.error(f"--jobs ({arguments.jobs}) must be positive.")
+    if arguments.files.count("-") > 1:
+        parser.error("stdin ('-') can only be read once.")
+    options = vars(arguments)
+    # a file given more than once is read once
+    tasks = [(path, options) for path in dict.fromkeys(arguments.files)]
+    # worker processes cannot read stdin
+    if arguments.jobs > 1 and len(tasks) > 1 and "-" not in arguments.files:
+        from multiprocessing import Pool
+        pool = Pool(min(arguments.jobs, len(tasks)))
+        results = pool.imap(_describe_file, tasks)
+    else:
+        pool = None
+        results = map(_describe_file, tasks)
+
+    combined = dict()
+    status = 0
+    try:
+        for source, columns in results:
+            for column, output, error in columns:
+                if error is not None:
+                    sys.stderr.write(f"{parser.prog}: error: {error}\n")
+                    status = 1
+                elif arguments.json:
+                    combined.setdefault(source, dict())[column] = output
+                else:
+                    sys.stdout.write(output)
+    except (OSError, ValueError) as error:
+        sys.stderr.write(f"{parser.prog}: error: {error}\n")
+        return 1
+    finally:
+        if pool is not None:
+            pool.terminate()
+    if arguments.json:
+        sys.stdout.write(StatBasket._dumps_json(combined) + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""statcolumns.py
+
+Contains the class StatColumns, a column-oriented (struct of arrays)
+store for the statistics of many baskets, which keeps each statistic of
+every basket in one array.array column instead of one object per
+basket.
+
+Classes:
+    StatColumns
+"""
+# Standard Library Imports
+from array import array
+from itertools import compress
+
+
+class StatColumns:
+    """
+    Columnar container of the statistics of many StatBasket or
+    StatSummary results.
+
+    Summary:
+    __________
+    Each statistic is an array.array column, so a stored basket costs 8
+    bytes per column (plus a label reference) rather than a Python
+    object with its own attribute dictionary. Rows can be filtered,
+    sorted, or reduced to the top k by any column; each of these returns
+    a new StatColumns.
+
+    >>> from statbasket import StatBasket
+    >>> columns = StatColumns(columns=("n", "mean", "ci_lower", "ci_upper"))
+    >>> columns.append(StatBasket((1, 2, 3)), label="a")
+    >>> columns.append(StatBasket((4, 5, 6, 7)), label="b")
+    >>> columns.top_k("mean", 1).labels
+    ['b']
+
+    Parameters:
+    ___________
+    columns : tuple or list, optional
+        Default all of StatColumns.column_names, the statistics stored.
+        Quartiles are stored as q1 and q3 (q2 is the median) and iqr,
+        the confidence interval as ci_lower and ci_upper. A mode which
+        is not a single value ('none' or 'multimodal') is stored as nan.
+
+    Attributes:
+    __________
+    labels : list
+        Label of each row, as given to append() (None if not given).
+    nbytes : int
+        Bytes held by the column arrays.
+
+    Methods:
+    _____________
+    append, extend
+        Add the statistics of one or many results
+    filter
+        Return the rows whose value of a column lies within bounds
+    sort
+        Return the rows ordered by a column
+    top_k
+        Return the k rows with the largest (or smallest) values of a column
+    take
+        Return the rows at the given indices
+    row
+        Return the statistics of one row as a dict
+    """
+
+    # column: (result attribute, index into it or None, array typecode)
+    _sources = {
+        "n": ("n", None, "q"),
+        "df": ("df", None, "q"),
+        "min": ("min", None, "d"),
+        "max": ("max", None, "d"),
+        "range": ("range", None, "d"),
+        "mean": ("mean", None, "d"),
+        "median": ("median", None, "d"),
+        "q1": ("quartiles", 0, "d"),
+        "q3": ("quartiles", 2, "d"),
+        "iqr": ("quartiles", 3, "d"),
+        "mode": ("mode", None, "d"),
+        "var": ("var", None, "d"),
+        "stdev": ("stdev", None, "d"),
+        "sterr": ("sterr", None, "d"),
+        "cv": ("cv", None, "d"),
+        "skew": ("skew", None, "d"),
+        "alpha": ("alpha", None, "d"),
+        "score_critical": ("score_critical", None, "d"),
+        "moe": ("moe", None, "d"),
+        "ci_lower": ("ci", 0, "d"),
+        "ci_upper": ("ci", 1, "d"),
+    }
+    column_names = tuple(_sources)
+
+    def __init__(self, columns: tuple or list = None):
+        if columns is None:
+            columns = self.column_names
+        unknown = [name for name in columns if name not in self._sources]
+        if len(unknown) != 0:
+            raise ValueError(f"Unknown columns: {unknown}. "
+                             f"Acceptable columns: {self.column_names}")
+        self.columns = {name: array(self._sources[name][2]) for name in columns}
+        self.labels = list()
+
+    # Adding Rows #####################################################
+
+    def append(self, result, suffix: str = str(), label=None) -> None:
+        """Add the statistics of a StatBasket or StatSummary as a row.
+
+        suffix selects the data set of a basket with two data sets,
+        i.e. '_x', '_y' or '_diff'."""
+        values = list()
+        for name in self.columns:
+            attribute, index, _ = self._sources[name]
+            value = getattr(result, attribute + suffix)
+            if index is not None:
+                value = value[index]
+            if isinstance(value, str):
+                # 'none' or 'multimodal' mode
+                value = float("nan")
+            values.append(value)
+        # convert every value before changing any column
+        checked = [array(column.typecode, (value,))
+                   for column, value in zip(self.columns.values(), values)]
+        for column, value in zip(self.columns.values(), checked):
+            column.extend(value)
+        self.labels.append(label)
+
+    def extend(self, results, suffix: str = str(), labels=None) -> None:
+        """Append each result in turn, with the matching label if given."""
+        if labels is None:
+            for result in results:
+                self.append(result, suffix=suffix)
+        else:
+            for result, label in zip(results, labels):
+                self.append(result, suffix=suffix, label=label)
+
+    # Selecting Rows ##################################################
+
+    def _get_column(self, name: str) -> array:
+        if name not in self.columns:
+            raise ValueError(f"Column '{name}' is not stored. "
+                             f"Stored columns: {tuple(self.columns)}")
+        return self.columns[name]
+
+    def _copy_empty(self) -> "StatColumns":
+        return type(self)(columns=tuple(self.columns))
+
+    def take(self, indices) -> "StatColumns":
+        """Return a StatColumns of the rows at indices, in that order."""
+        indices = list(indices)
+        result = self._copy_empty()
+        for name, column in self.columns.items():
+            result.columns[name] = array(column.typecode, map(column.__getitem__, indices))
+        result.labels = [self.labels[i] for i in indices]
+        return result
+
+    def filter(self, column: str, minimum: float = None,
+               maximum: float = None) -> "StatColumns":
+        """Return a StatColumns of the rows with minimum <= column <= maximum.
+
+        Either bound may be None (unbounded). Rows with nan are dropped."""
+        values = self._get_column(column)
+        low = float("-inf") if minimum is None else minimum
+        high = float("inf") if maximum is None else maximum
+        mask = [low <= value <= high for value in values]
+        result = self._copy_empty()
+        for name, each_column in self.columns.items():
+            result.columns[name] = array(each_column.typecode, compress(each_column, mask))
+        result.labels = list(compress(self.labels, mask))
+        return result
+
+    def sort(self, column: str, reverse=False) -> "StatColumns":
+        """Return a StatColumns of the rows sorted by column."""
+        values = self._get_column(column)
+        return self.take(sorted(range(len(values)), key=values.__getitem__, reverse=reverse))
+
+    def top_k(self, column: str, k: int, largest=True) -> "StatColumns":
+        """Return a StatColumns of the k rows with the largest (or, if
+        largest=False, smallest) values of column, in order.
+
+        Only the k rows kept are ordered, rather than every row. Rows
+        with nan are ignored."""
+        from heapq import nlargest, nsmallest
+        if not isinstance(k, int) or k < 0:
+            raise ValueError(f"k ({str(k)}) must be a non-negative int.")
+        values = self._get_column(column)
+        # nan != nan, so this skips rows with nan
+        indices = (i for i, value in enumerate(values) if value == value)
+        select = nlargest if largest else nsmallest
+        return self.take(select(k, indices, key=values.__getitem__))
+
+    # Reading Rows ####################################################
+
+    def row(self, index: int) -> dict:
+        """Return {column: value} of the row at index."""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def __getitem__(self, name: str) -> array:
+        return self._get_column(name)
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column) for column in self.columns.values())
+
+    def __repr__(self):
+        return f"StatColumns(rows={len(self)}, columns={tuple(self.columns)})"
+
+
+if __name__ == "__main__":
+    pass
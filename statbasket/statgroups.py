@@ -0,0 +1,194 @@
+"""statgroups.py
+
+Contains the class StatGroups, which compares k groups of data (e.g.
+the variants of an experiment) from the moments of each group,
+accumulated in a single pass over labeled values.
+
+Classes:
+    StatGroups
+"""
+# Standard Library Imports
+from itertools import combinations
+from math import nan
+
+# Local Imports
+from statbasket.statmethods import StatMe as sm
+from statbasket.statmoments import StatMoments
+
+
+class StatGroups:
+    """
+    Comparison of k groups: one-way ANOVA, Welch's t-test of any pair,
+    and the matrix of every pairwise test.
+
+    Summary:
+    __________
+    Labeled values are read once, each added to the StatMoments of its
+    group. Every test is then calculated from those moments alone, so
+    the ANOVA costs O(k), and each pair compared costs O(1) rather than
+    another StatBasket over the two groups' data. Groups can also be
+    accumulated separately, e.g. per chunk or per process, and merged.
+
+    >>> groups = StatGroups([("a", 1), ("b", 4), ("a", 2), ("c", 7), ...])
+    >>> groups.get_anova()["p"]
+    >>> groups.get_welch("a", "b")["p"]
+    >>> groups.get_pairwise()[("a", "c")]["t"]
+
+    Parameters:
+    ___________
+    labeled : iterable, optional
+        (label, value) pairs, label being any hashable.
+
+    Attributes:
+    __________
+    moments : dict
+        {label: StatMoments}, in the order the labels first appeared.
+
+    Methods:
+    _____________
+    push, extend, add_group
+        Add one labeled value, many, or a whole group's data
+    add_moments
+        Add a group's StatMoments, e.g. of a StatSummary or StatStream
+    merge
+        Combine the groups of another StatGroups into this one
+    get_anova
+        Return the one-way ANOVA of all groups
+    get_welch
+        Return Welch's t-test of two groups
+    get_pairwise
+        Return Welch's t-test of every pair of groups
+    """
+
+    def __init__(self, labeled=None):
+        self.moments = dict()
+        if labeled is not None:
+            self.extend(labeled)
+
+    @classmethod
+    def from_groups(cls, groups: dict) -> "StatGroups":
+        """Return the StatGroups of {label: data}."""
+        stat_groups = cls()
+        for label, data in groups.items():
+            stat_groups.add_group(label, data)
+        return stat_groups
+
+    # Updates #########################################################
+
+    def push(self, label, x: float) -> None:
+        """Add a single value to the group label."""
+        if not isinstance(x, (int, float)):
+            raise ValueError(f"Value {str(x)} of group {label!r} is of type "
+                             f"'{type(x).__name__}', must be int or float.")
+        moments = self.moments.get(label)
+        if moments is None:
+            moments = self.moments[label] = StatMoments()
+        moments.push(x)
+
+    def extend(self, labeled) -> None:
+        """Add every (label, value) pair of an iterable."""
+        push = self.push
+        for label, x in labeled:
+            push(label, x)
+
+    def add_group(self, label, data: tuple or list) -> None:
+        """Add every value of data to the group label."""
+        for x in data:
+            self.push(label, x)
+
+    def add_moments(self, label, moments: StatMoments) -> None:
+        """Add the values accumulated in moments to the group label,
+        e.g. summary.get_moments() of a StatBasket built earlier."""
+        if not isinstance(moments, StatMoments):
+            raise ValueError(f"moments is of type '{type(moments).__name__}', "
+                             f"must be of type 'StatMoments'.")
+        self.moments.setdefault(label, StatMoments()).merge(moments)
+
+    def merge(self, other: "StatGroups") -> "StatGroups":
+        """Combine the groups of another StatGroups into this one.
+
+        Return self, so merges can be chained."""
+        for label, moments in other.moments.items():
+            self.add_moments(label, moments)
+        return self
+
+    def _get_moments(self, label) -> StatMoments:
+        moments = self.moments.get(label)
+        if moments is None:
+            raise ValueError(f"No group labeled {label!r}.")
+        if moments.n < 2:
+            raise ValueError(f"Group {label!r} has fewer than 2 values.")
+        return moments
+
+    # Tests ###########################################################
+
+    def get_anova(self) -> dict:
+        """Return the one-way ANOVA of the groups, as a dict of
+        df_between, df_within, ss_between, ss_within, ms_between,
+        ms_within, f and p (the p-value of f). If every group is
+        constant with the same mean, f and p are nan.
+
+        .. math::
+            F = \\frac{\\sum_{i}n_i(\\bar{x}_i - \\bar{x})^2 / (k - 1)}
+                {\\sum_{i}M_{2,i} / (N - k)}
+        """
+        if len(self.moments) < 2:
+            raise ValueError(f"ANOVA needs at least 2 groups, got {len(self.moments)}.")
+        all_moments = [self._get_moments(label) for label in self.moments]
+        n_total = sum(moments.n for moments in all_moments)
+        grand_mean = sum(moments.n * moments.mean for moments in all_moments) / n_total
+        ss_between = sum(moments.n * (moments.mean - grand_mean) ** 2 for moments in all_moments)
+        ss_within = sum(moments.m2 for moments in all_moments)
+        df_between = len(all_moments) - 1
+        df_within = n_total - len(all_moments)
+        ms_between = ss_between / df_between
+        ms_within = ss_within / df_within
+        if ms_within != 0:
+            f = ms_between / ms_within
+        else:
+            # every group is constant: f is infinite if their means
+            # differ, and undefined (0/0) if they are all equal
+            f = float("inf") if ss_between > 0 else nan
+        p = sm.get_p_f(f, df_between, df_within) if f == f else nan
+        return {"df_between": df_between, "df_within": df_within,
+                "ss_between": ss_between, "ss_within": ss_within,
+                "ms_between": ms_between, "ms_within": ms_within,
+                "f": f, "p": p}
+
+    def get_welch(self, label1, label2, h0: float = 0.0, tail: str = "two") -> dict:
+        """Return Welch's t-test of the group label1 against label2 (not
+        assuming equal variances), as a dict of t, df (Welch-Satterthwaite,
+        fractional), p and mean_diff. If both groups are constant, t, df
+        and p are nan, as in StatMultiTest.
+
+        .. math::
+            T = \\frac{(\\bar{x}_1 - \\bar{x}_2) - \\mu_0}{\\sqrt{s^2_1/n_1 + s^2_2/n_2}}
+        """
+        from math import sqrt
+        moments1 = self._get_moments(label1)
+        moments2 = self._get_moments(label2)
+        sterr1_sq = moments1.get_var() / moments1.n
+        sterr2_sq = moments2.get_var() / moments2.n
+        mean_diff = moments1.mean - moments2.mean
+        if sterr1_sq + sterr2_sq == 0:
+            return {"t": nan, "df": nan, "p": nan, "mean_diff": mean_diff}
+        t = (mean_diff - h0) / sqrt(sterr1_sq + sterr2_sq)
+        df = (sterr1_sq + sterr2_sq) ** 2 / (sterr1_sq ** 2 / (moments1.n - 1)
+                                             + sterr2_sq ** 2 / (moments2.n - 1))
+        return {"t": t, "df": df, "p": sm.get_p_t(t, df, tail=tail), "mean_diff": mean_diff}
+
+    def get_pairwise(self, h0: float = 0.0, tail: str = "two") -> dict:
+        """Return {(label1, label2): get_welch(label1, label2)} for every
+        pair of groups, label1 appearing before label2."""
+        return {(label1, label2): self.get_welch(label1, label2, h0=h0, tail=tail)
+                for label1, label2 in combinations(self.moments, 2)}
+
+    def __len__(self):
+        return len(self.moments)
+
+    def __repr__(self):
+        return f"StatGroups(groups={len(self.moments)})"
+
+
+if __name__ == "__main__":
+    pass
@@ -4,6 +4,8 @@ Contains the class StatMe, which is a collection of methods used for
 simple statistics calculations."""
 
 # Standard System Imports
+from collections import Counter
+from itertools import chain
 from math import fsum
 
 
@@ -45,6 +47,9 @@ class StatMe:
         get_quartile_data:
             Return tuple of sample's quartiles data (Q1, Q2, Q3, IQR)
 
+        get_percentiles:
+            Return the values at any set of quantiles of the sample
+
         get_outlier_data:
             Return the outliers in the dataset
 
@@ -81,6 +86,20 @@ class StatMe:
         get_score_hyp:
             Return the hypothesis test score for the dataset(s)
 
+        get_p_z:
+            Return the p-value of a z-score
+
+        get_p_t:
+            Return the p-value of a t-score
+
+        get_p_f:
+            Return the p-value of an F-score
+
+    get_var, get_stdev, get_sterr, get_cv, get_moe, get_ci, get_skew,
+    get_mode and get_data_diff take an optional threads argument: on free-threaded
+    builds of CPython (running without the GIL) their per-value loops
+    are split into chunks computed by a pool of that many threads. With
+    the GIL enabled, threads could only take turns, so they run serially.
     """
 
     @staticmethod
@@ -91,6 +110,36 @@ class StatMe:
                              f"data type is '{type(data).__name__}'. "
                              f"Iterable data cannot be empty.")
 
+    # Threaded Chunks #################################################
+
+    # Fewest values in a chunk worth handing to a thread
+    _min_chunk_size = 1 << 14
+
+    @staticmethod
+    def _gil_enabled() -> bool:
+        """Return False only on free-threaded builds running without the GIL."""
+        import sys
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+        return True if is_gil_enabled is None else is_gil_enabled()
+
+    @classmethod
+    def _map_chunks(cls, function, n: int, threads: int or None) -> list or None:
+        """Return [function(start, stop)] over contiguous chunks of
+        range(n), computed in a pool of threads, in order.
+
+        Return None, for the caller to run serially, if threads is None
+        or 1, if the GIL is enabled, or if n is too small to split."""
+        if threads is not None and (
+                not isinstance(threads, int) or isinstance(threads, bool) or threads < 1):
+            raise ValueError(f"threads ({str(threads)}) must be a positive int.")
+        if threads is None or threads == 1 or n < 2 * cls._min_chunk_size or cls._gil_enabled():
+            return None
+        from concurrent.futures import ThreadPoolExecutor
+        chunk_count = min(threads, n // cls._min_chunk_size)
+        bounds = [n * i // chunk_count for i in range(chunk_count + 1)]
+        with ThreadPoolExecutor(chunk_count) as executor:
+            return list(executor.map(function, bounds[:-1], bounds[1:]))
+
     # Basic Data Attributes ###########################################
 
     @classmethod
@@ -164,7 +213,7 @@ class StatMe:
         cls._data_validation(data)
         from math import floor
         # Sort the data
-        sorted_data = sorted(list(data))
+        sorted_data = sorted(data)
         n = len(sorted_data)
         # get the middle index
         odd_middle_index = floor(n / 2)
@@ -196,45 +245,164 @@ class StatMe:
         The inter-quartile range (IQR) is the number of units between
         Q1 and Q3, i.e. Q3 - Q1."""
         cls._data_validation(data)
-        from math import floor
-        # Sort the data
-        n = cls.get_n(data)
-        if n == 0:
+        if cls.get_n(data) == 0:
             # Empty dataset, returns zeroes
             return 0, 0, 0, 0
-        sorted_data = sorted(list(data))
-        n_is_odd = True if n % 2 == 1 else False
+        # A single sorted copy, the halves are read by index
+        return cls._get_quartile_data_sorted(sorted(data))
 
-        # Get middle index
-        odd_middle_index = floor(n / 2)
-        even_upper_index = floor(n / 2)
-        even_lower_index = floor(n / 2) - 1
-
-        # Get q2, which is the median
-        q2 = cls.get_median(data)
-        first_half_data = list()
-        second_half_data = list()
-
-        # add to first half until median, then add to second half
-        if n_is_odd:
-            for i in range(n):
-                if i < odd_middle_index:
-                    first_half_data.append(sorted_data[i])
-                # note how if index = middle_index, skips
-                elif i > odd_middle_index:
-                    second_half_data.append(sorted_data[i])
-        else:
-            for i in range(n):
-                if i <= even_lower_index:
-                    first_half_data.append(sorted_data[i])
-                # note how if index = middle_index, skips
+    @staticmethod
+    def _get_median_sorted(sorted_data, start: int = 0, stop: int = None) -> float:
+        """Return the median of sorted_data[start:stop] without copying.
+
+        sorted_data must already be in ascending order."""
+        if stop is None:
+            stop = len(sorted_data)
+        n = stop - start
+        if n <= 0:
+            raise IndexError("median of an empty range")
+        middle_index = start + n // 2
+        if n % 2 == 1:
+            return float(sorted_data[middle_index])
+        return float((sorted_data[middle_index - 1] + sorted_data[middle_index]) / 2)
+
+    @classmethod
+    def _get_quartile_data_sorted(cls, sorted_data) -> tuple:
+        """Return (Q1, Q2, Q3, IQR) of already sorted data.
+
+        Uses the same convention as get_quartile_data, but reads the
+        halves by index instead of building them as new lists."""
+        n = len(sorted_data)
+        if n == 0:
+            return 0, 0, 0, 0
+        half_n = n // 2
+        q1 = cls._get_median_sorted(sorted_data, 0, half_n)
+        q2 = cls._get_median_sorted(sorted_data)
+        q3 = cls._get_median_sorted(sorted_data, n - half_n, n)
+        return q1, q2, q3, q3 - q1
+
+    _percentile_methods = ("linear", "lower", "higher", "nearest", "midpoint", "quartile")
+    # Selection beats sorting only for large data and few ranks
+    _select_min_n = 1 << 19
+    _select_max_ranks = 8
+
+    @classmethod
+    def get_percentiles(cls, data: tuple or list, qs: tuple or list,
+                        method: str = "linear", is_sorted=False) -> tuple:
+        """Return a tuple of the values of data at each quantile of qs,
+        given as fractions from 0 to 1, e.g. (0.5, 0.9, 0.99, 0.999).
+
+        method sets the value taken between two data points, for a
+        quantile q at position h of the sorted data (0-based):
+
+        **linear** (default):
+            h = (n - 1)q, interpolated between the neighbouring values
+        **lower**, **higher**, **nearest**:
+            the value below h, above h, or nearest h (ties to even)
+        **midpoint**:
+            the average of the values below and above h
+        **quartile**:
+            the convention of get_quartile_data: Q1 and Q3 are the medians
+            of the lower and upper halves (excluding the median when n is
+            odd), i.e. for half size m = n // 2, h = (m - 1)2q below the
+            median and h = n - m + (m - 1)(2q - 1) above it, interpolated.
+            (0.25, 0.5, 0.75) give exactly get_quartile_data's Q1, Q2, Q3.
+
+        Every quantile is answered from one shared sort or, for large
+        data and few quantiles, one multi-select pass (recursive
+        partitioning, see _select_ranks). With is_sorted=True data is
+        taken as already in ascending order, e.g. a cached sorted copy,
+        and read directly.
+
+        >>> StatMe.get_percentiles((1, 2, 3, 4, 5, 6, 7, 8, 9, 10), (0.5, 0.9))
+        (5.5, 9.1)
+        """
+        cls._data_validation(data)
+        if method not in cls._percentile_methods:
+            raise ValueError(f"method ({str(method)}) is not one of {cls._percentile_methods}.")
+        for q in qs:
+            if not isinstance(q, (int, float)) or isinstance(q, bool) or not 0 <= q <= 1:
+                raise ValueError(f"Quantile {str(q)} is not a number from 0 to 1.")
+        n = cls.get_n(data)
+        if n == 0:
+            raise ValueError("Cannot take percentiles of an empty data set.")
+        from math import floor
+        positions = list()
+        for q in qs:
+            if method != "quartile":
+                position = (n - 1) * q
+            elif q == 0.5:
+                position = (n - 1) / 2
+            else:
+                half_n = n // 2
+                if q < 0.5:
+                    position = (half_n - 1) * 2 * q
                 else:
-                    second_half_data.append(sorted_data[i])
-        # use median method on halves to get quartiles
-        q1 = cls.get_median(first_half_data)
-        q3 = cls.get_median(second_half_data)
-        iqr = q3 - q1
-        return q1, q2, q3, iqr
+                    position = n - half_n + (half_n - 1) * (2 * q - 1)
+                # n = 1, both halves are empty
+                position = max(position, 0)
+            lower_rank = floor(position)
+            positions.append((position, lower_rank, min(lower_rank + 1, n - 1)))
+        if is_sorted:
+            value_of = data.__getitem__
+        elif n >= cls._select_min_n and 2 * len(qs) <= cls._select_max_ranks:
+            value_of = cls._select_ranks(data, {rank for _, lower_rank, upper_rank in positions
+                                                for rank in (lower_rank, upper_rank)}).__getitem__
+        else:
+            value_of = sorted(data).__getitem__
+
+        percentiles = list()
+        for position, lower_rank, upper_rank in positions:
+            fraction = position - lower_rank
+            lower_value, upper_value = value_of(lower_rank), value_of(upper_rank)
+            if method == "lower" or fraction == 0:
+                value = lower_value
+            elif method == "higher":
+                value = upper_value
+            elif method == "nearest":
+                value = upper_value if round(position) == upper_rank else lower_value
+            elif method == "midpoint" or fraction == 0.5:
+                # as the median of an even number of values
+                value = (lower_value + upper_value) / 2
+            else:
+                value = lower_value + (upper_value - lower_value) * fraction
+            percentiles.append(float(value))
+        return tuple(percentiles)
+
+    @staticmethod
+    def _select_ranks(data, ranks) -> dict:
+        """Return {rank: value} of the values at the given 0-based ranks
+        of sorted(data), without sorting it all.
+
+        Multi-select: each pass partitions the values around a pivot
+        (median of three) into lower, equal and upper lists, and only
+        the parts holding a wanted rank are partitioned further, until
+        they are small enough to sort."""
+        values = dict()
+        pending = [(data, sorted(ranks), 0)]
+        while len(pending) != 0:
+            items, wanted, offset = pending.pop()
+            n = len(items)
+            if n <= 64:
+                sorted_items = sorted(items)
+                for rank in wanted:
+                    values[rank] = sorted_items[rank - offset]
+                continue
+            pivot = sorted((items[0], items[n // 2], items[-1]))[1]
+            lower = [x for x in items if x < pivot]
+            upper = [x for x in items if x > pivot]
+            equal_start = offset + len(lower)
+            upper_start = offset + n - len(upper)
+            wanted_lower = [rank for rank in wanted if rank < equal_start]
+            wanted_upper = [rank for rank in wanted if rank >= upper_start]
+            for rank in wanted:
+                if equal_start <= rank < upper_start:
+                    values[rank] = pivot
+            if len(wanted_lower) != 0:
+                pending.append((lower, wanted_lower, offset))
+            if len(wanted_upper) != 0:
+                pending.append((upper, wanted_upper, upper_start))
+        return values
 
     @classmethod
     def get_outlier_data(
@@ -270,7 +438,8 @@ class StatMe:
             return tuple(outliers_list)
 
     @classmethod
-    def get_mode(cls, data: tuple or list, multimodal=False) -> float or tuple or str:
+    def get_mode(cls, data: tuple or list, multimodal=False,
+                 threads: int = None) -> float or tuple or str:
         """Return mode as float, 'none', or 'multimodal'.
 
         The mode of the dataset is the value which appears most
@@ -291,8 +460,24 @@ class StatMe:
         'multimodal'
         >>> StatMe.get_mode((1, 1, 2, 2, 3), multimodal=True)
         (1.0, 2.0)
+
+        With threads, each chunk of data is counted by a thread and the
+        counts are merged (see the class docstring).
         """
         cls._data_validation(data)
+
+        def count_chunk(start: int, stop: int) -> Counter:
+            return Counter(data[start:stop])
+
+        chunk_counts = cls._map_chunks(count_chunk, len(data), threads)
+        if chunk_counts is not None:
+            count_dict = chunk_counts[0]
+            for each_counts in chunk_counts[1:]:
+                count_dict.update(each_counts)
+            current_highest_count = max(count_dict.values())
+            mode_list = [each_item for each_item, count in count_dict.items()
+                         if count == current_highest_count]
+            return cls._get_mode_result(mode_list, multimodal)
         current_highest_count = int()
         set_of_highest_items = set()
         mode_list = list()
@@ -308,6 +493,11 @@ class StatMe:
                 mode_list.append(each_item)
         # mode_list now contains all items equal to the highest
         # repetitions among data points.
+        return cls._get_mode_result(mode_list, multimodal)
+
+    @staticmethod
+    def _get_mode_result(mode_list: list, multimodal: bool) -> float or tuple or str:
+        """Return the result of get_mode, given the most frequent items."""
         if multimodal:
             return tuple(sorted(mode_list))
         else:
@@ -318,8 +508,33 @@ class StatMe:
             else:
                 return 'multimodal'
 
+    @staticmethod
+    def _get_mode_sorted(sorted_data, multimodal=False) -> float or tuple or str:
+        """Return the mode of already sorted data, as get_mode.
+
+        Counts runs of equal values instead of building a dictionary of
+        counts, so uses no memory proportional to the data."""
+        from itertools import groupby
+        current_highest_count = 0
+        mode_list = list()
+        for each_item, group in groupby(sorted_data):
+            count = sum(1 for _ in group)
+            if count > current_highest_count:
+                current_highest_count = count
+                mode_list = [each_item]
+            elif count == current_highest_count:
+                mode_list.append(each_item)
+        if multimodal:
+            return tuple(mode_list)
+        if len(mode_list) == 0:
+            return 'none'
+        elif len(mode_list) == 1:
+            return float(mode_list[0])
+        else:
+            return 'multimodal'
+
     @classmethod
-    def get_skew(cls, data: tuple or list, is_population=False) -> float:
+    def get_skew(cls, data: tuple or list, is_population=False, threads: int = None) -> float:
         """Return the skewness of the data, using the skewness formula:
 
         .. math::
@@ -328,17 +543,28 @@ class StatMe:
         cls._data_validation(data)
         mean = cls.get_mean(data)
         n = cls.get_n(data)
-        stdev = cls.get_stdev(data, is_population=is_population)
-        sum_of_cubed_difference = float()
-        for each_item in data:
-            sum_of_cubed_difference += (each_item - mean) ** 3
+        stdev = cls.get_stdev(data, is_population=is_population, threads=threads)
+
+        def sum_cubes(start: int, stop: int) -> float:
+            sum_of_cubes = float()
+            for each_item in data[start:stop]:
+                sum_of_cubes += (each_item - mean) ** 3
+            return sum_of_cubes
+
+        chunk_sums = cls._map_chunks(sum_cubes, n, threads)
+        if chunk_sums is not None:
+            sum_of_cubed_difference = sum(chunk_sums)
+        else:
+            sum_of_cubed_difference = float()
+            for each_item in data:
+                sum_of_cubed_difference += (each_item - mean) ** 3
         skewness = (1/n) * sum_of_cubed_difference / stdev ** 3
         return float(skewness)
 
     # Measures of Data Variation ######################################
 
     @classmethod
-    def get_var(cls, data: tuple or list, is_population=False) -> float:
+    def get_var(cls, data: tuple or list, is_population=False, threads: int = None) -> float:
         """Return the sample variance (s\u00b2) of each data set as a
         float.
 
@@ -352,10 +578,21 @@ class StatMe:
         """
         cls._data_validation(data)
         mean = cls.get_mean(data)
-        variance = float()
         n = cls.get_n(data)
-        for each_item in data:
-            variance += (each_item - mean) ** 2
+
+        def sum_squares(start: int, stop: int) -> float:
+            sum_of_squares = float()
+            for each_item in data[start:stop]:
+                sum_of_squares += (each_item - mean) ** 2
+            return sum_of_squares
+
+        chunk_sums = cls._map_chunks(sum_squares, n, threads)
+        if chunk_sums is not None:
+            variance = sum(chunk_sums)
+        else:
+            variance = float()
+            for each_item in data:
+                variance += (each_item - mean) ** 2
         # Checks whether is a population or sample
         if is_population:
             variance = variance / n
@@ -364,7 +601,7 @@ class StatMe:
         return float(variance)
 
     @classmethod
-    def get_stdev(cls, data: tuple or list, is_population=False) -> float:
+    def get_stdev(cls, data: tuple or list, is_population=False, threads: int = None) -> float:
         """Calculates the standard deviation (s) of the data set
 
         .. math::
@@ -372,10 +609,10 @@ class StatMe:
         """
         cls._data_validation(data)
         from math import sqrt
-        return sqrt(cls.get_var(data, is_population))
+        return sqrt(cls.get_var(data, is_population, threads))
 
     @classmethod
-    def get_sterr(cls, data: tuple or list, is_population=False) -> float:
+    def get_sterr(cls, data: tuple or list, is_population=False, threads: int = None) -> float:
         """Calculates the standard error of the data set
 
         .. math::
@@ -383,21 +620,21 @@ class StatMe:
         """
         cls._data_validation(data)
         from math import sqrt
-        return cls.get_stdev(data, is_population) / sqrt(cls.get_n(data))
+        return cls.get_stdev(data, is_population, threads) / sqrt(cls.get_n(data))
 
     @classmethod
-    def get_cv(cls, data: tuple or list, is_population=False) -> float:
+    def get_cv(cls, data: tuple or list, is_population=False, threads: int = None) -> float:
         """Returns the coefficient of variation
 
         .. math::
             CV = s/mean"""
         cls._data_validation(data)
-        return cls.get_stdev(data, is_population) / cls.get_mean(data)
+        return cls.get_stdev(data, is_population, threads) / cls.get_mean(data)
 
     # Two-Population Properties #######################################
 
     @classmethod
-    def get_data_diff(cls, data1: tuple, data2: tuple) -> tuple:
+    def get_data_diff(cls, data1: tuple, data2: tuple, threads: int = None) -> tuple:
         """Return tuple of difference of two dependent data sets
 
         Note that this method assumes that the two data sets are
@@ -419,6 +656,12 @@ class StatMe:
                              f"Items in 'data1' = {data1_n}\n"
                              f"Items in 'data2' = {data2_n}")
         else:
+            def diff_chunk(start: int, stop: int) -> list:
+                return [x1 - x2 for x1, x2 in zip(data1[start:stop], data2[start:stop])]
+
+            chunk_diffs = cls._map_chunks(diff_chunk, data1_n, threads)
+            if chunk_diffs is not None:
+                return tuple(chain.from_iterable(chunk_diffs))
             return_list = list()
             for i in range(data1_n):
                 x1 = data1[i]
@@ -490,7 +733,11 @@ class StatMe:
         For n > 150, returns 999 (z-score lookup value for t-table).
         """
         cls._data_validation(df_data)
-        n = cls.get_n(df_data)
+        return cls._get_lookup_df_n(cls.get_n(df_data), df_is_population)
+
+    @classmethod
+    def _get_lookup_df_n(cls, n: int, df_is_population=False) -> int:
+        """Convert a sample size n into the t_table lookup df."""
         df = n-1
         if df >= 150 or df_is_population:
             return 999
@@ -551,7 +798,20 @@ class StatMe:
         is returned instead of a T-score.
         """
         cls._data_validation(data1)
-        lookup_df = cls._get_lookup_df(data1, is_population)
+        return cls._get_score_critical_n(
+            cls.get_n(data1), cl=cl, is_population=is_population,
+            tail=tail, verbose=verbose)
+
+    @classmethod
+    def _get_score_critical_n(
+            cls, n: int, cl: float = 0.95,
+            is_population: bool = False, tail: str = "two",
+            verbose: bool = False) -> float or tuple:
+        """Return the critical score for a sample of size n.
+
+        Same as get_score_critical, for callers holding only summary
+        statistics rather than the data itself."""
+        lookup_df = cls._get_lookup_df_n(n, is_population)
         lookup_alpha = cls._get_alpha(cl=cl, tail=tail)
         test_type = "z" if lookup_df == 999 else "t"
         critical_score = cls.t_table[lookup_df][lookup_alpha]
@@ -562,7 +822,7 @@ class StatMe:
 
     @classmethod
     def get_moe(cls, data: tuple or list, cl=0.95,
-                is_population=False, tail="two") -> float:
+                is_population=False, tail="two", threads: int = None) -> float:
         """Return margin of error of the data.
 
         .. math::
@@ -571,12 +831,12 @@ class StatMe:
         cls._data_validation(data)
         critical_score = cls.get_score_critical(
             data, cl=cl, is_population=is_population, tail=tail)
-        sterr = cls.get_sterr(data, is_population)
+        sterr = cls.get_sterr(data, is_population, threads)
         return critical_score * sterr
 
     @classmethod
     def get_ci(cls, data: tuple or list, cl=0.95,
-               is_population=False, tail="two") -> tuple:
+               is_population=False, tail="two", threads: int = None) -> tuple:
         """Return a tuple of lower/upper confidence interval boundaries
 
         Calculates the lower mean estimation and upper mean estimation
@@ -587,7 +847,7 @@ class StatMe:
         cls._data_validation(data)
         mean = cls.get_mean(data)
         e = cls.get_moe(
-            data, cl=cl, is_population=is_population, tail=tail
+            data, cl=cl, is_population=is_population, tail=tail, threads=threads
         )
         return mean - e, mean + e
 
@@ -619,16 +879,49 @@ class StatMe:
             verbose: optional, bool, default False, when checked return tuple of (score, score type, test type)
         """
         cls._data_validation(data1)
+
+        def get_moments(data_: tuple) -> tuple:
+            """Return (n, mean, sum of squared differences from mean)"""
+            n_ = cls.get_n(data_)
+            if n_ == 0:
+                return 0, 0.0, 0.0
+            return n_, cls.get_mean(data_), cls.get_var(data_, is_population=True) * n_
+
+        moments_diff = None
+        if samples_dependent and cls.get_n(data2) != 0:
+            # if samples are dependent, e.g. before-after weigh-ins
+            moments_diff = get_moments(cls.get_data_diff(data1, data2))
+        return cls._get_score_hyp_moments(
+            get_moments(data1), get_moments(data2), h0=h0,
+            samples_dependent=samples_dependent, is_population=is_population,
+            verbose=verbose, moments_diff=moments_diff)
+
+    @classmethod
+    def _get_score_hyp_moments(
+            cls, moments1: tuple, moments2: tuple = (0, 0.0, 0.0), h0: float = 0.0,
+            samples_dependent=False, is_population=False, verbose=False,
+            moments_diff: tuple = None) -> float or tuple:
+        """
+        Return the hypothesis test score from summary statistics.
+
+        Same as get_score_hyp, for callers holding the moments of the data
+        rather than the data itself. Each moments tuple is (n, mean, m2),
+        m2 being the sum of squared differences from the mean; moments2 has
+        n = 0 for single population tests, and moments_diff is the moments
+        of data1 - data2, required for dependent samples.
+        """
         from math import sqrt
 
-        df = cls._get_lookup_df(data1, is_population)
+        n_x, x_bar, m2_x = moments1
+        n_y, y_bar, m2_y = moments2
+        df = cls._get_lookup_df_n(n_x, is_population)
         return_score_type = "z" if df == 999 else "t"
         return_test_type = str()
         return_score = float()
 
         # The hypothesis tests ####
 
-        def test_one_pop(data_: tuple, _is_pop: bool):
+        def test_one_pop(moments_: tuple, _is_pop: bool):
             """Return z/t score for hypothesis test
 
             Assumptions: single population, z/t determined by lookup.
@@ -639,27 +932,22 @@ class StatMe:
                 Z = \\frac{x^- - \\mu_0}{\\sigma/\\sqrt{n}}
 
                 T = \\frac{x^- - \\mu_0}{s/\\sqrt{n}}"""
-            x_bar = cls.get_mean(data_)
-            s_x = cls.get_stdev(data_, is_population=_is_pop)
-            n_x = cls.get_n(data_)
-            return (x_bar - h0) / (s_x / sqrt(n_x))
+            n_, mean_, m2_ = moments_
+            s_x = sqrt(m2_ / n_ if _is_pop else m2_ / (n_ - 1))
+            return (mean_ - h0) / (s_x / sqrt(n_))
 
-        def test_two_pop_known_var_ind(data1_: tuple, data2_: tuple):
+        def test_two_pop_known_var_ind():
             """Return z score for hypothesis test
 
             Assumptions: two populations, known population variance
 
             .. math::
                 Z = \\frac{(x^- - y^-) - \\mu_0}{\\sqrt{\\sigma^2_x/n_x + \\sigma^2_y/n_y}}"""
-            x_bar = cls.get_mean(data1_)
-            y_bar = cls.get_mean(data2_)
-            var_x = cls.get_var(data1_, is_population=True)
-            var_y = cls.get_var(data2_, is_population=True)
-            n_x = cls.get_n(data1_)
-            n_y = cls.get_n(data2_)
-            return (x_bar - y_bar) / sqrt(var_x / n_x + var_y / n_y)
-
-        def test_two_pop_unknown_var_ind(data1_: tuple, data2_: tuple):
+            var_x = m2_x / n_x
+            var_y = m2_y / n_y
+            return (x_bar - y_bar - h0) / sqrt(var_x / n_x + var_y / n_y)
+
+        def test_two_pop_unknown_var_ind():
             """Return t score for hypothesis test
 
             Assumptions: two populations, unknown population variance,
@@ -668,37 +956,113 @@ class StatMe:
             .. math::
                 T = \\frac{(x^- - y^-) - \\mu_0}{\\sqrt{s^2_p/n_x
                 + s^2_p/n_y}}"""
-            x_bar = cls.get_mean(data1_)
-            y_bar = cls.get_mean(data2_)
-            var_pool = cls.get_var_pool(data1_, data2_)
-            n_x = cls.get_n(data1_)
-            n_y = cls.get_n(data2_)
-            return (x_bar - y_bar) / sqrt(var_pool / n_x + var_pool / n_y)
+            var_pool = (m2_x + m2_y) / (n_x + n_y - 2)
+            return (x_bar - y_bar - h0) / sqrt(var_pool / n_x + var_pool / n_y)
 
         # Test determination
-        if cls.get_n(data2) == 0:
+        if n_y == 0:
             # if data2 is empty, treat as single pop test
-            return_score = test_one_pop(data1, is_population)
+            return_score = test_one_pop(moments1, is_population)
             return_test_type = "single population"
+        elif samples_dependent:
+            # if samples are dependent, e.g. before-after weigh-ins; a
+            # z-test if df > 150 or is_population, as for a single pop
+            return_score = test_one_pop(moments_diff, _is_pop=is_population)
+            return_test_type = "two pop, dep"
         elif df == 999:
             # if df > 150 or is_population, it's a z-test
-            return_score = test_two_pop_known_var_ind(data1, data2)
+            return_score = test_two_pop_known_var_ind()
             return_test_type = "two pop, known var"
-        elif samples_dependent:
-            # if samples are dependent, e.g. before-after weigh-ins
-            return_score = test_one_pop(
-                cls.get_data_diff(data1, data2), _is_pop=is_population
-            )
-            return_test_type = "two pop, dep"
         else:
             # if two independent samples
-            return_score = test_two_pop_unknown_var_ind(data1, data2)
+            return_score = test_two_pop_unknown_var_ind()
             return_test_type = "two pop, unk var"
         if verbose:
             return return_score, return_score_type, return_test_type
         else:
             return return_score
 
+    # Distributions ###################################################
+
+    @staticmethod
+    def _get_beta_regularized(a: float, b: float, x: float) -> float:
+        """Return the regularized incomplete beta function I_x(a, b),
+        by its continued fraction (modified Lentz's method)."""
+        from math import exp, lgamma, log
+        if x <= 0.0:
+            return 0.0
+        if x >= 1.0:
+            return 1.0
+        if x > (a + 1) / (a + b + 2):
+            # the continued fraction converges quickly on this side only
+            return 1.0 - StatMe._get_beta_regularized(b, a, 1.0 - x)
+        front = exp(lgamma(a + b) - lgamma(a) - lgamma(b)
+                    + a * log(x) + b * log(1.0 - x)) / a
+        tiny = 1e-300
+        c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        fraction = d
+        for m in range(1, 1000):
+            for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                              -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+                d = 1.0 + numerator * d
+                d = 1.0 / (d if abs(d) > tiny else tiny)
+                c = 1.0 + numerator / c
+                c = c if abs(c) > tiny else tiny
+                fraction *= c * d
+            if abs(c * d - 1.0) < 1e-15:
+                break
+        return front * fraction
+
+    @classmethod
+    def get_p_z(cls, score: float, tail: str = "two") -> float:
+        """Return the p-value of a z-score (standard normal).
+
+        tail="two" gives P(|Z| >= |score|), "right" P(Z >= score) and
+        "left" P(Z <= score)."""
+        from math import erfc, sqrt
+        if tail not in ("two", "left", "right"):
+            raise ValueError(f"Tail attribute value (tail={str(tail)}) is not 'two', 'left', or 'right'.")
+        if tail == "two":
+            return erfc(abs(score) / sqrt(2))
+        if tail == "right":
+            return erfc(score / sqrt(2)) / 2
+        return erfc(-score / sqrt(2)) / 2
+
+    @classmethod
+    def get_p_t(cls, score: float, df: float, tail: str = "two") -> float:
+        """Return the p-value of a t-score with df degrees of freedom,
+        df may be fractional (e.g. Welch's t-test).
+
+        tail="two" gives P(|T| >= |score|), "right" P(T >= score) and
+        "left" P(T <= score).
+
+        .. math::
+            P(|T| \\geq |t|) = I_{df/(df + t^2)}(df/2, 1/2)
+        """
+        if tail not in ("two", "left", "right"):
+            raise ValueError(f"Tail attribute value (tail={str(tail)}) is not 'two', 'left', or 'right'.")
+        p_two = cls._get_beta_regularized(df / 2, 0.5, df / (df + score * score))
+        if tail == "two":
+            return p_two
+        # P(T >= |score|), by symmetry
+        p_upper = p_two / 2
+        if tail == "right":
+            return p_upper if score >= 0 else 1.0 - p_upper
+        return p_upper if score <= 0 else 1.0 - p_upper
+
+    @classmethod
+    def get_p_f(cls, score: float, df1: float, df2: float) -> float:
+        """Return the p-value P(F >= score) of an F-score with df1 and
+        df2 degrees of freedom, e.g. of a one-way ANOVA.
+
+        .. math::
+            P(F \\geq f) = I_{df_2/(df_2 + df_1 f)}(df_2/2, df_1/2)
+        """
+        if score <= 0:
+            return 1.0
+        return cls._get_beta_regularized(df2 / 2, df1 / 2, df2 / (df2 + df1 * score))
+
 
 if __name__ == "__main__":
     pass
@@ -0,0 +1,413 @@
+"""statmoments.py
+
+Contains the class StatMoments, a small accumulator of the central
+moments of a dataset which can be updated one value at a time,
+retracted, or merged with another accumulator, and StatCoMoments, its
+counterpart for paired (x, y) data, from which covariance, correlation
+and simple linear regression are calculated."""
+
+# Standard Library Imports
+from struct import Struct
+
+
+class StatMoments:
+    """
+    Accumulator of the n, mean, and second and third central moments of
+    a dataset.
+
+    Values can be added (push, extend), retracted (remove) or combined
+    with the moments of another dataset (merge), each in O(1), without
+    keeping the data itself. The statistics returned follow the same
+    definitions as the StatMe methods of the same name.
+
+    Example Usage:
+        >>> from statbasket.statmoments import StatMoments
+        >>> moments = StatMoments((1, 2, 3, 4, 4, 5))
+        >>> moments.get_mean()
+        3.1666666666666665
+        >>> moments.push(10)
+        >>> moments.n
+        7
+
+    Attributes::
+        n:
+            Number of values accumulated
+        mean:
+            Running mean of the values
+        m2:
+            Sum of squared differences from the mean
+        m3:
+            Sum of cubed differences from the mean
+        min, max:
+            Smallest and largest values pushed, None when unknown. Bounds
+            are not restored by remove(), which resets a bound to None
+            when the value removed is equal to it.
+    """
+
+    __slots__ = ("n", "mean", "m2", "m3", "min", "max")
+
+    # Fixed binary layout of to_bytes(), little-endian: n, mean, m2, m3,
+    # min and max (nan when unknown)
+    _struct = Struct("<q5d")
+
+    def __init__(self, data: tuple or list = None):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.min = None
+        self.max = None
+        if data is not None:
+            self.extend(data)
+
+    # Updates #########################################################
+
+    def push(self, x: float) -> None:
+        """Add a single value to the accumulator."""
+        n_old = self.n
+        n = n_old + 1
+        delta = x - self.mean
+        delta_n = delta / n
+        term1 = delta * delta_n * n_old
+        self.mean += delta_n
+        self.m3 += term1 * delta_n * (n - 2) - 3 * delta_n * self.m2
+        self.m2 += term1
+        self.n = n
+        if n_old == 0:
+            self.min = self.max = x
+            return
+        # an unknown (None) bound stays unknown
+        if self.min is not None and x < self.min:
+            self.min = x
+        if self.max is not None and x > self.max:
+            self.max = x
+
+    def extend(self, data) -> None:
+        """Add every value of an iterable to the accumulator."""
+        push = self.push
+        for each_item in data:
+            push(each_item)
+
+    def remove(self, x: float) -> None:
+        """Retract a single, previously pushed value.
+
+        Raises ValueError if the accumulator is empty."""
+        n = self.n
+        if n == 0:
+            raise ValueError("Cannot remove a value from empty moments.")
+        if n == 1:
+            self.__init__()
+            return
+        n_old = n - 1
+        mean_old = (n * self.mean - x) / n_old
+        delta = x - mean_old
+        delta_n = delta / n
+        term1 = delta * delta_n * n_old
+        m2_old = self.m2 - term1
+        self.m3 -= term1 * delta_n * (n - 2) - 3 * delta_n * m2_old
+        self.m2 = m2_old if m2_old > 0.0 else 0.0
+        self.mean = mean_old
+        self.n = n_old
+        if self.min is not None and x <= self.min:
+            self.min = None
+        if self.max is not None and x >= self.max:
+            self.max = None
+
+    def merge(self, other: "StatMoments") -> "StatMoments":
+        """Combine the moments of another accumulator into this one.
+
+        Return self, so merges can be chained."""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.m2, self.m3 = other.n, other.mean, other.m2, other.m3
+            self.min, self.max = other.min, other.max
+            return self
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        self.m3 = (self.m3 + other.m3
+                   + delta * delta_n * delta_n * na * nb * (na - nb)
+                   + 3 * delta_n * (na * other.m2 - nb * self.m2))
+        self.m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        self.mean += delta_n * nb
+        self.n = n
+        if self.min is not None and other.min is not None:
+            self.min = min(self.min, other.min)
+        else:
+            self.min = None
+        if self.max is not None and other.max is not None:
+            self.max = max(self.max, other.max)
+        else:
+            self.max = None
+        return self
+
+    def copy(self) -> "StatMoments":
+        """Return an independent copy of the accumulator."""
+        return StatMoments().merge(self)
+
+    # Serialization ###################################################
+
+    def to_bytes(self) -> bytes:
+        """Return the accumulator packed into 48 bytes."""
+        nan = float("nan")
+        return self._struct.pack(
+            self.n, self.mean, self.m2, self.m3,
+            nan if self.min is None else self.min,
+            nan if self.max is None else self.max)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatMoments":
+        """Return the accumulator packed by to_bytes()."""
+        moments = cls()
+        n, moments.mean, moments.m2, moments.m3, min_, max_ = cls._struct.unpack(data)
+        moments.n = n
+        # nan != nan, i.e. the bound was unknown
+        moments.min = min_ if min_ == min_ else None
+        moments.max = max_ if max_ == max_ else None
+        return moments
+
+    def __reduce__(self):
+        return type(self).from_bytes, (self.to_bytes(),)
+
+    # Statistics ######################################################
+
+    def get_mean(self) -> float:
+        """Return the mean, or 0 for an empty accumulator (as StatMe)."""
+        if self.n == 0:
+            return 0
+        return float(self.mean)
+
+    def get_var(self, is_population=False) -> float:
+        """Return the sample (or population) variance.
+
+        .. math::
+            s^2 = \\frac{M_2}{n - 1}
+        """
+        if is_population:
+            return float(self.m2 / self.n)
+        return float(self.m2 / (self.n - 1))
+
+    def get_stdev(self, is_population=False) -> float:
+        """Return the standard deviation."""
+        from math import sqrt
+        return sqrt(self.get_var(is_population))
+
+    def get_sterr(self, is_population=False) -> float:
+        """Return the standard error of the mean."""
+        from math import sqrt
+        return self.get_stdev(is_population) / sqrt(self.n)
+
+    def get_cv(self, is_population=False) -> float:
+        """Return the coefficient of variation."""
+        return self.get_stdev(is_population) / self.get_mean()
+
+    def get_skew(self, is_population=False) -> float:
+        """Return the skewness, using the same formula as StatMe.get_skew.
+
+        .. math::
+            skewness = \\frac{M_3/n}{stdev^3}
+        """
+        return float((self.m3 / self.n) / self.get_stdev(is_population) ** 3)
+
+    def __repr__(self):
+        return (f"StatMoments(n={self.n}, mean={self.mean}, "
+                f"m2={self.m2}, m3={self.m3})")
+
+
+class StatCoMoments:
+    """
+    Accumulator of the n, means, second central moments and co-moment
+    of paired (x, y) data.
+
+    Pairs can be added one at a time (push) or from two iterables
+    (extend), and accumulators of separate chunks of the data combined
+    (merge), each in O(1) memory, so two long series can be correlated
+    while streaming them, chunk by chunk, or in parallel workers whose
+    accumulators are merged (they pickle as 48 bytes).
+
+    Example Usage:
+        >>> from statbasket.statmoments import StatCoMoments
+        >>> comoments = StatCoMoments((1, 2, 3, 4), (2, 4, 5, 9))
+        >>> comoments.get_corr()
+        0.9647638212377321
+        >>> comoments.get_slope(), comoments.get_intercept()
+        (2.2, -0.5)
+
+    Attributes::
+        n:
+            Number of pairs accumulated
+        mean_x, mean_y:
+            Running means of x and y
+        m2_x, m2_y:
+            Sums of squared differences of x and y from their means
+        c2:
+            Sum of the products of the differences of x and y from
+            their means, i.e. (n - 1) * sample covariance
+    """
+
+    __slots__ = ("n", "mean_x", "mean_y", "m2_x", "m2_y", "c2")
+
+    # Fixed binary layout of to_bytes(), little-endian: n, mean_x,
+    # mean_y, m2_x, m2_y and c2
+    _struct = Struct("<q5d")
+
+    def __init__(self, data_x=None, data_y=None):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c2 = 0.0
+        if data_x is not None or data_y is not None:
+            self.extend(data_x, data_y)
+
+    # Updates #########################################################
+
+    def push(self, x: float, y: float) -> None:
+        """Add a single (x, y) pair to the accumulator."""
+        n = self.n + 1
+        delta_x = x - self.mean_x
+        delta_y = y - self.mean_y
+        self.mean_x += delta_x / n
+        self.mean_y += delta_y / n
+        # products of the old and the updated differences
+        self.m2_x += delta_x * (x - self.mean_x)
+        self.m2_y += delta_y * (y - self.mean_y)
+        self.c2 += delta_x * (y - self.mean_y)
+        self.n = n
+
+    def extend(self, data_x, data_y) -> None:
+        """Add the pairs of two iterables of equal length.
+
+        Raises ValueError, after adding the pairs before it, if one
+        iterable runs out before the other."""
+        from itertools import zip_longest
+        push = self.push
+        missing = object()
+        for x, y in zip_longest(data_x, data_y, fillvalue=missing):
+            if x is missing or y is missing:
+                raise ValueError("data_x and data_y are not of equal length.")
+            push(x, y)
+
+    def merge(self, other: "StatCoMoments") -> "StatCoMoments":
+        """Combine the co-moments of another accumulator into this one.
+
+        Return self, so merges can be chained."""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean_x, self.mean_y = other.n, other.mean_x, other.mean_y
+            self.m2_x, self.m2_y, self.c2 = other.m2_x, other.m2_y, other.c2
+            return self
+        na, nb = self.n, other.n
+        n = na + nb
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        weight = na * nb / n
+        self.m2_x += other.m2_x + delta_x * delta_x * weight
+        self.m2_y += other.m2_y + delta_y * delta_y * weight
+        self.c2 += other.c2 + delta_x * delta_y * weight
+        self.mean_x += delta_x * nb / n
+        self.mean_y += delta_y * nb / n
+        self.n = n
+        return self
+
+    def copy(self) -> "StatCoMoments":
+        """Return an independent copy of the accumulator."""
+        return StatCoMoments().merge(self)
+
+    # Serialization ###################################################
+
+    def to_bytes(self) -> bytes:
+        """Return the accumulator packed into 48 bytes."""
+        return self._struct.pack(self.n, self.mean_x, self.mean_y,
+                                 self.m2_x, self.m2_y, self.c2)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatCoMoments":
+        """Return the accumulator packed by to_bytes()."""
+        comoments = cls()
+        (comoments.n, comoments.mean_x, comoments.mean_y,
+         comoments.m2_x, comoments.m2_y, comoments.c2) = cls._struct.unpack(data)
+        return comoments
+
+    def __reduce__(self):
+        return type(self).from_bytes, (self.to_bytes(),)
+
+    # Statistics ######################################################
+
+    def get_cov(self, is_population=False) -> float:
+        """Return the sample (or population) covariance of x and y.
+
+        .. math::
+            s_{xy} = \\frac{C_2}{n - 1}
+        """
+        if is_population:
+            return float(self.c2 / self.n)
+        return float(self.c2 / (self.n - 1))
+
+    def get_corr(self) -> float:
+        """Return the Pearson correlation coefficient of x and y.
+
+        .. math::
+            r = \\frac{C_2}{\\sqrt{M_{2,x} M_{2,y}}}
+        """
+        from math import sqrt
+        return float(self.c2 / sqrt(self.m2_x * self.m2_y))
+
+    def get_r_squared(self) -> float:
+        """Return the coefficient of determination of the regression of
+        y on x, i.e. the squared correlation."""
+        return self.get_corr() ** 2
+
+    def get_slope(self) -> float:
+        """Return the least squares slope of the regression of y on x.
+
+        .. math::
+            b = \\frac{C_2}{M_{2,x}}
+        """
+        return float(self.c2 / self.m2_x)
+
+    def get_intercept(self) -> float:
+        """Return the least squares intercept of the regression of y on x.
+
+        .. math::
+            a = \\bar{y} - b\\bar{x}
+        """
+        return float(self.mean_y - self.get_slope() * self.mean_x)
+
+    def _get_residual_var(self) -> float:
+        """Return the residual variance of the regression, with n - 2
+        degrees of freedom."""
+        residual_m2 = self.m2_y - self.c2 * self.c2 / self.m2_x
+        # rounding can leave a perfect fit slightly negative
+        return max(residual_m2, 0.0) / (self.n - 2)
+
+    def get_sterr_slope(self) -> float:
+        """Return the standard error of the slope.
+
+        .. math::
+            SE_b = \\sqrt{\\frac{s^2_{resid}}{M_{2,x}}}
+        """
+        from math import sqrt
+        return sqrt(self._get_residual_var() / self.m2_x)
+
+    def get_sterr_intercept(self) -> float:
+        """Return the standard error of the intercept.
+
+        .. math::
+            SE_a = \\sqrt{s^2_{resid}(\\frac{1}{n} + \\frac{\\bar{x}^2}{M_{2,x}})}
+        """
+        from math import sqrt
+        return sqrt(self._get_residual_var()
+                    * (1 / self.n + self.mean_x * self.mean_x / self.m2_x))
+
+    def __repr__(self):
+        return (f"StatCoMoments(n={self.n}, mean_x={self.mean_x}, "
+                f"mean_y={self.mean_y}, c2={self.c2})")
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,232 @@
+"""statmultitest.py
+
+Contains the class StatMultiTest, a collection of methods which run the
+hypothesis test of get_score_hyp on many metrics at once, and adjust
+their p-values for multiple comparisons (Benjamini-Hochberg or Holm).
+
+Each metric is tested from its moments (n, mean, m2) alone, taken from
+its data in a single pass, or read from a StatSummary or StatMoments,
+so no StatBasket is built. The tests can be spread over a pool of
+worker processes; the adjustment then runs once over all p-values."""
+
+# Standard System Imports
+from collections import deque
+from itertools import islice
+from math import fsum, nan
+from operator import sub
+
+# Local Imports
+from statbasket.statmethods import StatMe as sm
+from statbasket.statmoments import StatMoments
+from statbasket.statsummary import StatSummary
+
+
+def _get_moments(sample) -> tuple:
+    """Return (n, mean, m2) of a data set, StatSummary or StatMoments,
+    or (0, 0.0, 0.0) for None."""
+    if sample is None:
+        return 0, 0.0, 0.0
+    if isinstance(sample, StatSummary):
+        return sample.n, sample.mean, sample.get_m2()
+    if isinstance(sample, StatMoments):
+        return sample.n, sample.mean, sample.m2
+    if not isinstance(sample, (tuple, list)):
+        raise ValueError(f"Sample is of type '{type(sample).__name__}'. Acceptable "
+                         f"types: 'tuple', 'list', 'StatSummary', 'StatMoments'")
+    n = len(sample)
+    if n == 0:
+        return 0, 0.0, 0.0
+    try:
+        mean = fsum(sample) / n
+    except TypeError:
+        raise ValueError("One or more values in dataset are non-numeric.") from None
+    return n, mean, fsum((x - mean) ** 2 for x in sample)
+
+
+def _test_metric(name, first, second, options: dict) -> dict:
+    """Return the score and p-value of one metric, see StatMultiTest.test."""
+    samples_dependent = options["samples_dependent"]
+    moments_diff = None
+    if samples_dependent and second is not None:
+        if not isinstance(first, (tuple, list)) or not isinstance(second, (tuple, list)):
+            raise ValueError(f"Metric {name!r}: dependent samples need both data sets, "
+                             f"or the summary of their differences alone.")
+        if len(first) != len(second):
+            raise ValueError(f"Metric {name!r}: samples are not of equal length.")
+        moments_diff = _get_moments(list(map(sub, first, second)))
+    moments1 = _get_moments(first)
+    moments2 = _get_moments(second)
+    n1, n2 = moments1[0], moments2[0]
+    try:
+        score, score_type, test_type = sm._get_score_hyp_moments(
+            moments1, moments2, h0=options["h0"], samples_dependent=samples_dependent,
+            is_population=options["is_population"], verbose=True,
+            moments_diff=moments_diff)
+    except ZeroDivisionError:
+        # e.g. no variation in the data
+        return {"name": name, "n1": n1, "n2": n2, "score": nan, "score_type": None,
+                "test_type": None, "p": nan}
+    tail = options["tail"]
+    if score_type == "z":
+        p = sm.get_p_z(score, tail=tail)
+    else:
+        df = n1 + n2 - 2 if test_type == "two pop, unk var" else n1 - 1
+        p = sm.get_p_t(score, df, tail=tail)
+    return {"name": name, "n1": n1, "n2": n2, "score": score, "score_type": score_type,
+            "test_type": test_type, "p": p}
+
+
+def _test_chunk(task: tuple) -> list:
+    """Return _test_metric of each (name, first, second) of a chunk.
+
+    task = (items, options)"""
+    items, options = task
+    return [_test_metric(name, first, second, options) for name, first, second in items]
+
+
+class StatMultiTest:
+    """
+    A class of class methods used to test many metrics at once.
+
+    Example Usage:
+        >>> from statbasket import StatMultiTest
+        >>> metrics = {"clicks": (clicks_a, clicks_b), "revenue": (revenue_a, revenue_b)}
+        >>> for row in StatMultiTest.test(metrics, adjust="bh"):
+        ...     print(row["name"], row["p_adjusted"], row["reject"])
+        >>> StatMultiTest.adjust_p_values((0.01, 0.04, 0.03), method="holm")
+        [0.03, 0.06, 0.06]
+
+    Methods:
+    _____________
+    test
+        Return the score, p-value and adjusted p-value of each metric
+    adjust_p_values
+        Return p-values adjusted for multiple comparisons
+    """
+
+    _adjust_methods = ("bh", "holm", "none")
+
+    @classmethod
+    def adjust_p_values(cls, p_values: tuple or list, method: str = "bh") -> list:
+        """Return the p-values adjusted for multiple comparisons, in the
+        same order.
+
+        method="bh" (Benjamini-Hochberg) controls the false discovery
+        rate, "holm" (Holm-Bonferroni) the family-wise error rate, and
+        "none" returns the p-values unchanged. nan p-values are left
+        nan, and not counted as comparisons.
+
+        .. math::
+            p^{BH}_{(i)} = \\min_{j \\geq i} \\min(1, \\frac{m}{j} p_{(j)})
+
+            p^{Holm}_{(i)} = \\max_{j \\leq i} \\min(1, (m - j + 1) p_{(j)})
+        """
+        if method not in cls._adjust_methods:
+            raise ValueError(f"method ({str(method)}) is not one of {cls._adjust_methods}.")
+        adjusted = list(p_values)
+        if method == "none":
+            return adjusted
+        # indexes of the valid p-values, smallest p-value first
+        order = sorted((i for i, p in enumerate(adjusted) if p == p), key=adjusted.__getitem__)
+        m = len(order)
+        if method == "bh":
+            running = 1.0
+            for rank in range(m, 0, -1):
+                i = order[rank - 1]
+                running = min(running, adjusted[i] * m / rank)
+                adjusted[i] = running
+        else:
+            running = 0.0
+            for rank in range(1, m + 1):
+                i = order[rank - 1]
+                running = max(running, min(1.0, adjusted[i] * (m - rank + 1)))
+                adjusted[i] = running
+        return adjusted
+
+    @staticmethod
+    def _iter_items(metrics):
+        """Yield (name, first, second) of each metric, metrics being a
+        dict {name: samples} or an iterable of (name, samples) pairs,
+        where samples is (first, second) or [first, second], or a lone
+        first sample."""
+        items = metrics.items() if isinstance(metrics, dict) else metrics
+        for name, samples in items:
+            if isinstance(samples, (tuple, list)) and len(samples) == 2 and not all(
+                    isinstance(x, (int, float)) for x in samples):
+                yield name, samples[0], samples[1]
+            else:
+                yield name, samples, None
+
+    @classmethod
+    def _iter_results(cls, items, options: dict, processes: int or None, chunk_size: int):
+        """Yield _test_metric results, in order, serially or from a pool
+        of worker processes with at most 2 * processes chunks in flight."""
+        if processes is None or processes <= 1:
+            for name, first, second in items:
+                yield _test_metric(name, first, second, options)
+            return
+        from multiprocessing import Pool
+        with Pool(processes) as pool:
+            pending = deque()
+            while True:
+                chunk = list(islice(items, chunk_size))
+                if len(chunk) == 0:
+                    break
+                pending.append(pool.apply_async(_test_chunk, ((chunk, options),)))
+                if len(pending) >= 2 * processes:
+                    yield from pending.popleft().get()
+            while len(pending) != 0:
+                yield from pending.popleft().get()
+
+    @classmethod
+    def test(cls, metrics, samples_dependent=False, is_population=False, h0: float = 0.0,
+             tail: str = "two", adjust: str = "bh", alpha: float = 0.05,
+             processes: int = None, chunk_size: int = 256) -> list:
+        """Return the hypothesis test of each metric, as get_score_hyp,
+        with its p-value adjusted for the number of metrics tested.
+
+        Parameters:
+            metrics: dict {name: samples}, or iterable of (name, samples)
+                pairs. samples is (first, second) or [first, second],
+                or a single sample for a one-population test of h0.
+                Each sample is a data set (tuple or list), a StatSummary
+                or StatMoments. Dependent samples are given as their two
+                data sets, or as the summary of their differences alone.
+            samples_dependent: optional, bool, default False, whether
+                each metric's samples are paired
+            is_population, h0: optional, as for get_score_hyp; h0 is
+                the difference of means tested for two samples
+            tail: optional, str, default "two", tail of the p-values
+            adjust: optional, str, default "bh", "bh", "holm" or "none",
+                see adjust_p_values
+            alpha: optional, float, default 0.05, level at which the
+                adjusted p-values are rejected
+            processes: optional, int, number of worker processes; None or
+                1 tests the metrics serially in the current process
+            chunk_size: optional, int, default 256, metrics per task
+
+        Return a list, in input order, of dicts of name, n1, n2, score,
+        score_type, test_type, p, p_adjusted and reject. Metrics whose
+        score is undefined (e.g. no variation) have nan score and p, and
+        are not counted as comparisons.
+        """
+        if tail not in ("two", "left", "right"):
+            raise ValueError(f"Tail attribute value (tail={str(tail)}) is not 'two', 'left', or 'right'.")
+        if adjust not in cls._adjust_methods:
+            raise ValueError(f"adjust ({str(adjust)}) is not one of {cls._adjust_methods}.")
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha ({str(alpha)}) must be between 0 and 1.")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size ({chunk_size}) must be positive.")
+        options = {"samples_dependent": samples_dependent, "is_population": is_population,
+                   "h0": h0, "tail": tail}
+        rows = list(cls._iter_results(cls._iter_items(metrics), options, processes, chunk_size))
+        adjusted = cls.adjust_p_values([row["p"] for row in rows], method=adjust)
+        for row, p_adjusted in zip(rows, adjusted):
+            row["p_adjusted"] = p_adjusted
+            row["reject"] = p_adjusted <= alpha
+        return rows
+
+
+if __name__ == "__main__":
+    pass
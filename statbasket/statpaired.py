@@ -0,0 +1,182 @@
+"""statpaired.py
+
+Contains the class StatPaired, which calculates the statistics of two
+dependent (paired) data sets in a single pass over both, without
+building the tuple of their differences.
+
+Classes:
+    StatPaired
+"""
+# Standard Library Imports
+from math import fsum
+
+# Local Imports
+from statbasket.statbasket import StatBasket
+from statbasket.statmethods import StatMe as sm
+from statbasket.statmoments import StatCoMoments, StatMoments
+from statbasket.statsummary import StatSummary
+
+
+class StatPaired:
+    """
+    Statistics of paired samples, as StatBasket(data_x, data_y,
+    samples_dependent=True), calculated in a single pass.
+
+    Summary:
+    __________
+    StatBasket builds the tuple of differences (data_diff), then makes
+    a pass over it for nearly every statistic, and keeps data_x and
+    data_y. StatPaired reads each (x, y) pair once, updating the moments
+    of x, y and their difference as it goes and appending the
+    difference to a list, which is then sorted in place for the median,
+    quartiles and mode. No data is kept, unless keep_diff=True.
+
+    The statistics of the differences are the full StatBasket set.
+    Those of x and y are the moment statistics only (n, mean, var,
+    stdev, sterr, cv, skew, moe, ci, min, max, range): their median,
+    quartiles and mode are None, as they would need x and y sorted.
+
+    >>> paired = StatPaired(before, after)
+    >>> paired.summary_diff.mean
+    >>> paired.get_basket().describe()
+
+    Parameters:
+    ___________
+    data_x, data_y : tuple or list
+        Paired data sets of equal length.
+    is_population, cl, tail : optional
+        As for StatBasket.
+    keep_diff : bool, optional
+        Default False. If True the differences are kept, in input
+        order, as the tuple data_diff.
+
+    Attributes:
+    __________
+    moments_x, moments_y, moments_diff : StatMoments
+        Moments of x, y and x - y.
+    summary_x, summary_y, summary_diff : StatSummary
+        Statistics of x, y and x - y.
+    data_diff : tuple or None
+        The differences, if keep_diff=True.
+
+    Methods:
+    _____________
+    get_basket
+        Return an equivalent StatBasket (holding no data)
+    get_comoments
+        Return the co-moments of x and y, for their correlation
+    calculate_test_score
+        Return the paired hypothesis test score
+    """
+
+    def __init__(self, data_x: tuple or list, data_y: tuple or list,
+                 is_population=False, cl=0.95, tail="two", keep_diff=False):
+        for data in (data_x, data_y):
+            if not isinstance(data, (tuple, list)):
+                raise ValueError(f"Data is of type '{type(data).__name__}'. "
+                                 f"Acceptable types: 'tuple', 'list'")
+        if len(data_x) != len(data_y):
+            raise ValueError(f"Samples are not of equal length.\n"
+                             f"Items in 'data_x' = {len(data_x)}\n"
+                             f"Items in 'data_y' = {len(data_y)}")
+        if len(data_x) < 2:
+            raise ValueError(f"Paired samples need at least 2 pairs, got {len(data_x)}.")
+        if not isinstance(is_population, bool):
+            raise ValueError(
+                f"is_population is of type '{type(is_population).__name__}', must be of type 'bool'.")
+        if cl not in (0.90, 0.95, 0.99):
+            raise ValueError(f"Confidence level (cl={str(cl)}) is not 0.90, 0.95, or 0.99.")
+        if tail not in ("two", "left", "right"):
+            raise ValueError(f"Tail attribute value (tail={str(tail)}) is not 'two', 'left', or 'right'.")
+        if not isinstance(keep_diff, bool):
+            raise ValueError(
+                f"keep_diff is of type '{type(keep_diff).__name__}', must be of type 'bool'.")
+        self.is_population = is_population
+        self.cl = cl
+        self.tail = tail
+
+        self.moments_x = StatMoments()
+        self.moments_y = StatMoments()
+        self.moments_diff = StatMoments()
+        diffs = list()
+        append = diffs.append
+        push_x = self.moments_x.push
+        push_y = self.moments_y.push
+        push_diff = self.moments_diff.push
+        for i, (x, y) in enumerate(zip(data_x, data_y)):
+            if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+                raise ValueError(f"One or more values in dataset are non-numeric \n"
+                                 f"(value_index, value_x, value_y): {(i, x, y)}")
+            diff = x - y
+            append(diff)
+            push_x(x)
+            push_y(y)
+            push_diff(diff)
+        self.data_diff = tuple(diffs) if keep_diff else None
+
+        # the only copy of the differences becomes the sorted copy
+        diffs.sort()
+        self.summary_x = self._get_summary(self.moments_x)
+        self.summary_y = self._get_summary(self.moments_y)
+        self.summary_diff = self._get_summary(self.moments_diff, diffs)
+
+    def _get_summary(self, moments: StatMoments, sorted_data: list = None) -> StatSummary:
+        """Return the StatSummary of moments, with the order statistics
+        of sorted_data if given.
+
+        The mean is taken exactly (with fsum, as StatMe.get_mean) when
+        sorted_data is given, else from the moments."""
+        is_pop = self.is_population
+        n = moments.n
+        mean = moments.get_mean() if sorted_data is None else float(fsum(sorted_data) / n)
+        sterr = moments.get_sterr(is_population=is_pop)
+        score_type, alpha, score = sm._get_score_critical_n(
+            n, cl=self.cl, is_population=is_pop, tail=self.tail, verbose=True)
+        moe = score * sterr
+        summary = StatSummary(
+            is_population=is_pop, n=n, df=n - 1, min=moments.min, max=moments.max,
+            range=float(moments.max - moments.min), mean=mean,
+            var=moments.get_var(is_population=is_pop),
+            stdev=moments.get_stdev(is_population=is_pop), sterr=sterr,
+            cv=moments.get_stdev(is_population=is_pop) / mean,
+            skew=moments.get_skew(is_population=is_pop),
+            score_critical_type=score_type, alpha=alpha, score_critical=score,
+            moe=moe, ci=(mean - moe, mean + moe))
+        if sorted_data is not None:
+            summary.quartiles = sm._get_quartile_data_sorted(sorted_data)
+            summary.median = summary.quartiles[1]
+            summary.mode = sm._get_mode_sorted(sorted_data)
+        return summary
+
+    def get_basket(self) -> StatBasket:
+        """Return the StatBasket of the paired samples, holding no data
+        (as with retain_data=False), e.g. for describe().
+
+        Its median, quartiles and mode of x and y are None."""
+        return StatBasket._from_summaries(
+            "dependent", ("DATA_DIFF",),
+            (self.summary_diff, self.summary_x, self.summary_y),
+            self.is_population, self.cl, self.tail, "parametric", False, float("nan"))
+
+    def get_comoments(self) -> StatCoMoments:
+        """Return the StatCoMoments of x and y, e.g. for get_corr(),
+        without another pass: since var(x - y) = var(x) + var(y)
+        - 2 cov(x, y), the co-moment follows from the three moments."""
+        comoments = StatCoMoments()
+        comoments.n = self.moments_x.n
+        comoments.mean_x, comoments.m2_x = self.moments_x.mean, self.moments_x.m2
+        comoments.mean_y, comoments.m2_y = self.moments_y.mean, self.moments_y.m2
+        comoments.c2 = (self.moments_x.m2 + self.moments_y.m2 - self.moments_diff.m2) / 2
+        return comoments
+
+    def calculate_test_score(self, h0: float = 0.0, verbose=False):
+        """Return the paired hypothesis test score, as
+        StatBasket.calculate_test_score."""
+        return self.get_basket().calculate_test_score(h0=h0, verbose=verbose)
+
+    def __repr__(self):
+        return f"StatPaired(n={self.summary_diff.n})"
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,168 @@
+"""statprofile.py
+
+Contains the class StatProfiler, an opt-in profiler which records the
+wall time, number of full data passes and number of sorts spent on each
+statistic calculated by StatMe or StatBasket.
+
+Profiling costs nothing unless a profiler is used: StatMe itself is
+never modified, instead the profiler provides an instrumented subclass
+of StatMe (StatProfiler.stat_me) whose methods report to it."""
+
+# Standard System Imports
+import threading
+import time
+from contextlib import contextmanager
+
+# Local Imports
+from statbasket.statmethods import StatMe
+
+
+class StatProfiler:
+    """
+    Profiler of StatMe and StatBasket statistics.
+
+    Every StatMe method call made while profiling adds its own cost
+    (see _costs) to the statistic being measured, so the passes and
+    sorts of a statistic include those of every method it calls, e.g.
+    get_ci includes the pass of get_mean and get_var.
+
+    Example Usage:
+        >>> from statbasket import StatBasket, StatProfiler
+        >>> profiler = StatProfiler()
+        >>> basket = StatBasket((1, 2, 3, 4, 4, 5), profiler=profiler)
+        >>> profiler.report()["quartiles"]
+        {'calls': 1, 'time': 1.1e-05, 'passes': 1, 'sorts': 1}
+        >>> profiler.stat_me.get_median((1, 2, 3))
+        2.0
+
+    Parameters:
+    ___________
+    callback : callable, optional
+        Called with a dict {"stat", "time", "passes", "sorts"} each time
+        a statistic is measured, e.g. to export it to a metrics system.
+
+    Methods:
+    _____________
+    measure
+        Context manager, attributes all StatMe calls inside it to a label
+    report
+        Return the totals per statistic
+    reset
+        Clear the recorded totals
+    """
+
+    # (full data passes, sorts) made by each StatMe method's own body,
+    # not counting the StatMe methods it calls. Methods not listed here
+    # make no pass over the data.
+    _costs = {
+        "get_min": (1, 0),
+        "get_max": (1, 0),
+        "get_mean": (1, 0),
+        "get_median": (1, 1),
+        "get_quartile_data": (1, 1),
+        "get_outlier_data": (1, 0),
+        "get_mode": (1, 0),
+        "get_skew": (1, 0),
+        "get_var": (1, 0),
+        "get_data_diff": (1, 0),
+        # a selection pass instead of the sort for few ranks of large
+        # data, and no sort if is_sorted, are not distinguished
+        "get_percentiles": (1, 1),
+        # p-values of a score, no data
+        "get_p_f": (0, 0),
+        "get_p_t": (0, 0),
+        "get_p_z": (0, 0),
+    }
+
+    def __init__(self, callback=None):
+        if callback is not None and not callable(callback):
+            raise ValueError(f"callback of type '{type(callback).__name__}' is not callable.")
+        self.callback = callback
+        self._totals = dict()
+        self._lock = threading.Lock()
+        # Stack of [passes, sorts] of the statistics being measured
+        self._local = threading.local()
+        self.stat_me = self._create_stat_me()
+
+    def _get_stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = list()
+        return stack
+
+    def _create_stat_me(self) -> type:
+        """Return a subclass of StatMe whose methods report to self."""
+        from inspect import getattr_static
+        namespace = dict()
+        for name in dir(StatMe):
+            attribute = getattr_static(StatMe, name)
+            if isinstance(attribute, classmethod):
+                namespace[name] = classmethod(self._wrap(name, attribute.__func__))
+        return type("ProfiledStatMe", (StatMe,), namespace)
+
+    def _wrap(self, name: str, function):
+        """Return function, instrumented to report its cost to self."""
+        profiler = self
+        passes, sorts = self._costs.get(name, (0, 0))
+
+        def profiled_method(cls, *args, **kwargs):
+            stack = profiler._get_stack()
+            if len(stack) == 0:
+                # Called directly, the method is the statistic measured
+                with profiler.measure(name):
+                    return profiled_method(cls, *args, **kwargs)
+            stack[-1][0] += passes
+            stack[-1][1] += sorts
+            return function(cls, *args, **kwargs)
+
+        profiled_method.__name__ = function.__name__
+        profiled_method.__doc__ = function.__doc__
+        return profiled_method
+
+    @contextmanager
+    def measure(self, stat: str):
+        """Attribute the time, passes and sorts of all StatMe calls made
+        inside the with block to stat."""
+        stack = self._get_stack()
+        counts = [0, 0]
+        stack.append(counts)
+        start = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if len(stack) != 0:
+                # a nested measurement also counts towards its parent
+                stack[-1][0] += counts[0]
+                stack[-1][1] += counts[1]
+            self._record(stat, elapsed, counts[0], counts[1])
+
+    def _record(self, stat: str, elapsed: float, passes: int, sorts: int) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(
+                stat, {"calls": 0, "time": 0.0, "passes": 0, "sorts": 0})
+            totals["calls"] += 1
+            totals["time"] += elapsed
+            totals["passes"] += passes
+            totals["sorts"] += sorts
+        if self.callback is not None:
+            self.callback({"stat": stat, "time": elapsed,
+                           "passes": passes, "sorts": sorts})
+
+    def report(self) -> dict:
+        """Return {stat: {"calls", "time", "passes", "sorts"}}, with the
+        totals recorded for each statistic, slowest first."""
+        with self._lock:
+            ordered = sorted(self._totals.items(),
+                             key=lambda item: item[1]["time"], reverse=True)
+            return {stat: dict(totals) for stat, totals in ordered}
+
+    def reset(self) -> None:
+        """Clear all recorded totals."""
+        with self._lock:
+            self._totals.clear()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,306 @@
+"""statresample.py
+
+Contains the class StatResample, a collection of methods for
+resampling statistics (bootstrap confidence intervals and permutation
+tests), which can run their resamples across a pool of worker
+processes.
+
+Resamples are split into fixed-size chunks and every chunk draws from
+its own random generator, seeded from (seed, chunk number). Results
+therefore depend only on the seed, never on how many processes ran the
+chunks."""
+
+# Standard System Imports
+from array import array
+from math import fsum
+
+# Local Imports
+from statbasket.statmethods import StatMe as sm
+
+# Data buffer of the current worker process, set by _init_worker
+_shared_data = None
+
+
+def _init_worker(shared_array) -> None:
+    """Pool initializer, exposes the shared data buffer to the worker."""
+    global _shared_data
+    _shared_data = memoryview(shared_array).cast("B").cast("d")
+
+
+def _chunk_rng(seed: int, chunk_index: int):
+    """Return the random generator of a single chunk."""
+    from random import Random
+    # str seeds are hashed with sha512, so are stable across processes
+    return Random(f"{seed}:{chunk_index}")
+
+
+def _bootstrap_chunk(task: tuple) -> list:
+    """Return the statistic of each resample in one chunk.
+
+    task = (statistic, seed, chunk_index, n_resamples, data), where data
+    is None in worker processes, which read the shared buffer instead."""
+    statistic, seed, chunk_index, n_resamples, data = task
+    if data is None:
+        data = _shared_data
+    n = len(data)
+    rng = _chunk_rng(seed, chunk_index)
+    indices = range(n)
+    read = data.__getitem__
+    estimates = list()
+    for _ in range(n_resamples):
+        resample_indices = rng.choices(indices, k=n)
+        if statistic == "get_mean":
+            # no need to build the resample for the mean
+            estimates.append(fsum(map(read, resample_indices)) / n)
+        elif isinstance(statistic, str):
+            estimates.append(getattr(sm, statistic)(list(map(read, resample_indices))))
+        else:
+            estimates.append(statistic(list(map(read, resample_indices))))
+    return estimates
+
+
+def _permutation_chunk(task: tuple) -> int:
+    """Return how many permutations in one chunk are at least as extreme
+    as the observed statistic.
+
+    task = (samples_dependent, n1, observed, tail, seed, chunk_index,
+    n_permutations, data). For independent samples, data holds the first
+    sample followed by the second and labels are permuted; for dependent
+    samples data holds the differences and their signs are flipped."""
+    samples_dependent, n1, observed, tail, seed, chunk_index, n_permutations, data = task
+    if data is None:
+        data = _shared_data
+    n = len(data)
+    rng = _chunk_rng(seed, chunk_index)
+    read = data.__getitem__
+    # differences within rounding of the observed value count as ties
+    tolerance = 1e-9 * max(1.0, abs(observed))
+    count = 0
+    if samples_dependent:
+        from operator import mul
+        signs = (1.0, -1.0)
+    else:
+        indices = range(n)
+        n2 = n - n1
+        total = fsum(data)
+    for _ in range(n_permutations):
+        if samples_dependent:
+            statistic = fsum(map(mul, rng.choices(signs, k=n), data)) / n
+        else:
+            sum1 = fsum(map(read, rng.sample(indices, n1)))
+            statistic = sum1 / n1 - (total - sum1) / n2
+        if tail == "two":
+            count += abs(statistic) >= abs(observed) - tolerance
+        elif tail == "right":
+            count += statistic >= observed - tolerance
+        else:
+            count += statistic <= observed + tolerance
+    return count
+
+
+class StatResample:
+    """
+    A class of class methods used to perform resampling statistics.
+
+    Example Usage:
+        >>> from statbasket.statresample import StatResample as sr
+        >>> data = (13, 26, 41, 35, 12)
+        >>> sr.get_ci_bootstrap(data, statistic="get_median", seed=1)
+
+    Methods:
+    _____________
+    get_bootstrap_estimates
+        Return the statistic computed on every bootstrap resample
+    get_ci_bootstrap
+        Return a bootstrap (percentile) confidence interval
+    get_p_permutation
+        Return the p-value of a two-sample permutation test
+    """
+
+    @staticmethod
+    def _get_seed(seed: int or None) -> int:
+        """Return seed, or a fresh random seed if seed is None."""
+        if seed is None:
+            from random import SystemRandom
+            return SystemRandom().getrandbits(64)
+        return seed
+
+    @staticmethod
+    def _iter_chunks(function, tasks: list, data, processes: int or None):
+        """Yield function(task) for each task, in order, serially or from
+        a pool of worker processes.
+
+        When processes > 1, data is copied once into shared memory and
+        the tasks sent to the workers carry no data. Closing the
+        generator early terminates the pool."""
+        if processes is None or processes <= 1 or len(tasks) == 1:
+            buffer = array("d", data)
+            for task in tasks:
+                yield function(task + (buffer,))
+            return
+        from multiprocessing import Pool
+        from multiprocessing.sharedctypes import RawArray
+        shared_array = RawArray("d", len(data))
+        shared_array[:] = data
+        with Pool(processes, initializer=_init_worker,
+                  initargs=(shared_array,)) as pool:
+            yield from pool.imap(function, [task + (None,) for task in tasks])
+
+    @staticmethod
+    def _get_percentile_sorted(sorted_data: list, q: float) -> float:
+        """Return the q-th quantile of sorted data, linearly interpolated."""
+        position = q * (len(sorted_data) - 1)
+        lower_index = int(position)
+        upper_index = min(lower_index + 1, len(sorted_data) - 1)
+        fraction = position - lower_index
+        return float(sorted_data[lower_index]
+                     + (sorted_data[upper_index] - sorted_data[lower_index]) * fraction)
+
+    @classmethod
+    def get_bootstrap_estimates(
+            cls, data: tuple or list, statistic="get_mean",
+            n_resamples: int = 2000, seed: int = None,
+            processes: int = None, chunk_size: int = 250) -> tuple:
+        """Return a tuple of the statistic computed on each resample.
+
+        Parameters:
+            data: tuple or list, the dataset
+            statistic: optional, default "get_mean", name of a StatMe method
+                taking only the data (e.g. "get_median", "get_var"), or a
+                picklable function of a list of values
+            n_resamples: optional, int, default 2000, number of resamples
+            seed: optional, int, seed for reproducible resamples
+            processes: optional, int, number of worker processes; None or 1
+                runs serially in the current process
+            chunk_size: optional, int, default 250, resamples per task
+        """
+        sm._data_validation(data)
+        if sm.get_n(data) == 0:
+            raise ValueError("Cannot resample an empty dataset.")
+        if isinstance(statistic, str) and not hasattr(sm, statistic):
+            raise ValueError(f"StatMe has no statistic '{statistic}'.")
+        if n_resamples < 1 or chunk_size < 1:
+            raise ValueError(f"n_resamples ({n_resamples}) and chunk_size "
+                             f"({chunk_size}) must be positive.")
+        seed = cls._get_seed(seed)
+        tasks = list()
+        for chunk_index, start in enumerate(range(0, n_resamples, chunk_size)):
+            tasks.append((statistic, seed, chunk_index,
+                          min(chunk_size, n_resamples - start)))
+        estimates = list()
+        for chunk_estimates in cls._iter_chunks(_bootstrap_chunk, tasks, data, processes):
+            estimates.extend(chunk_estimates)
+        return tuple(estimates)
+
+    @classmethod
+    def get_ci_bootstrap(
+            cls, data: tuple or list, statistic="get_mean", cl=0.95,
+            tail="two", n_resamples: int = 2000, seed: int = None,
+            processes: int = None, chunk_size: int = 250) -> tuple:
+        """Return a tuple of lower/upper bootstrap confidence interval
+        boundaries of the statistic.
+
+        The percentile interval is used, i.e. the bounds are the alpha
+        and 1 - alpha quantiles of the bootstrap estimates, with alpha
+        determined by cl and tail in the same way as StatMe.get_ci.
+        See get_bootstrap_estimates for the remaining parameters."""
+        alpha = sm._get_alpha(cl=cl, tail=tail)
+        estimates = sorted(cls.get_bootstrap_estimates(
+            data, statistic=statistic, n_resamples=n_resamples, seed=seed,
+            processes=processes, chunk_size=chunk_size))
+        return (cls._get_percentile_sorted(estimates, alpha),
+                cls._get_percentile_sorted(estimates, 1 - alpha))
+
+    @classmethod
+    def get_p_permutation(
+            cls, data1: tuple or list, data2: tuple or list, h0: float = 0.0,
+            samples_dependent=False, cl=0.95, tail="two",
+            n_permutations: int = 10000, seed: int = None,
+            processes: int = None, chunk_size: int = 500,
+            stop_early=True, verbose=False) -> float or tuple:
+        """
+        Return the p-value of a permutation test of the difference in
+        means of two samples, a non-parametric counterpart to the
+        two-population tests of StatMe.get_score_hyp.
+
+        Independent samples are tested by randomly re-assigning values
+        to the two samples; dependent samples by randomly flipping the
+        sign of each difference (data1 - data2). The null hypothesis is
+        mean(data1) - mean(data2) = h0.
+
+        .. math::
+            p = \\frac{1 + \\#\\{|T^*| \\geq |T|\\}}{1 + B}
+
+        If stop_early=True, chunks are evaluated in order and the test
+        stops once the 99% confidence interval of the running p-value
+        lies entirely above or below alpha = 1 - cl, i.e. once more
+        permutations could not change the test's conclusion. Because the
+        stopping rule is applied chunk by chunk, the result for a given
+        seed does not depend on the number of processes.
+
+        Parameters:
+            data1: tuple or list, first data set
+            data2: tuple or list, second data set
+            h0: optional, float, default 0.0, the null hypothesis difference
+            samples_dependent: optional, bool, default False, whether the samples are dependent.
+            cl: optional, float, default 0.95, confidence level of the test
+            tail: optional, str, default "two", "two", "left" or "right"
+            n_permutations: optional, int, default 10000, maximum number of permutations
+            seed: optional, int, seed for reproducible permutations
+            processes: optional, int, number of worker processes
+            chunk_size: optional, int, default 500, permutations per task
+            stop_early: optional, bool, default True, stop once the result is resolved
+            verbose: optional, bool, default False, when checked return tuple of
+                (p-value, observed statistic, permutations run)
+        """
+        sm._data_validation(data1)
+        sm._data_validation(data2)
+        from math import sqrt
+        n1 = sm.get_n(data1)
+        n2 = sm.get_n(data2)
+        if n1 == 0 or n2 == 0:
+            raise ValueError("Permutation tests require two non-empty samples.")
+        if tail not in ("two", "left", "right"):
+            raise ValueError(f"Tail attribute value (tail={str(tail)}) is not 'two', 'left', or 'right'.")
+        if n_permutations < 1 or chunk_size < 1:
+            raise ValueError(f"n_permutations ({n_permutations}) and chunk_size "
+                             f"({chunk_size}) must be positive.")
+        if samples_dependent:
+            # centre the differences on h0, so their signs are exchangeable
+            data = [x - h0 for x in sm.get_data_diff(data1, data2)]
+            observed = fsum(data) / n1
+        else:
+            # shift the first sample by h0, so the samples are exchangeable
+            data = [x - h0 for x in data1] + list(data2)
+            observed = fsum(data[:n1]) / n1 - fsum(data[n1:]) / n2
+        seed = cls._get_seed(seed)
+        tasks = list()
+        for chunk_index, start in enumerate(range(0, n_permutations, chunk_size)):
+            tasks.append((samples_dependent, n1, observed, tail, seed, chunk_index,
+                          min(chunk_size, n_permutations - start)))
+
+        alpha = 1 - cl
+        z = sm.t_table[999][0.005]
+        count = 0
+        permutations_run = 0
+        chunk_results = cls._iter_chunks(_permutation_chunk, tasks, data, processes)
+        try:
+            for task, chunk_count in zip(tasks, chunk_results):
+                count += chunk_count
+                permutations_run += task[-1]
+                if stop_early:
+                    p_estimate = (count + 1) / (permutations_run + 1)
+                    moe = z * sqrt(p_estimate * (1 - p_estimate) / permutations_run)
+                    if p_estimate + moe < alpha or p_estimate - moe > alpha:
+                        break
+        finally:
+            chunk_results.close()
+        p_value = (count + 1) / (permutations_run + 1)
+        if verbose:
+            return p_value, observed + h0, permutations_run
+        else:
+            return p_value
+
+
+if __name__ == "__main__":
+    pass
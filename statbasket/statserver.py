@@ -0,0 +1,419 @@
+"""statserver.py
+
+Contains the class StatServer, a small asyncio server holding named
+StatStream accumulators which many processes can share, and the clients
+StatClient (blocking sockets) and AsyncStatClient (asyncio).
+
+The server listens on TCP (by default on localhost only) or on a Unix
+socket, in-process or as a daemon:
+
+    python -m statbasket.statserver --port 8765
+    python -m statbasket.statserver --unix /tmp/statbasket.sock
+
+Protocol:
+    Every message is a frame: a 4 byte big-endian payload length, then
+    the payload. A request payload is a 1 byte operation, a 2 byte
+    big-endian name length, the UTF-8 name, and a body:
+
+        P  push    body: little-endian float64 values
+        Q  query   body: JSON {"stat": ..., and describe() options}
+        D  drop    body: empty
+        L  list    body: empty (name is empty)
+
+    A reply payload is b"+" and a JSON value on success, or b"-" and a
+    UTF-8 error message.
+
+Classes:
+    StatServer
+    StatClient
+    AsyncStatClient
+"""
+# Standard Library Imports
+import json
+import sys
+from array import array
+from struct import Struct
+
+# Local Imports
+from statbasket.statstream import StatStream, _build_basket
+from statbasket.statsummary import StatSummary
+
+_frame_header = Struct(">I")
+_name_length = Struct(">H")
+# Largest payload accepted, i.e. 8M values per push
+_max_frame = 64 * 2 ** 20
+
+# Statistics answered from the running moments, without a basket
+_moment_stats = ("n", "mean", "var", "stdev", "sterr", "cv", "skew", "min", "max")
+
+
+# Framing #############################################################
+
+def _encode_request(operation: bytes, name: str = str(), body: bytes = b"") -> bytes:
+    encoded_name = name.encode("utf-8")
+    payload = operation + _name_length.pack(len(encoded_name)) + encoded_name + body
+    return _frame_header.pack(len(payload)) + payload
+
+
+def _decode_request(payload: bytes) -> tuple:
+    """Return (operation, name, body) of a request payload."""
+    length, = _name_length.unpack_from(payload, 1)
+    start = 1 + _name_length.size
+    return (payload[:1], str(payload[start:start + length], "utf-8"),
+            payload[start + length:])
+
+
+def _encode_values(values) -> bytes:
+    packed = array("d", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _decode_values(body: bytes) -> array:
+    if len(body) % 8 != 0:
+        raise ValueError("Pushed values are not a whole number of float64 values.")
+    values = array("d")
+    values.frombytes(body)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _encode_reply(is_ok: bool, value) -> bytes:
+    if is_ok:
+        payload = b"+" + json.dumps(value).encode("utf-8")
+    else:
+        payload = b"-" + str(value).encode("utf-8")
+    return _frame_header.pack(len(payload)) + payload
+
+
+def _decode_reply(payload: bytes):
+    """Return the value of a reply, raising ValueError for an error reply."""
+    if payload[:1] == b"-":
+        raise ValueError(str(payload[1:], "utf-8"))
+    value = json.loads(payload[1:])
+    # tuples (ci, quartiles) are sent as JSON arrays
+    return tuple(value) if isinstance(value, list) else value
+
+
+# Server ##############################################################
+
+class StatServer:
+    """
+    asyncio server holding named StatStream accumulators.
+
+    Summary:
+    __________
+    Clients push batches of values to a name (creating its stream on
+    first use) and query a statistic of it: n, mean, var, stdev,
+    sterr, cv, skew, min and max are read from the running moments in
+    O(1); any other StatBasket attribute (median, quartiles, mode, ci,
+    ...) and describe() build the basket in an executor, so the event
+    loop keeps serving other clients meanwhile.
+
+    >>> server = StatServer(cl=0.99)
+    >>> host, port = await server.start_tcp()
+    >>> with StatClient((host, port)) as client:
+    ...     client.push("latency", (12.1, 14.3, 9.8))
+    ...     client.query("latency", "ci")
+    >>> await server.close()
+
+    Parameters:
+    ___________
+    executor : concurrent.futures.Executor, optional
+        Default None (the event loop's default), executor in which
+        baskets are built.
+    basket_options : optional
+        Keyword arguments given to the StatBasket of every stream, e.g.
+        is_population, cl, tail.
+
+    Attributes:
+    __________
+    streams : dict
+        {name: StatStream} of the streams held.
+    """
+
+    def __init__(self, executor=None, **basket_options):
+        self.executor = executor
+        self.basket_options = basket_options
+        self.streams = dict()
+        self._servers = list()
+
+    # Listening #######################################################
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> tuple:
+        """Listen on TCP, returning the (host, port) bound; port 0
+        picks a free port."""
+        import asyncio
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path: str) -> str:
+        """Listen on a Unix socket at path, returning path."""
+        import asyncio
+        server = await asyncio.start_unix_server(self._handle_connection, path)
+        self._servers.append(server)
+        return path
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled (e.g. by KeyboardInterrupt)."""
+        import asyncio
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+    async def close(self) -> None:
+        """Stop listening and wait for the listeners to close."""
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+
+    # Requests ########################################################
+
+    async def _handle_connection(self, reader, writer) -> None:
+        """Answer the requests of one client, in order, until it closes."""
+        import asyncio
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(_frame_header.size)
+                except asyncio.IncompleteReadError:
+                    break
+                length, = _frame_header.unpack(header)
+                if length > _max_frame:
+                    writer.write(_encode_reply(False, f"Frame of {length} bytes exceeds "
+                                                      f"the limit of {_max_frame} bytes."))
+                    break
+                payload = await reader.readexactly(length)
+                try:
+                    reply = _encode_reply(True, await self._dispatch(payload))
+                except Exception as error:
+                    # a bad request must not stop the server
+                    reply = _encode_reply(False, f"{type(error).__name__}: {error}")
+                writer.write(reply)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _get_stream(self, name: str) -> StatStream:
+        if name not in self.streams:
+            raise ValueError(f"No stream named '{name}'.")
+        return self.streams[name]
+
+    async def _dispatch(self, payload: bytes):
+        """Return the reply value of one request payload."""
+        operation, name, body = _decode_request(payload)
+        if operation == b"P":
+            values = _decode_values(body)
+            stream = self.streams.get(name)
+            if stream is None:
+                stream = self.streams[name] = StatStream(**self.basket_options)
+            stream.extend(values)
+            return len(stream)
+        if operation == b"Q":
+            return await self._query(self._get_stream(name), json.loads(body))
+        if operation == b"D":
+            return self.streams.pop(name, None) is not None
+        if operation == b"L":
+            return sorted(self.streams)
+        raise ValueError(f"Unknown operation {operation!r}.")
+
+    async def _query(self, stream: StatStream, request: dict):
+        """Return a statistic, or describe() output, of a stream."""
+        import asyncio
+        stat = request.pop("stat", None)
+        if stat in _moment_stats:
+            moments = stream.get_moments()
+            if stat in ("n", "min", "max"):
+                return getattr(moments, stat)
+            if stat == "mean":
+                return moments.get_mean()
+            is_population = self.basket_options.get("is_population", False)
+            return getattr(moments, "get_" + stat)(is_population=is_population)
+        if stat != "describe" and stat not in StatSummary.fields:
+            raise ValueError(f"Unknown statistic '{stat}'.")
+        loop = asyncio.get_running_loop()
+        basket = await loop.run_in_executor(
+            self.executor, _build_basket, stream.get_values(), self.basket_options)
+        if stat == "describe":
+            return basket.describe(**request)
+        return getattr(basket, stat)
+
+
+# Clients #############################################################
+
+class StatClient:
+    """
+    Blocking client of a StatServer.
+
+    >>> with StatClient(("127.0.0.1", 8765)) as client:
+    ...     client.push("latency", (12.1, 14.3, 9.8))
+    ...     print(client.describe("latency"))
+
+    Parameters:
+    ___________
+    address : tuple or str
+        (host, port) of a TCP server, or the path of a Unix socket.
+    timeout : float, optional
+        Default None (blocking), socket timeout in seconds.
+
+    Methods:
+    _____________
+    push, query, describe, drop, names, close
+        See AsyncStatClient, which has the same methods as coroutines.
+    """
+
+    def __init__(self, address: tuple or str, timeout: float = None):
+        import socket
+        if isinstance(address, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(address)
+        else:
+            self._socket = socket.create_connection(address, timeout=timeout)
+
+    def _receive_exactly(self, size: int) -> bytes:
+        chunks = list()
+        while size > 0:
+            chunk = self._socket.recv(size)
+            if not chunk:
+                raise ConnectionError("StatServer closed the connection.")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def _request(self, operation: bytes, name: str = str(), body: bytes = b""):
+        self._socket.sendall(_encode_request(operation, name, body))
+        length, = _frame_header.unpack(self._receive_exactly(_frame_header.size))
+        return _decode_reply(self._receive_exactly(length))
+
+    def push(self, name: str, values) -> int:
+        """Add values to the named stream, returning its size."""
+        return self._request(b"P", name, _encode_values(values))
+
+    def query(self, name: str, stat: str):
+        """Return a statistic (a StatBasket attribute) of the named stream."""
+        return self._request(b"Q", name, json.dumps({"stat": stat}).encode("utf-8"))
+
+    def describe(self, name: str, round_places=3, h0=None, format="table"):
+        """Return StatBasket.describe() of the named stream."""
+        request = {"stat": "describe", "round_places": round_places,
+                   "h0": h0, "format": format}
+        return self._request(b"Q", name, json.dumps(request).encode("utf-8"))
+
+    def drop(self, name: str) -> bool:
+        """Delete the named stream, returning whether it existed."""
+        return self._request(b"D", name)
+
+    def names(self) -> tuple:
+        """Return the names of the streams held by the server."""
+        return self._request(b"L")
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncStatClient:
+    """
+    asyncio client of a StatServer, created by connect().
+
+    >>> client = await AsyncStatClient.connect(("127.0.0.1", 8765))
+    >>> await client.push("latency", (12.1, 14.3, 9.8))
+    >>> await client.query("latency", "quartiles")
+    >>> await client.close()
+
+    Requests on one client are answered in order; use one client per
+    task to send requests concurrently.
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, address: tuple or str) -> "AsyncStatClient":
+        """Connect to (host, port) over TCP, or to a Unix socket path."""
+        import asyncio
+        if isinstance(address, str):
+            reader, writer = await asyncio.open_unix_connection(address)
+        else:
+            reader, writer = await asyncio.open_connection(*address)
+        return cls(reader, writer)
+
+    async def _request(self, operation: bytes, name: str = str(), body: bytes = b""):
+        self._writer.write(_encode_request(operation, name, body))
+        await self._writer.drain()
+        length, = _frame_header.unpack(await self._reader.readexactly(_frame_header.size))
+        return _decode_reply(await self._reader.readexactly(length))
+
+    async def push(self, name: str, values) -> int:
+        """Add values to the named stream, returning its size."""
+        return await self._request(b"P", name, _encode_values(values))
+
+    async def query(self, name: str, stat: str):
+        """Return a statistic (a StatBasket attribute) of the named stream."""
+        return await self._request(b"Q", name, json.dumps({"stat": stat}).encode("utf-8"))
+
+    async def describe(self, name: str, round_places=3, h0=None, format="table"):
+        """Return StatBasket.describe() of the named stream."""
+        request = {"stat": "describe", "round_places": round_places,
+                   "h0": h0, "format": format}
+        return await self._request(b"Q", name, json.dumps(request).encode("utf-8"))
+
+    async def drop(self, name: str) -> bool:
+        """Delete the named stream, returning whether it existed."""
+        return await self._request(b"D", name)
+
+    async def names(self) -> tuple:
+        """Return the names of the streams held by the server."""
+        return await self._request(b"L")
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+def main(argv: list = None) -> int:
+    """Run a StatServer until interrupted."""
+    import argparse
+    import asyncio
+    parser = argparse.ArgumentParser(
+        prog="python -m statbasket.statserver",
+        description="Serve named statistics streams over TCP or a Unix socket.")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default 8765)")
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket path instead")
+    parser.add_argument("--population", action="store_true",
+                        help="treat the data as populations")
+    parser.add_argument("--cl", type=float, choices=(0.90, 0.95, 0.99), default=0.95,
+                        help="confidence level (default 0.95)")
+    arguments = parser.parse_args(argv)
+
+    async def serve():
+        server = StatServer(is_population=arguments.population, cl=arguments.cl)
+        if arguments.unix is None:
+            address = await server.start_tcp(arguments.host, arguments.port)
+        else:
+            address = await server.start_unix(arguments.unix)
+        sys.stderr.write(f"statbasket server listening on {address}\n")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""statsharded.py
+
+Contains the class StatSharded, a thread-safe accumulator for values
+pushed by many threads, which keeps one shard per thread and merges the
+shards when read.
+
+Classes:
+    StatSharded
+"""
+# Standard Library Imports
+import threading
+from array import array
+
+# Local Imports
+from statbasket.statbasket import StatBasket
+from statbasket.statmoments import StatMoments
+from statbasket.statstream import _get_batch
+
+
+class _Shard:
+    """Values and moments pushed by one thread."""
+
+    __slots__ = ("lock", "values", "moments")
+
+    def __init__(self, keep_values: bool):
+        # only contended while a reader merges this shard
+        self.lock = threading.Lock()
+        self.values = array("d") if keep_values else None
+        self.moments = StatMoments()
+
+
+class StatSharded:
+    """
+    Accumulator which many threads can push to at once.
+
+    Summary:
+    __________
+    Each thread pushes into its own shard, guarded by the shard's own
+    lock, so pushes from different threads never wait on each other
+    (a shared lock is only taken the first time a thread pushes).
+    Reading merges the shards: get_moments() in time proportional to
+    the number of threads, get_basket() by joining the shards' values.
+    On free-threaded builds of CPython pushes run in parallel; under
+    the GIL they are serialized by the interpreter but still take no
+    shared lock.
+
+    >>> sharded = StatSharded(cl=0.99)
+    >>> # in each worker thread
+    >>> sharded.push(12.5)
+    >>> # in any thread
+    >>> sharded.get_basket().describe()
+
+    Parameters:
+    ___________
+    keep_values : bool, optional
+        Default True. If False only the moments are kept, in constant
+        memory per thread, and get_basket() is unavailable.
+    basket_options : optional
+        Keyword arguments given to StatBasket by get_basket(), e.g.
+        is_population, cl, tail.
+
+    Methods:
+    _____________
+    push, extend
+        Add one value, or many, from the calling thread
+    get_moments
+        Return the moments of every value pushed so far
+    get_basket
+        Return the StatBasket of every value pushed so far
+    """
+
+    def __init__(self, keep_values=True, **basket_options):
+        if not isinstance(keep_values, bool):
+            raise ValueError(
+                f"keep_values is of type '{type(keep_values).__name__}', must be of type 'bool'.")
+        self.keep_values = keep_values
+        self.basket_options = basket_options
+        self._shards = list()
+        self._shards_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_shard(self) -> _Shard:
+        """Return the calling thread's shard, creating it if needed."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard(self.keep_values)
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def push(self, x: float) -> None:
+        """Add a single value."""
+        if not isinstance(x, (int, float)):
+            raise ValueError(f"Value {str(x)} is of type '{type(x).__name__}', "
+                             f"must be int or float.")
+        shard = self._get_shard()
+        with shard.lock:
+            shard.moments.push(x)
+            if shard.values is not None:
+                shard.values.append(x)
+
+    def extend(self, data) -> None:
+        """Add every value of an iterable, as one batch.
+
+        Raises ValueError, adding none of them, if any is non-numeric."""
+        batch = _get_batch(data)
+        shard = self._get_shard()
+        with shard.lock:
+            shard.moments.extend(batch)
+            if shard.values is not None:
+                shard.values.extend(batch)
+
+    def _get_shards(self) -> list:
+        with self._shards_lock:
+            return list(self._shards)
+
+    def get_moments(self) -> StatMoments:
+        """Return the merged moments of every shard."""
+        merged = StatMoments()
+        for shard in self._get_shards():
+            with shard.lock:
+                merged.merge(shard.moments)
+        return merged
+
+    def get_values(self) -> array:
+        """Return every value pushed so far, grouped by thread."""
+        if not self.keep_values:
+            raise ValueError("StatSharded(keep_values=False) keeps no values.")
+        values = array("d")
+        for shard in self._get_shards():
+            with shard.lock:
+                values.extend(shard.values)
+        return values
+
+    def get_basket(self) -> StatBasket:
+        """Return the StatBasket of every value pushed so far.
+
+        The values are grouped by thread rather than in push order,
+        which changes no statistic beyond floating point rounding."""
+        return StatBasket(self.get_values().tolist(), **self.basket_options)
+
+    def __len__(self):
+        return sum(shard.moments.n for shard in self._get_shards())
+
+    def __repr__(self):
+        return f"StatSharded(n={len(self)}, shards={len(self._get_shards())})"
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,251 @@
+"""statstream.py
+
+Contains the classes StatStream, which accumulates a stream of values
+(compactly, in an array of floats) alongside their running moments, and
+AsyncStatStream, its asyncio counterpart, which consumes async
+iterators and computes baskets in an executor, off the event loop.
+
+Classes:
+    StatStream
+    AsyncStatStream
+"""
+# Standard Library Imports
+from array import array
+from struct import Struct
+
+# Local Imports
+from statbasket.statbasket import StatBasket
+from statbasket.statmoments import StatMoments
+
+
+def _build_basket(values: array, basket_options: dict) -> StatBasket:
+    """Return the StatBasket of values, run in an executor by
+    AsyncStatStream.snapshot (module level, so process pools can use it)."""
+    return StatBasket(values.tolist(), **basket_options)
+
+
+def _get_batch(data) -> array:
+    """Return the values of an iterable as an array of floats, raising
+    ValueError listing the (value_index, value) of every non-numeric
+    value. Also used by StatSharded.extend."""
+    if not isinstance(data, (tuple, list, array)):
+        # an iterator is consumed by array(), so could not be
+        # searched for the non-numeric values afterwards
+        data = list(data)
+    try:
+        return array("d", data)
+    except TypeError:
+        bad_values = tuple((i, x) for i, x in enumerate(data)
+                           if not isinstance(x, (int, float)))
+        raise ValueError(f"One or more values in dataset are non-numeric \n"
+                         f"(value_index, value): {bad_values}") from None
+
+
+class StatStream:
+    """
+    Accumulator of a stream of values, from which a StatBasket can be
+    built at any time.
+
+    Summary:
+    __________
+    Values are stored as 8 byte floats in an array.array, and running
+    moments (n, mean, var, ...) are kept alongside, so the moment
+    statistics can be read in O(1) without building a basket. Values are
+    validated and added a batch at a time by extend().
+
+    >>> stream = StatStream(cl=0.99)
+    >>> stream.extend((1, 2, 3))
+    >>> stream.push(4)
+    >>> stream.get_moments().get_mean()
+    2.5
+    >>> stream.get_basket().ci
+    (-1.2703492875329205, 6.2703492875329205)
+
+    Parameters:
+    ___________
+    data : iterable, optional
+        Initial values.
+    basket_options : optional
+        Keyword arguments given to StatBasket by get_basket(), e.g.
+        is_population, cl, tail.
+
+    Methods:
+    _____________
+    push, extend
+        Add one value, or many
+    get_moments
+        Return a copy of the running moments
+    get_values
+        Return a copy of the values
+    get_basket
+        Return the StatBasket of the values so far
+    to_bytes, from_bytes
+        Pack the stream into bytes, and back
+    """
+
+    # Header of to_bytes(), little-endian: length of the JSON encoded
+    # basket_options, number of values; then the options, the
+    # StatMoments bytes and the values, as native float64
+    _header = Struct("<Iq")
+
+    def __init__(self, data=None, **basket_options):
+        self.basket_options = basket_options
+        self._values = array("d")
+        self._moments = StatMoments()
+        if data is not None:
+            self.extend(data)
+
+    def push(self, x: float) -> None:
+        """Add a single value."""
+        self.extend((x,))
+
+    def extend(self, data) -> None:
+        """Add every value of an iterable, as one batch.
+
+        Raises ValueError, adding none of them, if any is non-numeric."""
+        batch = _get_batch(data)
+        self._moments.extend(batch)
+        self._values.extend(batch)
+
+    def get_moments(self) -> StatMoments:
+        """Return a copy of the running moments of the values."""
+        return self._moments.copy()
+
+    def get_values(self) -> array:
+        """Return a copy of the values, as an array of floats."""
+        return self._values[:]
+
+    def get_basket(self) -> StatBasket:
+        """Return the StatBasket of the values so far."""
+        return _build_basket(self._values, self.basket_options)
+
+    def to_bytes(self) -> bytes:
+        """Return the stream packed into bytes, see from_bytes().
+
+        basket_options must be JSON serializable."""
+        import json
+        options = json.dumps(self.basket_options).encode("utf-8")
+        return (self._header.pack(len(options), len(self._values)) + options
+                + self._moments.to_bytes() + self._values.tobytes())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatStream":
+        """Return the stream packed by to_bytes(), in time proportional
+        to the number of values held (the moments are not recomputed)."""
+        import json
+        data = memoryview(data)
+        options_size, n = cls._header.unpack_from(data)
+        offset = cls._header.size
+        moments_size = StatMoments._struct.size
+        if len(data) != offset + options_size + moments_size + 8 * n:
+            raise ValueError(f"Expected {offset + options_size + moments_size + 8 * n} "
+                             f"bytes for a StatStream, got {len(data)}.")
+        stream = cls(**json.loads(bytes(data[offset:offset + options_size])))
+        offset += options_size
+        stream._moments = StatMoments.from_bytes(data[offset:offset + moments_size])
+        stream._values.frombytes(data[offset + moments_size:])
+        return stream
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"StatStream(n={len(self)})"
+
+
+class AsyncStatStream:
+    """
+    asyncio counterpart of StatStream, for values arriving from async
+    sources such as sockets.
+
+    Summary:
+    __________
+    aextend() consumes an async iterator, adding its values to the
+    stream in batches of batch_size (so validation and storage cost is
+    paid per batch, not per value) and yielding to the event loop
+    between batches. snapshot() copies the values and builds their
+    StatBasket in an executor, so sorting and the other order
+    statistics never run on the event loop.
+
+    >>> stream = AsyncStatStream(batch_size=512)
+    >>> await stream.aextend(receive_samples())  # e.g. 1, 2, 3, 4
+    4
+    >>> basket = await stream.snapshot()
+    >>> basket.mean
+    2.5
+
+    Parameters:
+    ___________
+    batch_size : int, optional
+        Default 1024, number of values added to the stream at a time.
+    executor : concurrent.futures.Executor, optional
+        Default None (the event loop's default thread pool), executor in
+        which snapshot() builds baskets. A ProcessPoolExecutor keeps the
+        calculation from competing with the loop for the GIL; the values
+        are sent to it as a compact array.
+    basket_options : optional
+        Keyword arguments given to StatBasket, as for StatStream.
+
+    Attributes:
+    __________
+    stream : StatStream
+        The underlying stream, e.g. for stream.get_moments().
+    """
+
+    def __init__(self, batch_size: int = 1024, executor=None, **basket_options):
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+            raise ValueError(f"batch_size ({str(batch_size)}) must be a positive int.")
+        self.batch_size = batch_size
+        self.executor = executor
+        self.stream = StatStream(**basket_options)
+
+    def push(self, x: float) -> None:
+        """Add a single value."""
+        self.stream.push(x)
+
+    def extend(self, data) -> None:
+        """Add every value of a (synchronous) iterable."""
+        self.stream.extend(data)
+
+    async def aextend(self, async_iterable) -> int:
+        """Add every value of an async iterable, returning the number
+        of values added."""
+        import asyncio
+        batch = list()
+        count = 0
+        async for each_item in async_iterable:
+            batch.append(each_item)
+            if len(batch) >= self.batch_size:
+                self.stream.extend(batch)
+                count += len(batch)
+                batch.clear()
+                # a source which is always ready would otherwise hold the loop
+                await asyncio.sleep(0)
+        if len(batch) != 0:
+            self.stream.extend(batch)
+            count += len(batch)
+        return count
+
+    def get_moments(self) -> StatMoments:
+        """Return a copy of the running moments, in O(1)."""
+        return self.stream.get_moments()
+
+    async def snapshot(self) -> StatBasket:
+        """Return the StatBasket of the values added so far, built in
+        the executor. Values added while it is built are not included."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        # copied on the loop, so later values cannot change the snapshot
+        values = self.stream.get_values()
+        return await loop.run_in_executor(
+            self.executor, _build_basket, values, self.stream.basket_options)
+
+    def __len__(self):
+        return len(self.stream)
+
+    def __repr__(self):
+        return f"AsyncStatStream(n={len(self)}, batch_size={self.batch_size})"
+
+
+if __name__ == "__main__":
+    pass
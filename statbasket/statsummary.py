@@ -0,0 +1,176 @@
+"""statsummary.py
+
+Contains the class StatSummary, a compact record of the statistics
+calculated for a single data set, which keeps none of the data itself.
+
+Classes:
+    StatSummary
+"""
+
+# Standard Library Imports
+from struct import Struct
+
+# Local Imports
+from statbasket.statmethods import StatMe as sm
+from statbasket.statmoments import StatMoments
+
+
+class StatSummary:
+    """
+    Compact (__slots__) record of the statistics of one data set.
+
+    StatBasket(..., retain_data=False) stores one StatSummary per data
+    set instead of the data, and reads its attributes (mean, mean_x,
+    ...) from them. Summaries can also be built directly with keyword
+    arguments named as the StatBasket attributes, or from running
+    moments with from_moments().
+
+    >>> summary = StatSummary(n=5, mean=25.4, var=167.3, is_population=False)
+    >>> summary.mean
+    25.4
+
+    Attributes:
+    __________
+    n, df, min, max, range, mean, median, quartiles, mode, var, stdev,
+    sterr, cv, skew, score_critical_type, alpha, score_critical, moe, ci
+        Same meaning as the StatBasket attributes of the same name.
+    is_population : bool
+        Whether var, stdev, etc. are population (True) or sample (False)
+        statistics.
+    """
+
+    # Statistics stored, in the order used by as_dict()
+    fields = ("n", "df", "min", "max", "range", "mean", "median", "quartiles",
+              "mode", "var", "stdev", "sterr", "cv", "skew", "score_critical_type",
+              "alpha", "score_critical", "moe", "ci")
+
+    __slots__ = fields + ("is_population",)
+
+    # Fixed binary layout of to_bytes(), little-endian: n, df, min, max,
+    # range, mean, median, quartiles (4), mode kind (see _mode_kinds),
+    # mode, var, stdev, sterr, cv, skew, score_critical_type, alpha,
+    # score_critical, moe, ci (2), is_population, and flags marking
+    # whether min (bit 0) and max (bit 1) were ints, as for int data
+    _struct = Struct("<2q5d4dBd5dc3d2d?B")
+    _mode_kinds = ("value", "none", "multimodal")
+
+    def __init__(self, is_population=False, **stats):
+        unknown = set(stats) - set(self.fields)
+        if len(unknown) != 0:
+            raise ValueError(f"Unknown statistics for StatSummary: {sorted(unknown)}")
+        self.is_population = is_population
+        for name in self.fields:
+            setattr(self, name, stats.get(name))
+
+    @classmethod
+    def from_basket(cls, basket, suffix: str = str()) -> "StatSummary":
+        """Return the summary of one data set of a StatBasket, where
+        suffix is '', '_x', '_y' or '_diff'."""
+        return cls(is_population=basket.is_population,
+                   **{name: getattr(basket, name + suffix) for name in cls.fields})
+
+    @classmethod
+    def from_moments(cls, moments: StatMoments, is_population=False,
+                     cl=0.95, tail="two") -> "StatSummary":
+        """Return the summary of the data set whose running moments are
+        moments: the moment statistics (n, mean, var, stdev, sterr, cv,
+        skew, moe, ci, min, max, range), with median, quartiles and mode
+        None, as they would need the data sorted."""
+        n = moments.n
+        mean = moments.get_mean()
+        stdev = moments.get_stdev(is_population=is_population)
+        sterr = moments.get_sterr(is_population=is_population)
+        score_type, alpha, score = sm._get_score_critical_n(
+            n, cl=cl, is_population=is_population, tail=tail, verbose=True)
+        moe = score * sterr
+        return cls(is_population=is_population, n=n, df=n - 1, min=moments.min,
+                   max=moments.max, range=float(moments.max - moments.min), mean=mean,
+                   var=moments.get_var(is_population=is_population), stdev=stdev,
+                   sterr=sterr, cv=stdev / mean,
+                   skew=moments.get_skew(is_population=is_population),
+                   score_critical_type=score_type, alpha=alpha, score_critical=score,
+                   moe=moe, ci=(mean - moe, mean + moe))
+
+    def get_moments(self) -> StatMoments:
+        """Return StatMoments holding n, mean, m2, m3, min and max."""
+        moments = StatMoments()
+        n = self.n
+        moments.n = n
+        moments.mean = self.mean
+        moments.m2 = self.get_m2()
+        if self.skew is not None:
+            moments.m3 = self.skew * n * self.var ** 1.5
+        moments.min = self.min
+        moments.max = self.max
+        return moments
+
+    def get_m2(self) -> float:
+        """Return the sum of squared differences from the mean."""
+        return self.var * (self.n if self.is_population else self.n - 1)
+
+    # Serialization ###################################################
+
+    def to_bytes(self) -> bytes:
+        """Return the summary packed into a fixed 180 byte layout.
+
+        Raises ValueError if any statistic is missing (None)."""
+        missing = [name for name in self.fields if getattr(self, name) is None]
+        if len(missing) != 0:
+            raise ValueError(f"StatSummary is missing statistics {missing}, "
+                             f"only complete summaries can be packed.")
+        mode_kind, mode = 0, self.mode
+        if isinstance(mode, str):
+            mode_kind, mode = self._mode_kinds.index(mode), 0.0
+        return self._struct.pack(
+            self.n, self.df, self.min, self.max, self.range, self.mean,
+            self.median, *self.quartiles, mode_kind, mode, self.var,
+            self.stdev, self.sterr, self.cv, self.skew,
+            self.score_critical_type.encode("ascii"), self.alpha,
+            self.score_critical, self.moe, *self.ci, self.is_population,
+            isinstance(self.min, int) | isinstance(self.max, int) << 1)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatSummary":
+        """Return the summary packed by to_bytes()."""
+        values = cls._struct.unpack(data)
+        mode_kind, mode = values[11:13]
+        int_flags = values[25]
+        return cls(
+            is_population=values[24],
+            n=values[0], df=values[1],
+            min=int(values[2]) if int_flags & 1 else values[2],
+            max=int(values[3]) if int_flags & 2 else values[3],
+            range=values[4], mean=values[5], median=values[6],
+            quartiles=values[7:11],
+            mode=mode if mode_kind == 0 else cls._mode_kinds[mode_kind],
+            var=values[13], stdev=values[14], sterr=values[15], cv=values[16],
+            skew=values[17], score_critical_type=values[18].decode("ascii"),
+            alpha=values[19], score_critical=values[20], moe=values[21],
+            ci=values[22:24])
+
+    @classmethod
+    def _from_dict(cls, is_population: bool, stats: dict) -> "StatSummary":
+        return cls(is_population=is_population, **stats)
+
+    def __reduce__(self):
+        if any(getattr(self, name) is None for name in self.fields):
+            # incomplete summaries cannot be packed
+            return type(self)._from_dict, (self.is_population, self.as_dict())
+        return type(self).from_bytes, (self.to_bytes(),)
+
+    def as_dict(self) -> dict:
+        """Return {statistic: value} for every field."""
+        return {name: getattr(self, name) for name in self.fields}
+
+    def __eq__(self, other):
+        if not isinstance(other, StatSummary):
+            return NotImplemented
+        return (self.is_population == other.is_population
+                and self.as_dict() == other.as_dict())
+
+    def __repr__(self):
+        return f"StatSummary(n={self.n}, mean={self.mean}, var={self.var})"
+
+
+if __name__ == "__main__":
+    pass
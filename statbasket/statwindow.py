@@ -0,0 +1,410 @@
+"""statwindow.py
+
+Contains the classes StatWindow, which keeps a 'basket' of statistics
+over the last N values of a data stream, and StatEWM, which keeps
+exponentially weighted (time-decayed) statistics of a data stream.
+Both are updated as each new value arrives.
+
+Classes:
+    StatWindow
+    StatEWM
+"""
+# Standard Library Imports
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from struct import Struct
+
+# Local Imports
+from statbasket.statmethods import StatMe as sm
+from statbasket.statmoments import StatMoments
+
+
+class StatWindow:
+    """
+    Class which provides rolling statistics over a sliding window.
+
+    Summary:
+    __________
+    Each call to push() adds a value to the window and, once the window
+    is full, drops the oldest value. Moment statistics (mean, var,
+    stdev, sterr, skew) are updated in O(1), and order statistics (min,
+    max, median, quartiles) are read from a sorted copy of the window
+    that is maintained by binary search, so no update re-sorts the
+    data. The statistics follow the StatMe definitions, i.e. a window
+    holding the same values as a tuple gives the same results as
+    StatBasket on that tuple.
+
+    >>> window = StatWindow(3)
+    >>> window.extend((1, 2, 3, 4))
+    >>> window.data
+    (2, 3, 4)
+    >>> window.mean
+    3.0
+
+    Parameters:
+    ___________
+    size : int
+        Number of most recent values kept in the window.
+    data : tuple or list, optional
+        Initial values, pushed in order.
+    is_population : bool, optional
+        Default False, indicates whether the window is a sample (False)
+        or a population (True), used for variance calculations.
+
+    Attributes:
+    __________
+    n, min, max, range, mean, median, quartiles, mode, var, stdev,
+    sterr, cv, skew
+        Same meaning as the StatBasket attributes, computed over the
+        values currently in the window.
+    """
+
+    def __init__(self, size: int, data: tuple or list = None,
+                 is_population=False):
+        if not isinstance(size, int) or isinstance(size, bool) or size < 1:
+            raise ValueError(f"Window size (size={str(size)}) must be a positive int.")
+        if not isinstance(is_population, bool):
+            raise ValueError(
+                f"is_population is of type '{type(is_population).__name__}', must be of type 'bool'.")
+        self.size = size
+        self.is_population = is_population
+        self._values = deque()
+        self._sorted = list()
+        self._moments = StatMoments()
+        # Removals since moments were last rebuilt from the window
+        self._removals = 0
+        if data is not None:
+            self.extend(data)
+
+    # Updates #########################################################
+
+    def push(self, x: float) -> None:
+        """Add a value to the window, dropping the oldest if full."""
+        if not isinstance(x, (int, float)):
+            raise ValueError(f"Value {str(x)} is of type '{type(x).__name__}', "
+                             f"must be int or float.")
+        self._values.append(x)
+        insort(self._sorted, x)
+        self._moments.push(x)
+        if len(self._values) > self.size:
+            oldest = self._values.popleft()
+            del self._sorted[bisect_left(self._sorted, oldest)]
+            self._moments.remove(oldest)
+            self._removals += 1
+            if self._removals >= self.size:
+                # Rebuild from the window once per window length, so
+                # rounding error from retractions cannot build up. This
+                # keeps updates O(1) amortized.
+                self._moments = StatMoments(self._values)
+                self._removals = 0
+
+    def extend(self, data) -> None:
+        """Push every value of an iterable, in order."""
+        for each_item in data:
+            self.push(each_item)
+
+    # Serialization ###################################################
+
+    # Fixed header of to_bytes(), little-endian: size, is_population,
+    # removals, values in the window; then the StatMoments bytes, then
+    # the values oldest first and the values sorted, as native float64
+    _header = Struct("<q?qq")
+
+    def to_bytes(self) -> bytes:
+        """Return the window packed into bytes, see from_bytes().
+
+        Values are stored as float64, so int values come back as floats."""
+        values = array("d", self._values)
+        sorted_values = array("d", self._sorted)
+        return (self._header.pack(self.size, self.is_population, self._removals, len(values))
+                + self._moments.to_bytes() + values.tobytes() + sorted_values.tobytes())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatWindow":
+        """Return the window packed by to_bytes(), in time proportional
+        to the window size (nothing is re-sorted)."""
+        data = memoryview(data)
+        size, is_population, removals, n = cls._header.unpack_from(data)
+        offset = cls._header.size
+        moments_size = StatMoments._struct.size
+        if len(data) != offset + moments_size + 16 * n:
+            raise ValueError(f"Expected {offset + moments_size + 16 * n} bytes "
+                             f"for a StatWindow, got {len(data)}.")
+        window = cls(size, is_population=is_population)
+        window._removals = removals
+        window._moments = StatMoments.from_bytes(data[offset:offset + moments_size])
+        offset += moments_size
+        values = array("d")
+        values.frombytes(data[offset:offset + 8 * n])
+        sorted_values = array("d")
+        sorted_values.frombytes(data[offset + 8 * n:])
+        window._values = deque(values)
+        window._sorted = sorted_values.tolist()
+        return window
+
+    # Window Attributes ###############################################
+
+    @property
+    def data(self) -> tuple:
+        """Values currently in the window, oldest first."""
+        return tuple(self._values)
+
+    @property
+    def n(self) -> int:
+        return len(self._values)
+
+    @property
+    def min(self) -> float:
+        return self._sorted[0]
+
+    @property
+    def max(self) -> float:
+        return self._sorted[-1]
+
+    @property
+    def range(self) -> float:
+        return float(self._sorted[-1] - self._sorted[0])
+
+    @property
+    def mean(self) -> float:
+        return self._moments.get_mean()
+
+    @property
+    def median(self) -> float:
+        return sm._get_median_sorted(self._sorted)
+
+    @property
+    def quartiles(self) -> tuple:
+        return sm._get_quartile_data_sorted(self._sorted)
+
+    @property
+    def mode(self) -> float or str:
+        return sm.get_mode(self._sorted)
+
+    @property
+    def var(self) -> float:
+        return self._moments.get_var(is_population=self.is_population)
+
+    @property
+    def stdev(self) -> float:
+        return self._moments.get_stdev(is_population=self.is_population)
+
+    @property
+    def sterr(self) -> float:
+        return self._moments.get_sterr(is_population=self.is_population)
+
+    @property
+    def cv(self) -> float:
+        return self._moments.get_cv(is_population=self.is_population)
+
+    @property
+    def skew(self) -> float:
+        return self._moments.get_skew(is_population=self.is_population)
+
+    def get_percentiles(self, qs: tuple or list, method: str = "linear") -> tuple:
+        """Return the values at each quantile of qs over the window, as
+        StatMe.get_percentiles, read from the sorted copy of the window."""
+        return sm.get_percentiles(self._sorted, qs, method=method, is_sorted=True)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"StatWindow(size={self.size}, n={self.n})"
+
+
+class StatEWM:
+    """
+    Class which provides exponentially weighted moving statistics.
+
+    Summary:
+    __________
+    Every value pushed is given weight 1, and all earlier weights are
+    multiplied by a decay factor, so a value's weight halves after
+    half_life observations (or, if push() is given timestamps, after
+    half_life units of time). The weighted mean, variance, standard
+    deviation, standard error and confidence interval are updated in
+    O(1) time from O(1) state, with no buffer of past values.
+
+    >>> ewm = StatEWM(half_life=10)
+    >>> ewm.extend((1, 2, 3, 4, 5))
+    >>> ewm.get_ci(cl=0.95)
+    (0.881902539723642, 5.394780738181376)
+
+    Parameters:
+    ___________
+    half_life : float
+        Number of observations (or units of time, if timestamps are
+        given to push()) after which a value's weight is halved.
+    is_population : bool, optional
+        Default False. If False, the variance is corrected for bias
+        using the effective sample size; if True, the weighted
+        population variance is returned.
+
+    Attributes:
+    __________
+    n : int
+        Number of values pushed.
+    n_eff : float
+        Effective sample size, (sum of weights)^2 / sum of weights^2.
+    mean, var, stdev, sterr
+        Exponentially weighted mean, variance, standard deviation, and
+        standard error of the mean.
+    """
+
+    __slots__ = ("half_life", "is_population", "n", "_decay",
+                 "_w_sum", "_w_sum_sq", "_mean", "_m2", "_t_last")
+
+    # Fixed binary layout of to_bytes(), little-endian: half_life,
+    # is_population, n, sum of weights, sum of squared weights, mean,
+    # m2, whether a timestamp was seen, and the last timestamp
+    _struct = Struct("<d?q4d?d")
+
+    def __init__(self, half_life: float, is_population=False):
+        if (not isinstance(half_life, (int, float)) or isinstance(half_life, bool)
+                or half_life <= 0):
+            raise ValueError(f"half_life (half_life={str(half_life)}) must be a positive number.")
+        if not isinstance(is_population, bool):
+            raise ValueError(
+                f"is_population is of type '{type(is_population).__name__}', must be of type 'bool'.")
+        self.half_life = half_life
+        self.is_population = is_population
+        self.n = 0
+        # Decay applied per observation, when no timestamps are given
+        self._decay = 0.5 ** (1 / half_life)
+        self._w_sum = 0.0
+        self._w_sum_sq = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._t_last = None
+
+    # Updates #########################################################
+
+    def push(self, x: float, t: float = None) -> None:
+        """Add a value, optionally observed at time t.
+
+        If t is given, earlier weights decay by 0.5 ** (elapsed / half_life),
+        where elapsed is the time since the previous timestamped value."""
+        if not isinstance(x, (int, float)):
+            raise ValueError(f"Value {str(x)} is of type '{type(x).__name__}', "
+                             f"must be int or float.")
+        if t is None:
+            decay = self._decay
+        elif self._t_last is None:
+            decay = 1.0
+            self._t_last = t
+        else:
+            elapsed = t - self._t_last
+            if elapsed < 0:
+                raise ValueError(f"Timestamp t={str(t)} is earlier than "
+                                 f"the previous timestamp {str(self._t_last)}.")
+            decay = 0.5 ** (elapsed / self.half_life)
+            self._t_last = t
+        # Decay the old weights, then add x with weight 1
+        self._w_sum = self._w_sum * decay + 1.0
+        self._w_sum_sq = self._w_sum_sq * decay * decay + 1.0
+        delta = x - self._mean
+        self._mean += delta / self._w_sum
+        self._m2 = self._m2 * decay + delta * (x - self._mean)
+        self.n += 1
+
+    def extend(self, data) -> None:
+        """Push every value of an iterable, in order."""
+        for each_item in data:
+            self.push(each_item)
+
+    # Serialization ###################################################
+
+    def to_bytes(self) -> bytes:
+        """Return the state packed into a fixed 58 byte layout."""
+        return self._struct.pack(
+            self.half_life, self.is_population, self.n, self._w_sum,
+            self._w_sum_sq, self._mean, self._m2, self._t_last is not None,
+            0.0 if self._t_last is None else self._t_last)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StatEWM":
+        """Return the StatEWM packed by to_bytes()."""
+        (half_life, is_population, n, w_sum, w_sum_sq, mean, m2,
+         has_t_last, t_last) = cls._struct.unpack(data)
+        ewm = cls(half_life, is_population=is_population)
+        ewm.n = n
+        ewm._w_sum = w_sum
+        ewm._w_sum_sq = w_sum_sq
+        ewm._mean = mean
+        ewm._m2 = m2
+        ewm._t_last = t_last if has_t_last else None
+        return ewm
+
+    # Statistics ######################################################
+
+    @property
+    def n_eff(self) -> float:
+        if self._w_sum_sq == 0:
+            return 0.0
+        return self._w_sum * self._w_sum / self._w_sum_sq
+
+    @property
+    def mean(self) -> float:
+        return float(self._mean)
+
+    @property
+    def var(self) -> float:
+        """Weighted variance.
+
+        .. math::
+            s^2 = \\frac{M_2}{W_1 - W_2/W_1}
+
+            \u03c3^2 = \\frac{M_2}{W_1}
+        """
+        if self.is_population:
+            return float(self._m2 / self._w_sum)
+        return float(self._m2 / (self._w_sum - self._w_sum_sq / self._w_sum))
+
+    @property
+    def stdev(self) -> float:
+        from math import sqrt
+        return sqrt(self.var)
+
+    @property
+    def sterr(self) -> float:
+        from math import sqrt
+        return self.stdev / sqrt(self.n_eff)
+
+    def get_moe(self, cl=0.95, tail="two") -> float:
+        """Return the margin of error of the weighted mean.
+
+        The critical score is looked up using the effective sample size,
+        which must be at least 2: with a short half_life, n_eff stays
+        below 2 however many values are pushed.
+
+        .. math::
+            E = score_c * sterr
+        """
+        if cl not in (0.90, 0.95, 0.99):
+            raise ValueError(f"Confidence level (cl={str(cl)}) is not 0.90, 0.95, or 0.99.")
+        if tail not in ("two", "left", "right"):
+            raise ValueError(f"Tail attribute value (tail={str(tail)}) is not 'two', 'left', or 'right'.")
+        if self.n_eff < 2:
+            raise ValueError(f"Effective sample size (n_eff={self.n_eff:.4g}) is too small, "
+                             f"the margin of error needs n_eff >= 2.")
+        critical_score = sm._get_score_critical_n(
+            int(self.n_eff), cl=cl, is_population=self.is_population, tail=tail)
+        return critical_score * self.sterr
+
+    def get_ci(self, cl=0.95, tail="two") -> tuple:
+        """Return a tuple of lower/upper confidence interval boundaries
+        of the weighted mean, as StatMe.get_ci.
+
+        CI = mean \u00B1 score * sterr
+        """
+        e = self.get_moe(cl=cl, tail=tail)
+        return self.mean - e, self.mean + e
+
+    def __repr__(self):
+        return f"StatEWM(half_life={self.half_life}, n={self.n})"
+
+
+if __name__ == "__main__":
+    pass
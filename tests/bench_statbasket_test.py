@@ -0,0 +1,32 @@
+"""bench_statbasket_test.py
+
+Unit tests for benchmarks/bench_statbasket.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import os
+import sys
+import unittest
+
+# Local Imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+import bench_statbasket  # noqa: E402
+
+
+class TestBenchStatBasket(unittest.TestCase):
+
+    def test_1_run(self):
+        # every StatMe.get_* method must be callable by the benchmark
+        output = bench_statbasket.run((20,), bench_statbasket.SHAPES, repeat=1, verbose=False)
+        results = output["results"]
+        for name in bench_statbasket.get_statme_methods():
+            key = f"StatMe.{name}|floats|20"
+            self.assertIn(key, results)
+            self.assertIsNotNone(results[key], key)
+        self.assertIsNotNone(results["StatBasket.describe|floats|20"])
+
+
+if __name__ == '__main__':
+    unittest.main()
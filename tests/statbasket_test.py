@@ -12,6 +12,7 @@ import sys
 # Local Imports
 sys.path.append("..")  # so path can see the project
 from statbasket import StatBasket as SB
+from statbasket import StatSummary
 
 
 class TestStatBasketClass(unittest.TestCase):
@@ -478,6 +479,268 @@ class TestStatBasketClass(unittest.TestCase):
         simple = SB(data, remove_outliers=True)
         self.assertEqual(simple.data, (1, 2, 3, 4, 4, 5, 6))
 
+    def test_11_bootstrap_ci(self):
+        data = (1, 2, 3, 4, 4, 5, 6, 10)
+        with self.assertRaises(ValueError):
+            SB(data, ci_method="spaghetti")
+        boot = SB(data, ci_method="bootstrap", seed=101)
+        self.assertEqual(boot.ci, SB(data, ci_method="bootstrap", seed=101).ci)
+        self.assertLess(boot.ci[0], boot.mean)
+        self.assertGreater(boot.ci[1], boot.mean)
+        # parametric statistics are unchanged, but a bootstrap interval
+        # is not mean +/- moe
+        self.assertEqual(boot.sterr, SB(data).sterr)
+        self.assertNotEqual(boot.moe, boot.moe)
+        self.assertIn("CI (bootstrap)", boot.describe())
+        # the bootstrap options are passed through, in a process pool
+        from statbasket import StatResample
+        pooled = SB(data, ci_method="bootstrap", seed=101, n_resamples=300, processes=2)
+        self.assertEqual(pooled.ci, StatResample.get_ci_bootstrap(data, n_resamples=300, seed=101))
+        pooled.update((7,))
+        self.assertEqual(pooled.ci, StatResample.get_ci_bootstrap(data + (7,), n_resamples=300, seed=101))
+        self.assertNotEqual(pooled.moe, pooled.moe)
+        with self.assertRaises(ValueError):
+            SB(data, ci_method="bootstrap", n_resamples=0)
+        with self.assertRaises(ValueError):
+            SB(data, ci_method="bootstrap", processes=0)
+
+    def assert_baskets_equal(self, basket, fresh, suffix=str()):
+        for stat in ("n", "df", "mean", "median", "min", "max", "range", "var", "stdev",
+                     "sterr", "cv", "skew", "moe", "score_critical", "alpha"):
+            self.assertAlmostEqual(getattr(basket, stat + suffix), getattr(fresh, stat + suffix),
+                                   places=self.sig_deci_places - 2)
+        for stat in ("ci", "quartiles"):
+            for value, fresh_value in zip(getattr(basket, stat + suffix), getattr(fresh, stat + suffix)):
+                self.assertAlmostEqual(value, fresh_value, places=self.sig_deci_places - 2)
+        self.assertEqual(getattr(basket, "mode" + suffix), getattr(fresh, "mode" + suffix))
+        self.assertEqual(getattr(basket, "data" + suffix), getattr(fresh, "data" + suffix))
+
+    def test_12_update_remove_single(self):
+        large = self.data_large1[:3000]
+        basket = SB(large[:100])
+        basket.update(large[100:2000])
+        self.assert_baskets_equal(basket, SB(large[:2000]))
+        basket.remove(large[:500])
+        self.assert_baskets_equal(basket, SB(large[500:2000]))
+        basket.update(large[2000:])
+        self.assert_baskets_equal(basket, SB(large[500:]))
+        self.assertEqual(basket.describe(), SB(large[500:]).describe())
+
+        population = SB((1, 2, 3, 4, 4, 5, 6, 10), is_population=True)
+        population.update((0, 0, 0, 0, 0))
+        self.assert_baskets_equal(population, SB((1, 2, 3, 4, 4, 5, 6, 10, 0, 0, 0, 0, 0),
+                                                 is_population=True))
+
+        with self.assertRaises(ValueError):
+            SB((1, 2, 3, 4)).remove((7,))
+        with self.assertRaises(ValueError):
+            SB((1, 2, 3, 4)).update(("spaghetti",))
+        with self.assertRaises(ValueError):
+            SB((1, 2, 3, 4)).update((5,), (6,))
+        with self.assertRaises(ValueError):
+            SB((1, 2, 3, 4, 4, 5, 6, 11), remove_outliers=True).update((5,))
+
+    def test_13_update_remove_two_sets(self):
+        data_x, data_y = self.data_large1[:1000], self.data_large2[:800]
+        independent = SB(data_x[:100], data_y[:100])
+        independent.update(data_x[100:], data_y[100:])
+        fresh = SB(data_x, data_y)
+        self.assert_baskets_equal(independent, fresh, "_x")
+        self.assert_baskets_equal(independent, fresh, "_y")
+        self.assertAlmostEqual(independent.var_pool, fresh.var_pool, places=self.sig_deci_places - 2)
+        independent.remove((), data_y[:300])
+        fresh = SB(data_x, data_y[300:])
+        self.assert_baskets_equal(independent, fresh, "_y")
+        self.assertAlmostEqual(independent.calculate_test_score(), fresh.calculate_test_score(),
+                               places=self.sig_deci_places - 2)
+
+        data_y = self.data_large2[:1000]
+        dependent = SB(data_x[:500], data_y[:500], samples_dependent=True)
+        dependent.update(data_x[500:], data_y[500:])
+        dependent.remove(data_x[:10], data_y[:10])
+        fresh = SB(data_x[10:], data_y[10:], samples_dependent=True)
+        for suffix in ("_diff", "_x", "_y"):
+            self.assert_baskets_equal(dependent, fresh, suffix)
+        with self.assertRaises(ValueError):
+            dependent.update((1, 2), (3,))
+
+    def test_14_memory_budget(self):
+        large = self.data_large1
+        with self.assertRaises(ValueError):
+            SB(large, memory_budget=-1)
+        with self.assertRaises(ValueError):
+            SB(large, memory_budget=1000)
+        self.assertFalse(SB(large, memory_budget=10 ** 9).low_memory)
+        low_memory = SB(large, memory_budget=2 * 10 ** 6)
+        self.assertTrue(low_memory.low_memory)
+        self.assertEqual(low_memory.describe(), SB(large).describe())
+        self.assertEqual(low_memory.quartiles, SB(large).quartiles)
+        dependent = SB(large, self.data_large2, samples_dependent=True, memory_budget=6 * 10 ** 6)
+        self.assertTrue(dependent.low_memory)
+        self.assertEqual(dependent.mode_diff, SB(large, self.data_large2, samples_dependent=True).mode_diff)
+
+    def test_15_retain_data(self):
+        data_x = (1, 2, 3, 4, 4, 5, 6, 10)
+        data_y = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+        with self.assertRaises(ValueError):
+            SB(data_x, retain_data="spaghetti")
+        for args, kwargs in (((data_x,), {}),
+                             ((data_x, data_y), {}),
+                             ((data_x, data_y), {"samples_dependent": True}),
+                             ((self.data_large1,), {"is_population": True})):
+            kept = SB(*args, **kwargs)
+            released = SB(*args, retain_data=False, **kwargs)
+            self.assertEqual(kept.describe(h0=1), released.describe(h0=1))
+            self.assertEqual(kept.calculate_test_score(h0=1, verbose=True),
+                             released.calculate_test_score(h0=1, verbose=True))
+            for suffix in kept._get_suffixes():
+                self.assertIsNone(getattr(released, "data" + suffix))
+                self.assertIsInstance(getattr(released, "summary" + suffix), StatSummary)
+                self.assertEqual(getattr(kept, "quartiles" + suffix),
+                                 getattr(released, "quartiles" + suffix))
+        with self.assertRaises(ValueError):
+            released.update((1, 2))
+        with self.assertRaises(AttributeError):
+            released.spaghetti
+
+    def test_16_bytes(self):
+        import pickle
+        data_x = (1, 2, 3, 4, 4, 5, 6, 10)
+        data_y = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+        for basket in (SB(data_x, first_data_name="first"),
+                       SB(data_x, data_y, tail="left", cl=0.99),
+                       SB(data_x, data_y, samples_dependent=True, retain_data=False),
+                       SB(self.data_large1[:500], ci_method="bootstrap", seed=1)):
+            restored = SB.from_bytes(basket.to_bytes())
+            self.assertEqual(restored.describe(h0=1), basket.describe(h0=1))
+            self.assertFalse(restored.retain_data)
+            unpickled = pickle.loads(pickle.dumps(basket))
+            self.assertEqual(unpickled.describe(h0=1), basket.describe(h0=1))
+            self.assertEqual(unpickled.retain_data, basket.retain_data)
+        # only baskets without their data are pickled as their bytes
+        self.assertLess(len(pickle.dumps(SB(self.data_large1, retain_data=False))), 400)
+        unpickled = pickle.loads(pickle.dumps(SB(data_x)))
+        unpickled.update((7,))
+        self.assert_baskets_equal(unpickled, SB(data_x + (7,)))
+        with self.assertRaises(ValueError):
+            SB.from_bytes(SB(data_x).to_bytes() + b"spaghetti")
+
+    def test_17_describe_formats(self):
+        import json
+        data_x = (1, 2, 3, 4, 4, 5, 6, 10)
+        data_y = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+        with self.assertRaises(ValueError):
+            SB(data_x).describe(format="spaghetti")
+        single = SB(data_x)
+        description = single.describe(h0=1, format="dict")
+        self.assertEqual(description["DATA"]["mean"], single.mean)
+        self.assertEqual(description["DATA"]["ci"], single.ci)
+        self.assertEqual(description["DATA"]["score_critical_type"], "t")
+        self.assertEqual(description["hypothesis_test"]["score"],
+                         single.calculate_test_score(h0=1))
+        self.assertEqual(json.loads(single.describe(format="json"))["DATA"]["median"], single.median)
+        two = SB(data_x, data_y, first_data_name="x", second_data_name="y")
+        rows = two.describe(h0=0, format="rows")
+        self.assertIn(("Measures of Central Tendency", "Mean (mean)", two.mean_x, two.mean_y), rows)
+        self.assertEqual(rows[-1], ("Hypothesis Test Results", "Score", two.calculate_test_score()))
+        self.assertEqual(set(two.describe(format="dict")), {"x", "y"})
+        baskets = [single, two, SB(data_x, data_y, samples_dependent=True)]
+        self.assertEqual(SB.describe_many(baskets, h0=0),
+                         [basket.describe(h0=0) for basket in baskets])
+        self.assertEqual(json.loads(SB.describe_many(baskets, format="json"))[1]["y"]["n"], 8)
+
+    def test_18_threads(self):
+        from unittest import mock
+        from statbasket import StatMe
+        data_x = self.data_large1[:3000]
+        data_y = self.data_large2[:3000]
+        with self.assertRaises(ValueError):
+            SB(data_x, threads=0)
+        self.assertEqual(SB(data_x, threads=4).describe(), SB(data_x).describe())
+        # chunked as on a free-threaded build
+        with mock.patch.object(StatMe, "_gil_enabled", return_value=False), \
+                mock.patch.object(StatMe, "_min_chunk_size", 100):
+            threaded = SB(data_x, data_y, samples_dependent=True, threads=4)
+            serial = SB(data_x, data_y, samples_dependent=True)
+            self.assertEqual(threaded.data_diff, serial.data_diff)
+            self.assertEqual(threaded.mode_diff, serial.mode_diff)
+            for stat in ("var_diff", "skew_diff", "moe_diff"):
+                self.assertAlmostEqual(getattr(threaded, stat), getattr(serial, stat), places=10)
+            self.assertEqual(threaded.describe(), serial.describe())
+
+    def test_19_percentiles(self):
+        from statbasket import StatMe
+        data_x = self.data_large1[:1000]
+        basket = SB(data_x, self.data_large2[:1000], samples_dependent=True)
+        qs = (0.5, 0.9, 0.99)
+        self.assertEqual(basket.get_percentiles(qs, suffix="_x"), StatMe.get_percentiles(data_x, qs))
+        self.assertEqual(basket.get_percentiles((0.25, 0.5, 0.75), method="quartile", suffix="_diff"),
+                         basket.quartiles_diff[:3])
+        with self.assertRaises(ValueError):
+            basket.get_percentiles(qs)
+        single = SB((1, 2, 3, 4))
+        self.assertEqual(single.get_percentiles((1.0,)), (4.0,))
+        single.update((10,))
+        self.assertEqual(single.get_percentiles((1.0,)), (10.0,))
+        with self.assertRaises(ValueError):
+            SB((1, 2, 3), retain_data=False).get_percentiles((0.5,))
+
+    def test_20_failed_update_unchanged(self):
+        basket = SB([1, 2, 3, 4, 5])
+        before = basket.describe(format="dict")
+        with self.assertRaises(ValueError):
+            basket.remove([1, 2, 3, 4])
+        self.assertEqual(basket.data, [1, 2, 3, 4, 5])
+        self.assertEqual(basket.describe(format="dict"), before)
+        # the mean would be 0, so the cv fails: nothing is changed
+        basket = SB([-1, 1, 5, 7])
+        before = basket.describe(format="dict")
+        with self.assertRaises(ZeroDivisionError):
+            basket.remove([5, 7])
+        self.assertEqual(basket.data, [-1, 1, 5, 7])
+        self.assertEqual(basket.describe(format="dict"), before)
+        basket.remove([5])
+        self.assert_baskets_equal(basket, SB([-1, 1, 7]))
+        dependent = SB((1, 2, 4), (0, 1, 1), samples_dependent=True)
+        with self.assertRaises(ValueError):
+            dependent.remove((1, 2), (0, 1))
+        self.assertEqual(dependent.n_diff, 3)
+
+
+    def test_21_copy(self):
+        import copy
+        data = [1, 2, 3, 4, 4, 5, 6, 10]
+        basket = SB(data)
+        basket.update((7,))
+        for copied in (copy.copy(basket), copy.deepcopy(basket)):
+            self.assertEqual(copied.data, basket.data)
+            copied.update((20,))
+            self.assert_baskets_equal(copied, SB(data + [7, 20]))
+            # the original is unchanged
+            self.assert_baskets_equal(basket, SB(data + [7]))
+            self.assertEqual(basket.data, data + [7])
+        released = copy.copy(SB(data, retain_data=False))
+        self.assertIsNone(released.data)
+        self.assertEqual(released.describe(), SB(data).describe())
+
+    def test_22_test_score_h0(self):
+        data_x = (1, 2, 3, 4, 4, 5, 6, 10)
+        data_y = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+        # h0 is subtracted from the difference of means of two samples
+        for basket in (SB(data_x, data_y), SB(data_x, data_y, retain_data=False)):
+            self.assertAlmostEqual(basket.calculate_test_score(h0=2), 4.86619095239293, places=12)
+            self.assertAlmostEqual(basket.calculate_test_score(), 6.308025308657502, places=12)
+        self.assertNotEqual(SB(data_x, data_y).describe(h0=2), SB(data_x, data_y).describe(h0=0))
+
+    def test_23_describe_json_bootstrap(self):
+        import json
+        basket = SB(list(range(50)), ci_method="bootstrap", n_resamples=200, seed=1)
+        description = json.loads(basket.describe(format="json"))
+        self.assertIsNone(description["DATA"]["moe"])
+        self.assertEqual(description["DATA"]["ci"], list(basket.ci))
+        many = json.loads(SB.describe_many([basket, SB(list(range(50)))], format="json"))
+        self.assertIsNone(many[0]["DATA"]["moe"])
+        self.assertEqual(many[1]["DATA"]["moe"], SB(list(range(50))).moe)
 
 if __name__ == "__main__":
     unittest.main()
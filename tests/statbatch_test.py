@@ -0,0 +1,57 @@
+"""statbatch_test.py
+
+Unit tests for statbatch.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+from random import Random
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatBatch
+
+
+class TestStatBatchClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = Random(101)
+        cls.datasets = [tuple(rng.randint(1, 255) for _ in range(rng.randint(5, 50)))
+                        for _ in range(30)]
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatBatch.describe(self.datasets, chunk_size=0)
+        with self.assertRaises(ValueError):
+            StatBatch.describe(self.datasets, format="spaghetti")
+        with self.assertRaises(ValueError):
+            list(StatBatch.get_baskets(self.datasets, cl=0.98))
+
+    def test_2_describe_serial(self):
+        named = [(f"group {i}", data) for i, data in enumerate(self.datasets)]
+        expected = [SB(data, first_data_name=name, tail="left").describe(h0=100)
+                    for name, data in named]
+        self.assertEqual(list(StatBatch.describe(named, chunk_size=7, h0=100, tail="left")),
+                         expected)
+        self.assertEqual(list(StatBatch.describe(self.datasets, format="dict"))[3],
+                         SB(self.datasets[3]).describe(format="dict"))
+
+    def test_3_pool(self):
+        expected = [SB(data).describe() for data in self.datasets]
+        results = StatBatch.describe(iter(self.datasets), processes=2, chunk_size=4, max_pending=2)
+        self.assertEqual(list(results), expected)
+        baskets = list(StatBatch.get_baskets(self.datasets, processes=2, chunk_size=8))
+        self.assertEqual([basket.mean for basket in baskets],
+                         [SB(data).mean for data in self.datasets])
+        self.assertFalse(baskets[0].retain_data)
+        # stopping early terminates the pool
+        results = StatBatch.describe(self.datasets, processes=2, chunk_size=1)
+        self.assertEqual(next(results), expected[0])
+        results.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""statcache_test.py
+
+Unit tests for statcache.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import os
+import tempfile
+import unittest
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatCache
+
+
+class TestStatCacheClass(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = StatCache(self.directory.name)
+        self.data_simple = (1, 2, 3, 4, 4, 5, 6, 10)
+        self.data_neg_float = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatCache(self.directory.name, max_bytes=0)
+        with self.assertRaises(ValueError):
+            SB(self.data_simple, cache="spaghetti")
+
+    def test_2_keys(self):
+        key = StatCache.get_key(self.data_simple, cl=0.95)
+        self.assertEqual(key, StatCache.get_key(list(self.data_simple), cl=0.95))
+        self.assertNotEqual(key, StatCache.get_key(self.data_simple, cl=0.99))
+        self.assertNotEqual(key, StatCache.get_key(tuple(map(float, self.data_simple)), cl=0.95))
+        self.assertNotEqual(key, StatCache.get_key(self.data_simple[:4], self.data_simple[4:], cl=0.95))
+        # mixed data: the type of each value is part of the key
+        self.assertNotEqual(StatCache.get_key((1, 2.5)), StatCache.get_key((1.0, 2.5)))
+        self.assertEqual(StatCache.get_key((1, 2.5)), StatCache.get_key([1, 2.5]))
+
+    def test_3_basket_hits(self):
+        for args, kwargs in (((self.data_simple,), {}),
+                             ((self.data_simple, self.data_neg_float), {"tail": "left"}),
+                             ((self.data_simple, self.data_neg_float), {"samples_dependent": True}),
+                             ((self.data_simple,), {"remove_outliers": True, "retain_data": False})):
+            fresh = SB(*args, **kwargs)
+            stored = SB(*args, cache=self.cache, **kwargs)
+            hit = SB(*args, cache=self.cache, **kwargs)
+            self.assertEqual(stored.describe(h0=1), fresh.describe(h0=1))
+            self.assertEqual(hit.describe(h0=1), fresh.describe(h0=1))
+            self.assertEqual(hit.retain_data, fresh.retain_data)
+        self.assertEqual(len(self.cache), 4)
+        hit = SB(self.data_simple, cache=self.cache)
+        self.assertEqual(hit.data, self.data_simple)
+        hit.update((7,))
+        self.assertEqual(hit.mean, SB(self.data_simple + (7,)).mean)
+        # unseeded bootstrap intervals are not cached
+        SB(self.data_simple, ci_method="bootstrap", cache=self.cache)
+        self.assertEqual(len(self.cache), 4)
+
+    def test_4_eviction(self):
+        basket = SB(self.data_simple)
+        size = len(basket.to_bytes())
+        cache = StatCache(self.directory.name, max_bytes=10 * size)
+        for i in range(10):
+            cache.put(f"key{i}", basket)
+            os.utime(cache._get_path(f"key{i}"), (i, i))
+        # reading key0 makes key1 the least recently used
+        self.assertIsNotNone(cache.get("key0"))
+        cache.put("key10", basket)
+        self.assertLessEqual(sum(entry_size for _, _, entry_size in cache._scan()), 10 * size)
+        self.assertIsNone(cache.get("key1"))
+        self.assertIsNotNone(cache.get("key0"))
+        with open(cache._get_path("corrupt"), "wb") as file:
+            file.write(b"spaghetti")
+        self.assertIsNone(cache.get("corrupt"))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_5_threads_same_key(self):
+        from concurrent.futures import ThreadPoolExecutor
+        basket = SB(self.data_simple)
+        key = StatCache.get_key(self.data_simple)
+
+        def put_many(_):
+            for _ in range(100):
+                self.cache.put(key, basket)
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(put_many, range(8)))
+        self.assertEqual(self.cache.get(key).describe(), basket.describe())
+        # no temporary files are left behind
+        self.assertEqual(os.listdir(self.directory.name), [key + ".stat"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""statcheckpoint_test.py
+
+Unit tests for statcheckpoint.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import os
+import tempfile
+import unittest
+from random import Random
+
+# Local Imports
+from statbasket import StatCheckpoint, StatEWM, StatMoments, StatStream, StatWindow
+
+
+class TestStatCheckpointClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = Random(101)
+        cls.data_large = tuple(rng.gauss(100.0, 15.0) for _ in range(3000))
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "stream.ckpt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatCheckpoint(self.path, interval=-1)
+        with self.assertRaises(ValueError):
+            StatCheckpoint(self.path).save([1, 2, 3])
+        self.assertIsNone(StatCheckpoint(self.path).load())
+
+    def test_2_resume(self):
+        half = len(self.data_large) // 2
+        for create in (lambda: StatMoments(), lambda: StatWindow(500, is_population=True),
+                       lambda: StatEWM(100), lambda: StatStream(cl=0.99)):
+            uninterrupted, interrupted = create(), create()
+            uninterrupted.extend(self.data_large)
+            interrupted.extend(self.data_large[:half])
+            StatCheckpoint(self.path).save(interrupted)
+            resumed = StatCheckpoint(self.path).load()
+            self.assertIs(type(resumed), type(uninterrupted))
+            resumed.extend(self.data_large[half:])
+            self.assertEqual(resumed.to_bytes(), uninterrupted.to_bytes())
+        window = StatWindow(500)
+        window.extend(self.data_large)
+        StatCheckpoint(self.path).save(window)
+        resumed = StatCheckpoint(self.path).load()
+        self.assertEqual((resumed.data, resumed.quartiles, resumed.var),
+                         (window.data, window.quartiles, window.var))
+        ewm = StatEWM(10)
+        ewm.push(1.0, t=0.0)
+        ewm.push(2.0, t=5.0)
+        StatCheckpoint(self.path).save(ewm)
+        with self.assertRaises(ValueError):
+            StatCheckpoint(self.path).load().push(3.0, t=4.0)
+
+    def test_3_interval_and_corruption(self):
+        checkpoint = StatCheckpoint(self.path, interval=3600)
+        moments = StatMoments((1, 2, 3))
+        self.assertTrue(checkpoint.maybe_save(moments))
+        moments.push(4)
+        self.assertFalse(checkpoint.maybe_save(moments))
+        self.assertEqual(checkpoint.load().n, 3)
+        checkpoint.interval = 0
+        self.assertTrue(checkpoint.maybe_save(moments))
+        self.assertEqual(checkpoint.load().n, 4)
+        self.assertEqual(os.listdir(self.directory.name), ["stream.ckpt"])
+        with open(self.path, "r+b") as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b"\xff")
+        with self.assertRaises(ValueError):
+            checkpoint.load()
+
+    def test_4_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        checkpoint = StatCheckpoint(self.path)
+        moments = StatMoments((1, 2, 3))
+
+        def save_many(_):
+            for _ in range(50):
+                checkpoint.save(moments)
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(save_many, range(8)))
+        self.assertEqual(checkpoint.load().n, 3)
+        self.assertEqual(os.listdir(self.directory.name), ["stream.ckpt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
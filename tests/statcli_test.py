@@ -0,0 +1,119 @@
+"""statcli_test.py
+
+Unit tests for statcli.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import io
+import json
+import os
+import tempfile
+import unittest
+from array import array
+from contextlib import redirect_stderr, redirect_stdout
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket.statcli import main
+
+
+class TestStatCliClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.price = (1.0, 2.0, 3.0, 4.0, 4.0, 5.0, 6.0, 10.0)
+        cls.quantity = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+        cls.csv_path = os.path.join(cls.directory.name, "sales.csv")
+        with open(cls.csv_path, "w") as file:
+            file.write("price,quantity\n")
+            for price, quantity in zip(cls.price, cls.quantity):
+                file.write(f"{price},{quantity}\n")
+            file.write(",7\n")
+        cls.binary_path = os.path.join(cls.directory.name, "price.f64")
+        with open(cls.binary_path, "wb") as file:
+            file.write(array("d", cls.price).tobytes())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    @staticmethod
+    def run_main(arguments: list) -> tuple:
+        """Return (exit status, stdout, stderr) of main(arguments)."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = main(arguments)
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_1_errors(self):
+        status, _, error = self.run_main([self.csv_path, "--column", "spaghetti"])
+        self.assertEqual(status, 1)
+        self.assertIn("no column 'spaghetti'", error)
+        status, _, error = self.run_main([os.path.join(self.directory.name, "missing.csv")])
+        self.assertEqual(status, 1)
+        # a column with no variation is reported, the others described
+        constant_path = os.path.join(self.directory.name, "constant.csv")
+        with open(constant_path, "w") as file:
+            file.write("a,b\n1,1\n1,2\n1,4\n")
+        for extra in ([], ["--moments-only"]):
+            status, output, error = self.run_main([constant_path, "-c", "a", "-c", "b"] + extra)
+            self.assertEqual(status, 1)
+            self.assertIn(f"{constant_path}:a: statistics are undefined", error)
+            self.assertNotIn("Traceback", error)
+            self.assertIn(f"{constant_path}:b", output)
+
+    def test_2_csv_table(self):
+        status, output, _ = self.run_main([self.csv_path, "-c", "price", "-c", "1"])
+        self.assertEqual(status, 0)
+        expected = (SB(self.price, first_data_name=f"{self.csv_path}:price").describe()
+                    + SB(self.quantity + (7.0,), first_data_name=f"{self.csv_path}:quantity").describe())
+        self.assertEqual(output, expected)
+
+    def test_3_json_binary_jobs(self):
+        status, output, _ = self.run_main(
+            ["--input-format", "binary", "--json", "--jobs", "2", self.binary_path, self.binary_path])
+        self.assertEqual(status, 0)
+        description = json.loads(output)[self.binary_path]["0"]
+        self.assertEqual(description["mean"], SB(self.price).mean)
+        self.assertEqual(description["median"], SB(self.price).median)
+
+    def test_4_moments_only(self):
+        status, output, _ = self.run_main([self.csv_path, "-c", "quantity", "--moments-only", "--json"])
+        self.assertEqual(status, 0)
+        stats = json.loads(output)[self.csv_path]["quantity"]
+        basket = SB(self.quantity + (7.0,))
+        full = basket.describe(format="dict")["DATA"]
+        self.assertEqual(set(stats), set(full))
+        self.assertEqual(stats["n"], basket.n)
+        self.assertIsNone(stats["median"])
+        self.assertIsNone(stats["mode"])
+        for stat in ("var", "skew", "moe"):
+            self.assertAlmostEqual(stats[stat], full[stat], places=10)
+        for bound, expected in zip(stats["ci"], full["ci"]):
+            self.assertAlmostEqual(bound, expected, places=10)
+        status, output, _ = self.run_main([self.csv_path, "-c", "quantity", "--moments-only"])
+        self.assertEqual(status, 0)
+        self.assertIn(f"{self.csv_path}:quantity".upper(), output.upper())
+        self.assertIn("n/a", output)
+        self.assertIn("Margin of Error (moe)", output)
+
+    def test_5_json_keys(self):
+        # the same column name in two files, and a file given twice
+        other_path = os.path.join(self.directory.name, "other.csv")
+        with open(other_path, "w") as file:
+            file.write("price\n100\n200\n400\n")
+        status, output, _ = self.run_main(
+            ["--json", self.csv_path, other_path, self.csv_path, "-c", "price", "-c", "0"])
+        self.assertEqual(status, 0)
+        combined = json.loads(output)
+        self.assertEqual(list(combined), [self.csv_path, other_path])
+        self.assertEqual(list(combined[self.csv_path]), ["price"])
+        self.assertEqual(combined[self.csv_path]["price"]["mean"], SB(self.price).mean)
+        self.assertEqual(combined[other_path]["price"]["mean"], SB((100, 200, 400)).mean)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""statcolumns_test.py
+
+Unit tests for statcolumns.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+from math import isnan
+from random import Random
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatColumns
+from statbasket import StatSummary
+
+
+class TestStatColumnsClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = Random(101)
+        cls.baskets = [SB([rng.randint(1, 255) for _ in range(rng.randint(5, 50))])
+                       for _ in range(40)]
+        cls.columns = StatColumns()
+        cls.columns.extend(cls.baskets, labels=range(40))
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatColumns(columns=("mean", "spaghetti"))
+        with self.assertRaises(ValueError):
+            StatColumns(columns=("mean",)).sort("var")
+        with self.assertRaises(ValueError):
+            self.columns.top_k("mean", -1)
+
+    def test_2_append(self):
+        self.assertEqual(len(self.columns), 40)
+        self.assertEqual(self.columns.nbytes, 40 * 8 * len(StatColumns.column_names))
+        basket = self.baskets[3]
+        row = self.columns.row(3)
+        self.assertEqual(row["n"], basket.n)
+        self.assertEqual(row["mean"], basket.mean)
+        self.assertEqual((row["q1"], row["q3"], row["iqr"]),
+                         (basket.quartiles[0], basket.quartiles[2], basket.quartiles[3]))
+        self.assertEqual((row["ci_lower"], row["ci_upper"]), basket.ci)
+        # two data sets, summaries, and modes which are not a value
+        columns = StatColumns(columns=("n", "mean", "mode"))
+        two = SB((1, 2, 3), (4, 4, 6, 8))
+        columns.append(two, suffix="_y")
+        columns.append(StatSummary.from_basket(two, "_x"))
+        self.assertEqual(list(columns["n"]), [4, 3])
+        self.assertEqual(columns["mode"][0], 4.0)
+        self.assertTrue(isnan(columns["mode"][1]))
+
+    def test_3_filter_sort_top_k(self):
+        means = [basket.mean for basket in self.baskets]
+        in_range = self.columns.filter("mean", minimum=120, maximum=140)
+        self.assertEqual(in_range.labels, [i for i, mean in enumerate(means) if 120 <= mean <= 140])
+        ordered = self.columns.sort("mean", reverse=True)
+        self.assertEqual(list(ordered["mean"]), sorted(means, reverse=True))
+        top = self.columns.top_k("mean", 5)
+        self.assertEqual(top.labels, ordered.labels[:5])
+        bottom = self.columns.top_k("mean", 5, largest=False)
+        self.assertEqual(list(bottom["mean"]), sorted(means)[:5])
+        self.assertEqual(self.columns.take(top.labels).row(0), top.row(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""statgroups_test.py
+
+Unit tests for statgroups.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import math
+import unittest
+from random import Random
+
+# Local Imports
+from statbasket import StatMe as sm
+from statbasket import StatGroups
+
+
+class TestStatGroupsClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.groups_simple = {"a": (1, 2, 3), "b": (4, 5, 6), "c": (7, 8, 9)}
+        rng = Random(101)
+        cls.labeled = tuple((label, rng.gauss(100.0 + 2 * i, 10.0 + i))
+                            for _ in range(500) for i, label in enumerate("wxyz"))
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatGroups([("a", "spaghetti")])
+        groups = StatGroups([("a", 1), ("a", 2), ("b", 3)])
+        with self.assertRaises(ValueError):
+            groups.get_welch("a", "b")
+        with self.assertRaises(ValueError):
+            groups.get_welch("a", "spaghetti")
+        with self.assertRaises(ValueError):
+            StatGroups.from_groups({"a": (1, 2, 3)}).get_anova()
+
+    def test_2_anova(self):
+        anova = StatGroups.from_groups(self.groups_simple).get_anova()
+        self.assertEqual((anova["df_between"], anova["df_within"]), (2, 6))
+        self.assertAlmostEqual(anova["ss_between"], 54.0, places=10)
+        self.assertAlmostEqual(anova["ss_within"], 6.0, places=10)
+        self.assertAlmostEqual(anova["f"], 27.0, places=10)
+        # for df_between = 2, p = (1 + 2f/df_within) ** (-df_within/2)
+        self.assertAlmostEqual(anova["p"], 0.001, places=12)
+        # constant groups: 0/0 when their means are equal, else infinite
+        same = StatGroups.from_groups({"a": (2, 2, 2), "b": (2, 2)}).get_anova()
+        self.assertTrue(math.isnan(same["f"]) and math.isnan(same["p"]))
+        apart = StatGroups.from_groups({"a": (2, 2, 2), "b": (3, 3)}).get_anova()
+        self.assertEqual((apart["f"], apart["p"]), (float("inf"), 0.0))
+
+    def test_3_welch(self):
+        groups = StatGroups.from_groups(self.groups_simple)
+        welch = groups.get_welch("a", "b")
+        # equal sizes and variances, Welch's t is the pooled t
+        self.assertAlmostEqual(welch["t"], sm.get_score_hyp((1, 2, 3), (4, 5, 6)), places=12)
+        self.assertAlmostEqual(welch["df"], 4.0, places=12)
+        self.assertAlmostEqual(welch["p"], sm.get_p_t(welch["t"], 4), places=12)
+        self.assertEqual(welch["mean_diff"], -3.0)
+        self.assertAlmostEqual(groups.get_welch("a", "b", tail="left")["p"], welch["p"] / 2, places=12)
+        self.assertAlmostEqual(groups.get_welch("a", "b", h0=-3)["t"], 0.0, places=12)
+        pairwise = groups.get_pairwise()
+        self.assertEqual(list(pairwise), [("a", "b"), ("a", "c"), ("b", "c")])
+        self.assertEqual(pairwise[("b", "c")], groups.get_welch("b", "c"))
+        constant = StatGroups.from_groups({"a": (2, 2, 2), "b": (3, 3)}).get_welch("a", "b")
+        self.assertTrue(math.isnan(constant["t"]) and math.isnan(constant["p"]))
+        self.assertEqual(constant["mean_diff"], -1)
+
+    def test_4_one_pass_and_merge(self):
+        groups = StatGroups(self.labeled)
+        self.assertEqual(len(groups), 4)
+        for label in "wxyz":
+            data = tuple(x for each_label, x in self.labeled if each_label == label)
+            self.assertAlmostEqual(groups.moments[label].get_var(), sm.get_var(data), places=8)
+        halves = StatGroups(self.labeled[:777]).merge(StatGroups(self.labeled[777:]))
+        self.assertAlmostEqual(halves.get_anova()["f"], groups.get_anova()["f"], places=8)
+        self.assertLess(groups.get_welch("w", "z")["p"], 0.05)
+        from statbasket import StatBasket, StatMoments
+        summarized = StatGroups()
+        summarized.add_moments("a", StatBasket((1, 2, 3), retain_data=False).summary.get_moments())
+        summarized.add_moments("b", StatMoments((4, 5, 6)))
+        self.assertAlmostEqual(summarized.get_welch("a", "b")["t"],
+                               StatGroups.from_groups(self.groups_simple).get_welch("a", "b")["t"],
+                               places=12)
+        with self.assertRaises(ValueError):
+            summarized.add_moments("c", (7, 8, 9))
+
+    def test_5_p_values(self):
+        # critical values of the t-table, at alpha = 0.05
+        self.assertAlmostEqual(sm.get_p_t(2.228, 10), 0.05, places=4)
+        self.assertAlmostEqual(sm.get_p_t(-1.812, 10, tail="left"), 0.05, places=4)
+        self.assertAlmostEqual(sm.get_p_t(1.812, 10, tail="left"), 0.95, places=4)
+        self.assertAlmostEqual(sm.get_p_t(12.706, 1), 0.05, places=4)
+        self.assertEqual(sm.get_p_t(0.0, 5), 1.0)
+        self.assertAlmostEqual(sm.get_p_f(3.098, 3, 20), 0.05, places=4)
+        self.assertEqual(sm.get_p_f(0.0, 3, 20), 1.0)
+        with self.assertRaises(ValueError):
+            sm.get_p_t(1.0, 10, tail="spaghetti")
+
+
+if __name__ == "__main__":
+    unittest.main()
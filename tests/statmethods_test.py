@@ -8,6 +8,7 @@ https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
 # Standard Library Imports
 import csv
 import unittest
+from unittest import mock
 
 # Local Imports
 from statbasket import StatMe as sm
@@ -507,9 +508,92 @@ class TestStatBasketClass(unittest.TestCase):
         self.assertEqual(sm.get_outlier_data(data_close), data_close_ouliers)
         self.assertEqual(sm.get_outlier_data(data_close, remove_outliers=True), data_close_without_outliers)
 
+    def test_24_get_quartile_data_sorted(self):
+        for data in (self.data_simple, self.data_neg_float, self.data_zeroes_pop,
+                     (1, 2, 3), (1, 2, 3, 4, 5), self.data_large[:1001]):
+            sorted_data = sorted(data)
+            self.assertEqual(sm._get_quartile_data_sorted(sorted_data),
+                             sm.get_quartile_data(data))
+            self.assertEqual(sm._get_median_sorted(sorted_data), sm.get_median(data))
+        self.assertEqual(sm._get_quartile_data_sorted([]), (0, 0, 0, 0))
+
+    def test_25_threads(self):
+        data = self.data_large[:5000]
+        data2 = self.data_large2[:5000]
+        with self.assertRaises(ValueError):
+            sm.get_var(data, threads=0)
+        with self.assertRaises(ValueError):
+            sm.get_mode(data, threads="spaghetti")
+        # with the GIL enabled threads are ignored, the results are exact
+        self.assertEqual(sm.get_var(data, threads=4), sm.get_var(data))
+        # chunked as on a free-threaded build
+        with mock.patch.object(sm, "_gil_enabled", return_value=False), \
+                mock.patch.object(sm, "_min_chunk_size", 100):
+            for threads in (2, 3, 7):
+                self.assertAlmostEqual(sm.get_var(data, threads=threads), sm.get_var(data),
+                                       places=self.sig_deci_places)
+                self.assertAlmostEqual(sm.get_skew(data, is_population=True, threads=threads),
+                                       sm.get_skew(data, is_population=True),
+                                       places=self.sig_deci_places)
+                self.assertEqual(sm.get_mode(data, threads=threads), sm.get_mode(data))
+                self.assertEqual(sm.get_mode(data, multimodal=True, threads=threads),
+                                 sm.get_mode(data, multimodal=True))
+                self.assertEqual(sm.get_data_diff(data, data2, threads=threads),
+                                 sm.get_data_diff(data, data2))
+            self.assertEqual(sm.get_mode(self.data_simple * 100, threads=2), 4.0)
+
+    def test_26_get_percentiles(self):
+        data = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+        self.assertEqual(sm.get_percentiles(data, (0.5, 0.9)), (5.5, 9.1))
+        self.assertEqual(sm.get_percentiles(data, (0.0, 1.0)), (1.0, 10.0))
+        for method, expected in (("lower", 9.0), ("higher", 10.0), ("nearest", 9.0),
+                                 ("midpoint", 9.5)):
+            self.assertEqual(sm.get_percentiles(data, (0.9,), method=method), (expected,))
+        with self.assertRaises(ValueError):
+            sm.get_percentiles(data, (1.5,))
+        with self.assertRaises(ValueError):
+            sm.get_percentiles(data, (0.5,), method="spaghetti")
+        with self.assertRaises(ValueError):
+            sm.get_percentiles((), (0.5,))
+        # the quartile mode matches get_quartile_data and get_median exactly
+        for data in (self.data_simple, self.data_neg_float, self.data_zeroes_pop,
+                     (1, 2), (1, 2, 3), (1, 2, 3, 4, 5), self.data_large[:1001]):
+            self.assertEqual(sm.get_percentiles(data, (0.25, 0.5, 0.75), method="quartile"),
+                             tuple(float(q) for q in sm.get_quartile_data(data)[:3]))
+            self.assertEqual(sm.get_percentiles(data, (0.5,))[0], sm.get_median(data))
+        # one multi-select pass, pre-sorted data, and one shared sort agree
+        large = self.data_large
+        qs = (0.5, 0.95, 0.999)
+        with mock.patch.object(sm, "_select_min_n", 100):
+            selected = sm.get_percentiles(large, qs)
+        self.assertEqual(selected, sm.get_percentiles(large, qs))
+        self.assertEqual(selected, sm.get_percentiles(sorted(large), qs, is_sorted=True))
+        ranks = (0, 17, 500, len(large) - 1)
+        self.assertEqual(sm._select_ranks(large, ranks),
+                         {rank: sorted(large)[rank] for rank in ranks})
+
 
 # TODO: Add readme file
 # TODO: read how to upload to PyPi
 
+    def test_27_get_score_hyp_h0_and_large_dependent(self):
+        from math import sqrt
+        from random import Random
+        data_x = (1, 2, 3, 4, 4, 5, 6, 10)
+        data_y = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+        # independent samples: h0 is the difference of means tested
+        var_pool = sm.get_var_pool(data_x, data_y)
+        expected = (sm.get_mean(data_x) - sm.get_mean(data_y) - 2) / sqrt(var_pool / 8 + var_pool / 8)
+        self.assertAlmostEqual(sm.get_score_hyp(data_x, data_y, h0=2), expected, places=12)
+        self.assertAlmostEqual(sm.get_score_hyp(data_x, data_y, h0=2), 4.86619095239293, places=12)
+        # more than 150 pairs: still the test of the differences, as a z-test
+        rng = Random(7)
+        before = [rng.gauss(50.0, 5.0) for _ in range(400)]
+        after = [x + rng.gauss(0.5, 1.0) for x in before]
+        score, score_type, test_type = sm.get_score_hyp(before, after, samples_dependent=True, verbose=True)
+        self.assertEqual((score_type, test_type), ("z", "two pop, dep"))
+        self.assertAlmostEqual(score, sm.get_score_hyp(sm.get_data_diff(before, after)), places=12)
+        self.assertAlmostEqual(score, -11.415349649860431, places=10)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+"""statmoments_test.py
+
+Unit tests for statmoments.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+
+# Local Imports
+from statbasket import StatMe as sm
+from statbasket import StatCoMoments, StatMoments
+
+
+class TestStatMomentsClass(unittest.TestCase):
+
+    @staticmethod
+    def create_large_dataset(rand_seed, size=10001, min_integer=1, max_integer=255):
+        """Generates a list with uniformly distributed integers"""
+        from random import seed, randint
+        seed(rand_seed)  # seeds random number generator, for replication
+        return_list = list()
+        for i in range(0, size):
+            return_list.append(randint(min_integer, max_integer))
+        return tuple(return_list)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_simple = (1, 2, 3, 4, 4, 5, 6, 10)
+        cls.data_large = cls.create_large_dataset(101)
+        cls.sig_deci_places = 8
+
+    def assert_matches_statme(self, moments, data, is_population=False):
+        self.assertEqual(moments.n, sm.get_n(data))
+        self.assertAlmostEqual(moments.get_mean(), sm.get_mean(data),
+                               places=self.sig_deci_places)
+        self.assertAlmostEqual(moments.get_var(is_population), sm.get_var(data, is_population),
+                               places=self.sig_deci_places)
+        self.assertAlmostEqual(moments.get_sterr(is_population), sm.get_sterr(data, is_population),
+                               places=self.sig_deci_places)
+        self.assertAlmostEqual(moments.get_skew(is_population), sm.get_skew(data, is_population),
+                               places=self.sig_deci_places)
+
+    def test_1_push(self):
+        moments = StatMoments(self.data_simple)
+        self.assert_matches_statme(moments, self.data_simple)
+        self.assert_matches_statme(moments, self.data_simple, is_population=True)
+        self.assertEqual((moments.min, moments.max), (1, 10))
+        self.assert_matches_statme(StatMoments(self.data_large), self.data_large)
+
+    def test_2_empty(self):
+        moments = StatMoments()
+        self.assertEqual(moments.get_mean(), 0)
+        with self.assertRaises(ValueError):
+            moments.remove(1)
+
+    def test_3_remove(self):
+        moments = StatMoments(self.data_large)
+        for each_item in self.data_large[:5000]:
+            moments.remove(each_item)
+        self.assert_matches_statme(moments, self.data_large[5000:])
+        emptied = StatMoments((7,))
+        emptied.remove(7)
+        self.assertEqual((emptied.n, emptied.mean, emptied.min), (0, 0.0, None))
+        bounded = StatMoments((1, 2, 3))
+        bounded.remove(3)
+        self.assertEqual((bounded.min, bounded.max), (1, None))
+
+    def test_4_merge(self):
+        left = StatMoments(self.data_large[:1234])
+        right = StatMoments(self.data_large[1234:])
+        merged = left.copy().merge(right)
+        self.assert_matches_statme(merged, self.data_large)
+        self.assertEqual(left.n, 1234)
+        self.assertEqual(merged.min, min(self.data_large))
+        self.assertEqual(StatMoments().merge(left).n, left.n)
+
+    def test_5_bytes(self):
+        import pickle
+        moments = StatMoments(self.data_large)
+        packed = moments.to_bytes()
+        self.assertEqual(len(packed), 48)
+        for restored in (StatMoments.from_bytes(packed), pickle.loads(pickle.dumps(moments))):
+            self.assertEqual((restored.n, restored.mean, restored.m2, restored.m3,
+                              restored.min, restored.max),
+                             (moments.n, moments.mean, moments.m2, moments.m3,
+                              moments.min, moments.max))
+        unbounded = StatMoments.from_bytes(StatMoments().to_bytes())
+        self.assertEqual((unbounded.n, unbounded.min, unbounded.max), (0, None, None))
+
+    def test_6_comoments(self):
+        import statistics
+        data_x = self.data_large
+        data_y = tuple(2 * x + (i % 7) for i, x in enumerate(data_x))
+        comoments = StatCoMoments(data_x, data_y)
+        self.assertEqual(comoments.n, len(data_x))
+        self.assertAlmostEqual(comoments.get_cov(), statistics.covariance(data_x, data_y), places=6)
+        self.assertAlmostEqual(comoments.get_corr(), statistics.correlation(data_x, data_y), places=10)
+        slope, intercept = statistics.linear_regression(data_x, data_y)
+        self.assertAlmostEqual(comoments.get_slope(), slope, places=10)
+        self.assertAlmostEqual(comoments.get_intercept(), intercept, places=8)
+        self.assertAlmostEqual(comoments.get_cov(is_population=True) * comoments.n,
+                               comoments.c2, places=4)
+        # residuals (0.3, 0.1, -1.1, 0.7) of y = 2.2x - 0.5
+        small = StatCoMoments((1, 2, 3, 4), (2, 4, 5, 9))
+        self.assertAlmostEqual(small.get_sterr_slope(), 0.18 ** 0.5, places=12)
+        self.assertAlmostEqual(small.get_sterr_intercept(), 1.35 ** 0.5, places=12)
+        self.assertEqual(StatCoMoments((1, 2, 3), (2, 4, 6)).get_sterr_slope(), 0.0)
+        with self.assertRaises(ValueError):
+            StatCoMoments((1, 2, 3), (1, 2))
+
+    def test_7_comoments_merge(self):
+        import pickle
+        data_x = self.data_large
+        data_y = tuple(x * x % 101 for x in data_x)
+        whole = StatCoMoments(data_x, data_y)
+        chunks = [StatCoMoments(data_x[i:i + 1000], data_y[i:i + 1000])
+                  for i in range(0, len(data_x), 1000)]
+        merged = StatCoMoments()
+        for chunk in chunks:
+            merged.merge(pickle.loads(pickle.dumps(chunk)))
+        for name in ("n", "mean_x", "mean_y", "m2_x", "m2_y", "c2"):
+            self.assertAlmostEqual(getattr(merged, name), getattr(whole, name), places=6)
+        self.assertEqual(len(whole.to_bytes()), 48)
+        self.assertEqual(StatCoMoments().merge(whole).copy().c2, whole.c2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""statmultitest_test.py
+
+Unit tests for statmultitest.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+from random import Random
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatMe as sm
+from statbasket import StatMoments, StatMultiTest
+
+
+class TestStatMultiTestClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = Random(101)
+        cls.metrics = dict()
+        for i in range(40):
+            shift = 3.0 if i % 4 == 0 else 0.0
+            size = 20 + i
+            cls.metrics[f"metric_{i}"] = (
+                tuple(rng.gauss(50.0, 5.0) for _ in range(size)),
+                tuple(rng.gauss(50.0 + shift, 5.0) for _ in range(size)))
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatMultiTest.test(self.metrics, adjust="spaghetti")
+        with self.assertRaises(ValueError):
+            StatMultiTest.test(self.metrics, tail="spaghetti")
+        with self.assertRaises(ValueError):
+            StatMultiTest.test({"a": ("spaghetti", (1, 2, 3))})
+        with self.assertRaises(ValueError):
+            StatMultiTest.test({"a": (StatMoments((1, 2, 3)), StatMoments((2, 4, 5)))},
+                               samples_dependent=True)
+        with self.assertRaises(ValueError):
+            StatMultiTest.adjust_p_values((0.1, 0.2), method="spaghetti")
+        with self.assertRaises(ValueError):
+            StatMultiTest.test({"a": [(1, 2, "spaghetti"), (1, 2, 3)]})
+
+    def test_2_adjust_p_values(self):
+        self.assertEqual(StatMultiTest.adjust_p_values((0.01, 0.04, 0.03), method="holm"),
+                         [0.03, 0.06, 0.06])
+        bh = StatMultiTest.adjust_p_values((0.01, 0.04, 0.03, 0.5))
+        for value, expected in zip(bh, (0.04, 0.04 * 4 / 3, 0.04 * 4 / 3, 0.5)):
+            self.assertAlmostEqual(value, expected, places=12)
+        self.assertEqual(StatMultiTest.adjust_p_values((0.9, 0.8), method="holm"), [1.0, 1.0])
+        adjusted = StatMultiTest.adjust_p_values((0.01, float("nan"), 0.02))
+        self.assertNotEqual(adjusted[1], adjusted[1])
+        self.assertEqual(adjusted[0], 0.02)
+        self.assertEqual(StatMultiTest.adjust_p_values((0.2, 0.1), method="none"), [0.2, 0.1])
+
+    def test_3_scores(self):
+        rows = StatMultiTest.test(self.metrics)
+        self.assertEqual([row["name"] for row in rows], list(self.metrics))
+        for row in rows:
+            first, second = self.metrics[row["name"]]
+            self.assertAlmostEqual(row["score"], sm.get_score_hyp(first, second), places=10)
+            self.assertLessEqual(row["p"], row["p_adjusted"])
+        self.assertAlmostEqual(rows[0]["p"], sm.get_p_t(rows[0]["score"], 38), places=12)
+        dependent = StatMultiTest.test(self.metrics, samples_dependent=True, adjust="holm")
+        first, second = self.metrics["metric_5"]
+        self.assertAlmostEqual(dependent[5]["score"],
+                               SB(first, second, samples_dependent=True).calculate_test_score(),
+                               places=10)
+        # from the summary of the differences alone
+        summary_diff = SB(first, second, samples_dependent=True,
+                          retain_data=False).summary_diff
+        from_summary = StatMultiTest.test({"metric_5": summary_diff}, samples_dependent=True)
+        self.assertAlmostEqual(from_summary[0]["score"], dependent[5]["score"], places=10)
+        # summaries and moments give the same scores as data
+        summarized = StatMultiTest.test({name: (StatMoments(first),
+                                                SB(second, retain_data=False).summary)
+                                         for name, (first, second) in self.metrics.items()})
+        self.assertAlmostEqual(summarized[7]["score"], rows[7]["score"], places=10)
+        constant = StatMultiTest.test({"constant": ((1, 1, 1), (1, 1, 1)), "other": ((1, 2, 3), (4, 5, 6))})
+        self.assertNotEqual(constant[0]["p"], constant[0]["p"])
+        self.assertFalse(constant[0]["reject"])
+        self.assertEqual(constant[1]["p"], constant[1]["p_adjusted"])
+
+    def test_4_processes(self):
+        serial = StatMultiTest.test(self.metrics)
+        pooled = StatMultiTest.test(list(self.metrics.items()), processes=2, chunk_size=7)
+        self.assertEqual(serial, pooled)
+        self.assertTrue(any(row["reject"] for row in serial))
+
+
+    def test_5_list_pairs(self):
+        first, second = self.metrics["metric_4"]
+        # a list pair is two samples, as a tuple pair
+        as_list = StatMultiTest.test({"a": [list(first), list(second)]})
+        self.assertEqual(as_list[0]["score"], StatMultiTest.test({"a": (first, second)})[0]["score"])
+
+    def test_6_h0_and_large_dependent(self):
+        first, second = self.metrics["metric_4"]
+        # h0 is the difference of means tested for two samples
+        shifted = tuple(x + 2.0 for x in first)
+        for dependent in (False, True):
+            with_h0 = StatMultiTest.test({"a": (shifted, second)}, samples_dependent=dependent, h0=2.0)
+            without = StatMultiTest.test({"a": (first, second)}, samples_dependent=dependent)
+            self.assertAlmostEqual(with_h0[0]["score"], without[0]["score"], places=10)
+        # more than 150 pairs is still a paired (z) test of the differences
+        rng = Random(7)
+        before = tuple(rng.gauss(50.0, 5.0) for _ in range(400))
+        after = tuple(x + rng.gauss(0.5, 1.0) for x in before)
+        row = StatMultiTest.test({"a": (before, after)}, samples_dependent=True)[0]
+        self.assertEqual((row["test_type"], row["score_type"]), ("two pop, dep", "z"))
+        self.assertAlmostEqual(row["score"], SB(before, after, samples_dependent=True)
+                               .calculate_test_score(), places=10)
+
+if __name__ == "__main__":
+    unittest.main()
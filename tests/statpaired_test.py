@@ -0,0 +1,75 @@
+"""statpaired_test.py
+
+Unit tests for statpaired.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+from random import Random
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatPaired
+
+
+class TestStatPairedClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = Random(101)
+        cls.data_x = tuple(rng.gauss(100.0, 15.0) for _ in range(3000))
+        cls.data_y = tuple(x + rng.gauss(1.0, 3.0) for x in cls.data_x)
+        cls.data_x_int = tuple(rng.randint(1, 9) for _ in range(500))
+        cls.data_y_int = tuple(rng.randint(1, 9) for _ in range(500))
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatPaired((1, 2, 3), (1, 2))
+        with self.assertRaises(ValueError):
+            StatPaired((1, 2, 3), (1, "spaghetti", 3))
+        with self.assertRaises(ValueError):
+            StatPaired("spaghetti", (1, 2, 3))
+        with self.assertRaises(ValueError):
+            StatPaired((1,), (2,))
+        with self.assertRaises(ValueError):
+            StatPaired((1, 2, 3), (3, 2, 2), keep_diff="spaghetti")
+        with self.assertRaises(ValueError):
+            StatPaired((1, 2, 3), (3, 2, 2), cl=0.5)
+
+    def test_2_against_basket(self):
+        for data_x, data_y in ((self.data_x, self.data_y),
+                               (self.data_x_int, self.data_y_int)):
+            for options in ({}, {"is_population": True, "tail": "left", "cl": 0.99}):
+                paired = StatPaired(data_x, data_y, **options)
+                basket = SB(data_x, data_y, samples_dependent=True, **options)
+                paired_basket = paired.get_basket()
+                self.assertEqual(paired_basket.describe(), basket.describe())
+                for stat in ("n_diff", "min_diff", "max_diff", "median_diff",
+                             "quartiles_diff", "mode_diff", "mean_diff", "n_x", "max_y"):
+                    self.assertEqual(getattr(paired_basket, stat), getattr(basket, stat))
+                for stat in ("var_diff", "skew_diff", "moe_diff", "mean_x", "var_x", "stdev_y"):
+                    self.assertAlmostEqual(getattr(paired_basket, stat), getattr(basket, stat),
+                                           places=8)
+                self.assertAlmostEqual(paired.calculate_test_score(h0=1),
+                                       basket.calculate_test_score(h0=1), places=8)
+                self.assertIsNone(paired_basket.median_x)
+
+    def test_4_comoments(self):
+        from statbasket import StatCoMoments
+        comoments = StatPaired(self.data_x, self.data_y).get_comoments()
+        expected = StatCoMoments(self.data_x, self.data_y)
+        self.assertEqual(comoments.n, expected.n)
+        for name in ("get_cov", "get_corr", "get_slope", "get_intercept", "get_sterr_slope"):
+            self.assertAlmostEqual(getattr(comoments, name)(), getattr(expected, name)(), places=8)
+
+    def test_3_keep_diff(self):
+        self.assertIsNone(StatPaired(self.data_x, self.data_y).data_diff)
+        paired = StatPaired(self.data_x, self.data_y, keep_diff=True)
+        self.assertEqual(paired.data_diff,
+                         SB(self.data_x, self.data_y, samples_dependent=True).data_diff)
+
+
+if __name__ == "__main__":
+    unittest.main()
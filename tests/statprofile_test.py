@@ -0,0 +1,71 @@
+"""statprofile_test.py
+
+Unit tests for statprofile.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatMe as sm
+from statbasket import StatProfiler
+
+
+class TestStatProfilerClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_simple = (1, 2, 3, 4, 4, 5, 6, 10)
+        cls.data_neg_float = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatProfiler(callback="spaghetti")
+        with self.assertRaises(ValueError):
+            SB(self.data_simple, profiler="spaghetti")
+
+    def test_2_statme_methods(self):
+        profiler = StatProfiler()
+        self.assertEqual(profiler.stat_me.get_median(self.data_simple),
+                         sm.get_median(self.data_simple))
+        profiler.stat_me.get_median(self.data_simple)
+        profiler.stat_me.get_var(self.data_simple)
+        report = profiler.report()
+        self.assertEqual(report["get_median"]["calls"], 2)
+        self.assertEqual(report["get_median"]["passes"], 2)
+        self.assertEqual(report["get_median"]["sorts"], 2)
+        # get_var makes its own pass plus the pass of get_mean
+        self.assertEqual(report["get_var"]["passes"], 2)
+        self.assertEqual(report["get_var"]["sorts"], 0)
+        self.assertGreaterEqual(report["get_var"]["time"], 0)
+        profiler.stat_me.get_percentiles(self.data_simple, (0.5, 0.9))
+        profiler.stat_me.get_p_t(2.0, 10)
+        report = profiler.report()
+        self.assertEqual((report["get_percentiles"]["passes"], report["get_percentiles"]["sorts"]), (1, 1))
+        self.assertEqual((report["get_p_t"]["passes"], report["get_p_t"]["sorts"]), (0, 0))
+        profiler.reset()
+        self.assertEqual(profiler.report(), {})
+
+    def test_3_basket(self):
+        records = list()
+        profiler = StatProfiler(callback=records.append)
+        basket = SB(self.data_simple, self.data_neg_float, profiler=profiler)
+        report = profiler.report()
+        for stat in ("mean", "median", "mode", "quartiles", "ci", "var", "skew"):
+            for suffix in ("_x", "_y"):
+                self.assertIn(stat + suffix, report)
+        self.assertIn("var_pool", report)
+        self.assertEqual(report["mode_x"]["passes"], 1)
+        self.assertEqual(report["quartiles_x"]["sorts"], 1)
+        self.assertEqual(len(records), sum(totals["calls"] for totals in report.values()))
+        self.assertEqual(set(records[0]), {"stat", "time", "passes", "sorts"})
+        # profiling does not change the results
+        unprofiled = SB(self.data_simple, self.data_neg_float)
+        self.assertEqual(basket.describe(), unprofiled.describe())
+
+
+if __name__ == "__main__":
+    unittest.main()
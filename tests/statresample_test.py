@@ -0,0 +1,118 @@
+"""statresample_test.py
+
+Unit tests for statresample.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+
+# Local Imports
+from statbasket import StatMe as sm
+from statbasket import StatResample as sr
+
+
+class TestStatResampleClass(unittest.TestCase):
+
+    @staticmethod
+    def create_large_dataset(rand_seed, size=1001, min_integer=1, max_integer=255):
+        """Generates a list with uniformly distributed integers"""
+        from random import seed, randint
+        seed(rand_seed)  # seeds random number generator, for replication
+        return_list = list()
+        for i in range(0, size):
+            return_list.append(randint(min_integer, max_integer))
+        return tuple(return_list)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_simple = (1, 2, 3, 4, 4, 5, 6, 10)
+        cls.data_large = cls.create_large_dataset(101)
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            sr.get_ci_bootstrap(())
+        with self.assertRaises(ValueError):
+            sr.get_ci_bootstrap(self.data_simple, statistic="get_spaghetti")
+        with self.assertRaises(ValueError):
+            sr.get_ci_bootstrap(self.data_simple, n_resamples=0)
+        with self.assertRaises(ValueError):
+            sr.get_ci_bootstrap(4)
+
+    def test_2_reproducible(self):
+        ci_1 = sr.get_ci_bootstrap(self.data_large, seed=7, n_resamples=500)
+        ci_2 = sr.get_ci_bootstrap(self.data_large, seed=7, n_resamples=500)
+        self.assertEqual(ci_1, ci_2)
+        self.assertNotEqual(ci_1, sr.get_ci_bootstrap(self.data_large, seed=8, n_resamples=500))
+
+    def test_3_independent_of_workers(self):
+        serial = sr.get_bootstrap_estimates(
+            self.data_large, statistic="get_median", seed=3, n_resamples=120, chunk_size=25)
+        pooled = sr.get_bootstrap_estimates(
+            self.data_large, statistic="get_median", seed=3, n_resamples=120, chunk_size=25,
+            processes=2)
+        self.assertEqual(serial, pooled)
+        self.assertEqual(len(serial), 120)
+
+    def test_4_interval_contains_estimate(self):
+        mean = sm.get_mean(self.data_large)
+        lower, upper = sr.get_ci_bootstrap(self.data_large, seed=1, n_resamples=1000)
+        self.assertLess(lower, mean)
+        self.assertGreater(upper, mean)
+        # the bootstrap interval of the mean is close to the t interval
+        t_lower, t_upper = sm.get_ci(self.data_large)
+        self.assertAlmostEqual(lower, t_lower, delta=1.0)
+        self.assertAlmostEqual(upper, t_upper, delta=1.0)
+
+    def test_5_statme_statistics(self):
+        lower, upper = sr.get_ci_bootstrap(
+            self.data_large, statistic="get_stdev", seed=1, n_resamples=200)
+        self.assertLess(lower, sm.get_stdev(self.data_large))
+        self.assertGreater(upper, sm.get_stdev(self.data_large))
+
+
+    def test_6_permutation_data_validations(self):
+        with self.assertRaises(ValueError):
+            sr.get_p_permutation(self.data_simple, ())
+        with self.assertRaises(ValueError):
+            sr.get_p_permutation(self.data_simple, self.data_simple, tail="spaghetti")
+        with self.assertRaises(ValueError):
+            sr.get_p_permutation((1, 2, 3), (4, 5, 6, 7), samples_dependent=True)
+
+    def test_7_permutation_independent(self):
+        shifted = tuple(x + 40 for x in self.data_large[:300])
+        p_value, observed, run = sr.get_p_permutation(
+            self.data_large[300:600], shifted, seed=5, verbose=True)
+        self.assertLess(p_value, 0.05)
+        self.assertAlmostEqual(observed, sm.get_mean(self.data_large[300:600]) - sm.get_mean(shifted),
+                               places=8)
+        # resolved long before the maximum number of permutations
+        self.assertLess(run, 10000)
+        # no difference under h0 = the true difference
+        p_h0 = sr.get_p_permutation(self.data_large[:300], shifted, h0=-40, seed=5)
+        self.assertGreater(p_h0, 0.05)
+
+    def test_8_permutation_dependent(self):
+        before = self.data_large[:200]
+        after = tuple(x - 1 for x in before)
+        p_value = sr.get_p_permutation(before, after, samples_dependent=True, seed=5,
+                                       tail="right")
+        self.assertLess(p_value, 0.05)
+        p_value = sr.get_p_permutation(before, after, samples_dependent=True, seed=5,
+                                       tail="left")
+        self.assertGreater(p_value, 0.05)
+
+    def test_9_permutation_independent_of_workers(self):
+        args = (self.data_large[:250], self.data_large[250:450])
+        serial = sr.get_p_permutation(*args, seed=11, chunk_size=100, verbose=True)
+        pooled = sr.get_p_permutation(*args, seed=11, chunk_size=100, verbose=True,
+                                      processes=2)
+        self.assertEqual(serial, pooled)
+        full = sr.get_p_permutation(*args, seed=11, n_permutations=300, chunk_size=100,
+                                    stop_early=False, verbose=True)
+        self.assertEqual(full[2], 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""statserver_test.py
+
+Unit tests for statserver.py, against servers on localhost
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+# Local Imports
+from statbasket import AsyncStatClient, StatClient, StatServer
+from statbasket import StatBasket as SB
+
+
+class TestStatServerClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_simple = (1.0, 2.0, 3.0, 4.0, 4.0, 5.0, 6.0, 10.0)
+        # a server on its own event loop thread, for the blocking client
+        cls.loop = asyncio.new_event_loop()
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.server = StatServer(cl=0.99)
+        cls.tcp_address = cls.run_in_loop(cls.server.start_tcp())
+        cls.unix_address = cls.run_in_loop(cls.server.start_unix(
+            os.path.join(cls.directory.name, "stat.sock")))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.run_in_loop(cls.server.close())
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.loop.close()
+        cls.directory.cleanup()
+
+    @classmethod
+    def run_in_loop(cls, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, cls.loop).result()
+
+    def test_1_errors(self):
+        with StatClient(self.tcp_address) as client:
+            with self.assertRaises(ValueError):
+                client.query("missing", "mean")
+            client.push("errors", self.data_simple)
+            with self.assertRaises(ValueError):
+                client.query("errors", "spaghetti")
+            # the connection is still usable after an error
+            self.assertEqual(client.query("errors", "n"), 8)
+            self.assertTrue(client.drop("errors"))
+            self.assertFalse(client.drop("errors"))
+
+    def test_2_blocking_client(self):
+        expected = SB(self.data_simple, cl=0.99)
+        for address in (self.tcp_address, self.unix_address):
+            with StatClient(address) as client:
+                client.drop("blocking")
+                self.assertEqual(client.push("blocking", self.data_simple[:3]), 3)
+                self.assertEqual(client.push("blocking", self.data_simple[3:]), 8)
+                self.assertAlmostEqual(client.query("blocking", "mean"), expected.mean, places=10)
+                self.assertAlmostEqual(client.query("blocking", "var"), expected.var, places=10)
+                self.assertEqual(client.query("blocking", "quartiles"), expected.quartiles)
+                self.assertEqual(client.query("blocking", "ci"), expected.ci)
+                self.assertEqual(client.describe("blocking", h0=2), expected.describe(h0=2))
+                self.assertIn("blocking", client.names())
+
+    def test_3_async_client(self):
+        async def use_server():
+            server = StatServer()
+            address = await server.start_tcp()
+            clients = [await AsyncStatClient.connect(address) for _ in range(3)]
+            # three processes sharing one accumulator
+            await asyncio.gather(*(client.push("shared", self.data_simple)
+                                   for client in clients))
+            n = await clients[0].query("shared", "n")
+            description = await clients[1].describe("shared", format="dict")
+            for client in clients:
+                await client.close()
+            await server.close()
+            return n, description
+
+        n, description = asyncio.run(use_server())
+        self.assertEqual(n, 24)
+        self.assertEqual(description["DATA"]["median"], SB(self.data_simple * 3).median)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""statsharded_test.py
+
+Unit tests for statsharded.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import threading
+import unittest
+from random import Random
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatSharded
+
+
+class TestStatShardedClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = Random(101)
+        cls.data_large = tuple(float(rng.randint(1, 255)) for _ in range(8000))
+
+    def push_from_threads(self, sharded, n_threads=8):
+        """Push data_large from n_threads threads, half by push, half by extend."""
+        slices = [self.data_large[i::n_threads] for i in range(n_threads)]
+
+        def produce(values):
+            half = len(values) // 2
+            for each_item in values[:half]:
+                sharded.push(each_item)
+            sharded.extend(values[half:])
+
+        threads = [threading.Thread(target=produce, args=(values,)) for values in slices]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatSharded(keep_values="spaghetti")
+        sharded = StatSharded()
+        with self.assertRaises(ValueError):
+            sharded.push("spaghetti")
+        with self.assertRaises(ValueError):
+            sharded.extend((1, "spaghetti"))
+        # the bad values of a generator are still reported
+        with self.assertRaisesRegex(ValueError, r"\(1, 'spaghetti'\), \(3, None\)"):
+            sharded.extend(x for x in (1, "spaghetti", 2, None))
+        self.assertEqual(len(sharded), 0)
+        with self.assertRaises(ValueError):
+            StatSharded(keep_values=False).get_basket()
+
+    def test_2_threads(self):
+        sharded = StatSharded(tail="left")
+        self.push_from_threads(sharded)
+        expected = SB(self.data_large, tail="left")
+        basket = sharded.get_basket()
+        self.assertEqual(len(sharded), len(self.data_large))
+        self.assertEqual((basket.n, basket.median, basket.quartiles, basket.mode, basket.min),
+                         (expected.n, expected.median, expected.quartiles, expected.mode, expected.min))
+        for name in ("mean", "var", "skew", "moe"):
+            self.assertAlmostEqual(getattr(basket, name), getattr(expected, name), places=8)
+        moments = sharded.get_moments()
+        self.assertAlmostEqual(moments.get_var(), expected.var, places=8)
+
+    def test_3_moments_only(self):
+        sharded = StatSharded(keep_values=False)
+        self.push_from_threads(sharded, n_threads=4)
+        moments = sharded.get_moments()
+        self.assertEqual(moments.n, len(self.data_large))
+        self.assertAlmostEqual(moments.get_mean(), SB(self.data_large).mean, places=8)
+
+
+if __name__ == "__main__":
+    unittest.main()
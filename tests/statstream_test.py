@@ -0,0 +1,74 @@
+"""statstream_test.py
+
+Unit tests for statstream.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+
+# Local Imports
+from statbasket import AsyncStatStream
+from statbasket import StatBasket as SB
+from statbasket import StatStream
+
+
+class TestStatStreamClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = Random(101)
+        cls.data_large = tuple(float(rng.randint(1, 255)) for _ in range(5000))
+
+    @staticmethod
+    async def receive(values):
+        """Async source of values, as from a socket."""
+        for each_item in values:
+            yield each_item
+
+    def test_1_data_validations(self):
+        stream = StatStream((1, 2))
+        with self.assertRaises(ValueError):
+            stream.extend((3, "spaghetti"))
+        self.assertEqual(len(stream), 2)
+        # the bad values of a generator are still reported
+        with self.assertRaisesRegex(ValueError, "spaghetti"):
+            stream.extend(x for x in (3, "spaghetti"))
+        self.assertEqual(len(stream), 2)
+        stream.extend(x for x in (3, 4))
+        self.assertEqual(len(stream), 4)
+        with self.assertRaises(ValueError):
+            AsyncStatStream(batch_size=0)
+
+    def test_2_stream(self):
+        stream = StatStream(self.data_large[:10], tail="left")
+        stream.extend(self.data_large[10:-1])
+        stream.push(self.data_large[-1])
+        expected = SB(self.data_large, tail="left")
+        self.assertEqual(stream.get_basket().describe(), expected.describe())
+        self.assertAlmostEqual(stream.get_moments().get_var(), expected.var, places=8)
+
+    def test_3_async_stream(self):
+        async def collect():
+            stream = AsyncStatStream(batch_size=64, cl=0.99)
+            added = await stream.aextend(self.receive(self.data_large[:3000]))
+            first = await stream.snapshot()
+            stream.extend(self.data_large[3000:])
+            with ProcessPoolExecutor(1) as executor:
+                stream.executor = executor
+                second = await stream.snapshot()
+            return added, first, second, stream.get_moments()
+
+        added, first, second, moments = asyncio.run(collect())
+        self.assertEqual(added, 3000)
+        self.assertEqual(first.describe(), SB(self.data_large[:3000], cl=0.99).describe())
+        self.assertEqual(second.describe(), SB(self.data_large, cl=0.99).describe())
+        self.assertEqual(moments.n, len(self.data_large))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""statsummary_test.py
+
+Unit tests for statsummary.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatMoments
+from statbasket import StatSummary
+
+
+class TestStatSummaryClass(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_simple = (1, 2, 3, 4, 4, 5, 6, 10)
+        cls.data_neg_float = (-10.0, -6.0, -5.0, -4.0, -4.0, -3.0, -2.0, -1.0)
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatSummary(spaghetti=1)
+        with self.assertRaises(AttributeError):
+            StatSummary().spaghetti = 1
+
+    def test_2_from_basket(self):
+        basket = SB(self.data_simple, self.data_neg_float)
+        summary = StatSummary.from_basket(basket, "_y")
+        self.assertEqual(summary.as_dict(),
+                         {name: getattr(basket, name + "_y") for name in StatSummary.fields})
+        self.assertEqual(summary, StatSummary.from_basket(basket, "_y"))
+        self.assertNotEqual(summary, StatSummary.from_basket(basket, "_x"))
+
+    def test_3_moments(self):
+        for is_population in (False, True):
+            summary = StatSummary.from_basket(SB(self.data_simple, is_population=is_population))
+            moments = StatMoments(self.data_simple)
+            from_summary = summary.get_moments()
+            self.assertEqual(from_summary.n, moments.n)
+            self.assertAlmostEqual(from_summary.mean, moments.mean, places=10)
+            self.assertAlmostEqual(from_summary.m2, moments.m2, places=10)
+            self.assertAlmostEqual(from_summary.m3, moments.m3, places=10)
+            self.assertEqual((from_summary.min, from_summary.max), (moments.min, moments.max))
+
+    def test_4_bytes(self):
+        import pickle
+        for basket in (SB(self.data_simple), SB(self.data_neg_float, is_population=True),
+                       SB((2, 4, 6, 8))):
+            summary = StatSummary.from_basket(basket)
+            packed = summary.to_bytes()
+            self.assertEqual(len(packed), 180)
+            self.assertEqual(StatSummary.from_bytes(packed), summary)
+            self.assertEqual(pickle.loads(pickle.dumps(summary)), summary)
+        self.assertEqual(StatSummary.from_bytes(StatSummary.from_basket(SB((2, 4, 6, 8))).to_bytes()).mode,
+                         "multimodal")
+        partial = StatSummary(n=5, mean=25.4)
+        with self.assertRaises(ValueError):
+            partial.to_bytes()
+        self.assertEqual(pickle.loads(pickle.dumps(partial)), partial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""statwindow_test.py
+
+Unit tests for statwindow.py
+
+for list of TestCase assert methods visit:
+https://docs.python.org/3/library/unittest.html#unittest.TestCase.debug"""
+
+# Standard Library Imports
+import unittest
+
+# Local Imports
+from statbasket import StatBasket as SB
+from statbasket import StatEWM, StatWindow
+
+
+class TestStatWindowClass(unittest.TestCase):
+
+    @staticmethod
+    def create_large_dataset(rand_seed, size=2001, min_integer=1, max_integer=255):
+        """Generates a list with uniformly distributed integers"""
+        from random import seed, randint
+        seed(rand_seed)  # seeds random number generator, for replication
+        return_list = list()
+        for i in range(0, size):
+            return_list.append(randint(min_integer, max_integer))
+        return tuple(return_list)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_large = cls.create_large_dataset(101)
+        cls.sig_deci_places = 8
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatWindow(0)
+        with self.assertRaises(ValueError):
+            StatWindow(3, is_population=1)
+        with self.assertRaises(ValueError):
+            StatWindow(3).push("spaghetti")
+
+    def test_2_window_contents(self):
+        window = StatWindow(3, (1, 2, 3, 4))
+        self.assertEqual(window.data, (2, 3, 4))
+        self.assertEqual(window.n, 3)
+        self.assertEqual((window.min, window.max), (2, 4))
+        self.assertEqual(window.mean, 3.0)
+
+    def test_3_matches_basket(self):
+        window = StatWindow(97)
+        for i, each_item in enumerate(self.data_large):
+            window.push(each_item)
+            if i % 250 == 0 and i > 3:
+                basket = SB(window.data)
+                self.assertAlmostEqual(window.mean, basket.mean, places=self.sig_deci_places)
+                self.assertAlmostEqual(window.var, basket.var, places=self.sig_deci_places)
+                self.assertAlmostEqual(window.stdev, basket.stdev, places=self.sig_deci_places)
+                self.assertAlmostEqual(window.skew, basket.skew, places=self.sig_deci_places)
+                self.assertEqual(window.median, basket.median)
+                self.assertEqual(window.quartiles, basket.quartiles)
+                self.assertEqual(window.mode, basket.mode)
+                self.assertEqual(window.range, basket.range)
+
+    def test_4_population(self):
+        data = (1, 2, 3, 4, 4, 5, 6, 10, 0, 0, 0, 0, 0)
+        window = StatWindow(len(data), data, is_population=True)
+        basket = SB(data, is_population=True)
+        self.assertAlmostEqual(window.var, basket.var, places=self.sig_deci_places)
+        self.assertAlmostEqual(window.sterr, basket.sterr, places=self.sig_deci_places)
+
+    def test_5_percentiles(self):
+        window = StatWindow(101, self.data_large)
+        qs = (0.0, 0.5, 0.9, 0.99, 1.0)
+        self.assertEqual(window.get_percentiles(qs), SB(window.data).get_percentiles(qs))
+        self.assertEqual(window.get_percentiles((0.25, 0.5, 0.75), method="quartile"),
+                         window.quartiles[:3])
+
+
+class TestStatEWMClass(unittest.TestCase):
+
+    def test_1_data_validations(self):
+        with self.assertRaises(ValueError):
+            StatEWM(0)
+        with self.assertRaises(ValueError):
+            StatEWM(5).push(None)
+        with self.assertRaises(ValueError):
+            StatEWM(5, (1, 2, 3))
+        ewm = StatEWM(5)
+        ewm.extend((1, 2, 3))
+        with self.assertRaises(ValueError):
+            ewm.get_ci(cl=0.98)
+        # n_eff < 2: after one value, or always with a short half-life
+        single = StatEWM(5)
+        single.push(1)
+        with self.assertRaises(ValueError):
+            single.get_moe()
+        short = StatEWM(0.5)
+        short.extend((1, 2, 3, 4, 5))
+        with self.assertRaises(ValueError):
+            short.get_ci()
+
+    def test_2_no_decay_matches_basket(self):
+        # with an enormous half-life every weight stays ~1
+        data = (1, 2, 3, 4, 4, 5, 6, 10)
+        basket = SB(data)
+        ewm = StatEWM(1e15)
+        ewm.extend(data)
+        self.assertAlmostEqual(ewm.n_eff, 8, places=6)
+        self.assertAlmostEqual(ewm.mean, basket.mean, places=6)
+        self.assertAlmostEqual(ewm.var, basket.var, places=6)
+        self.assertAlmostEqual(ewm.sterr, basket.sterr, places=6)
+        self.assertAlmostEqual(ewm.get_ci()[0], basket.ci[0], places=6)
+        self.assertAlmostEqual(ewm.get_ci()[1], basket.ci[1], places=6)
+
+    def test_3_decay(self):
+        ewm = StatEWM(1)
+        ewm.extend((0, 0, 0, 1))
+        # weights 1/8, 1/4, 1/2, 1 -> mean = 1 / (15/8)
+        self.assertAlmostEqual(ewm.mean, 8 / 15, places=12)
+        self.assertEqual(ewm.n, 4)
+
+    def test_4_timestamps(self):
+        ewm = StatEWM(10)
+        ewm.push(0, t=0)
+        ewm.push(1, t=10)
+        # the first value has decayed to weight 1/2
+        self.assertAlmostEqual(ewm.mean, 2 / 3, places=12)
+        with self.assertRaises(ValueError):
+            ewm.push(1, t=5)
+
+
+if __name__ == "__main__":
+    unittest.main()